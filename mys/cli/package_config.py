@@ -1,3 +1,4 @@
+import glob
 import os
 import re
 
@@ -16,10 +17,22 @@ RE_SEMANTIC_VERSION = re.compile(
     r"(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$")
 
 
+RE_IMPORT_PROCESS = re.compile(r'^(from|import)\s+process\b', re.MULTILINE)
+
+
 def is_semantic_version(version):
     return RE_SEMANTIC_VERSION.match(version) is not None
 
 
+def is_process_imported(path):
+    for filename in glob.glob(os.path.join(path, 'src/**/*.mys'), recursive=True):
+        with open(filename) as fin:
+            if RE_IMPORT_PROCESS.search(fin.read()):
+                return True
+
+    return False
+
+
 class Author:
 
     def __init__(self, name, email):
@@ -74,6 +87,12 @@ class PackageConfig:
             'fiber': {'path': os.path.join(MYS_DIR, 'lib/packages/fiber')}
         }
 
+        # The process package is only built by packages using it.
+        if package['name'] != 'process' and is_process_imported(path):
+            dependencies['process'] = {
+                'path': os.path.join(MYS_DIR, 'lib/packages/process')
+            }
+
         if 'dependencies' in config:
             dependencies.update(config['dependencies'])
 
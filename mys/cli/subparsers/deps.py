@@ -12,7 +12,7 @@ def find_dependencies(dependencies_configs):
     for dependency_config in dependencies_configs:
         name = dependency_config.name
 
-        if name == 'fiber':
+        if name in ['fiber', 'process']:
             continue
 
         version = dependency_config.from_version
@@ -2,9 +2,10 @@ import os
 
 from ...transpiler import Source
 from ...transpiler import transpile
+from ...transpiler.incremental import Cache
 from ..utils import add_coverage_argument
 from ..utils import add_unsafe_argument
-from ..utils import create_file
+from ..utils import update_file
 
 
 def do_transpile(_parser, args, _mys_config):
@@ -32,14 +33,26 @@ def do_transpile(_parser, args, _mys_config):
                                   cpp_path,
                                   args.main[i] == 'yes'))
 
-    generated = transpile(sources, args.coverage)
+    if args.incremental:
+        cache = Cache(os.path.join(args.outdir, 'transpile-cache.json'))
+    else:
+        cache = None
 
-    for source, (hpp_1_code, hpp_2_code, cpp_code) in zip(sources, generated):
+    generated = transpile(sources, args.coverage, cache)
+
+    for source, code in zip(sources, generated):
+        if code is None:
+            continue
+
+        hpp_1_code, hpp_2_code, cpp_code = code
         os.makedirs(os.path.dirname(source.hpp_path), exist_ok=True)
         os.makedirs(os.path.dirname(source.cpp_path), exist_ok=True)
-        create_file(source.hpp_path[:-3] + 'early.hpp', hpp_1_code)
-        create_file(source.hpp_path, hpp_2_code)
-        create_file(source.cpp_path, cpp_code)
+        update_file(source.hpp_path[:-3] + 'early.hpp', hpp_1_code)
+        update_file(source.hpp_path, hpp_2_code)
+        update_file(source.cpp_path, cpp_code)
+
+    if cache is not None:
+        cache.save()
 
 
 def add_subparser(subparsers):
@@ -69,6 +82,11 @@ def add_subparser(subparsers):
                            action='append',
                            choices=['yes', 'no'],
                            help='Contains main().')
+    subparser.add_argument(
+        '-i', '--incremental',
+        action='store_true',
+        help=('Only transpile modules that may have changed since last time, '
+              'as recorded in a cache in the output directory.'))
     add_coverage_argument(subparser)
     add_unsafe_argument(subparser)
     subparser.add_argument('mysfiles', nargs='+')
@@ -87,6 +87,23 @@ def create_file(path, data):
         fout.write(data)
 
 
+def update_file(path, data):
+    """Same as create_file(), but leaves the file untouched if it
+    already has given contents. Keeps its modification time so make
+    does not rebuild anything that depends on it.
+
+    """
+
+    try:
+        with open(path, 'r') as fin:
+            if fin.read() == data:
+                return
+    except OSError:
+        pass
+
+    create_file(path, data)
+
+
 def read_template_file(path):
     with open(os.path.join(MYS_DIR, 'cli/templates', path)) as fin:
         return fin.read()
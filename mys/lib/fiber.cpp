@@ -1,7 +1,99 @@
 #include "mys.hpp"
 
+// Fibers are by default run on their own stacks in user space, and
+// switching between them is a plain context switch. Define
+// MYS_FIBER_THREADS to instead run each fiber in its own OS thread,
+// which is the only option on systems without ucontext.
+#if !defined(MYS_FIBER_THREADS) && !defined(__linux__)
+#    define MYS_FIBER_THREADS
+#endif
+
+#if !defined(MYS_FIBER_THREADS)
+#    include <ucontext.h>
+#    include <sys/mman.h>
+#    include <unistd.h>
+#endif
+
 namespace mys {
 
+#if !defined(MYS_FIBER_THREADS)
+
+#if !defined(MYS_FIBER_STACK_SIZE)
+#    define MYS_FIBER_STACK_SIZE (1024 * 1024)
+#endif
+
+#if !defined(MYS_FIBER_STACK_POOL_SIZE)
+#    define MYS_FIBER_STACK_POOL_SIZE 64
+#endif
+
+// A fiber stack with a guard page at its lowest address, so that a
+// stack overflow crashes instead of silently corrupting memory. Pages
+// are only backed by memory once used.
+struct FiberStack {
+    char *buf_p;
+    size_t size;
+    FiberStack *next_p;
+};
+
+// Stacks of stopped fibers are reused by new fibers.
+struct FiberStackPool {
+    FiberStack *head_p;
+    int length;
+
+    FiberStack *alloc()
+    {
+        FiberStack *stack_p = head_p;
+
+        if (stack_p != NULL) {
+            head_p = stack_p->next_p;
+            length--;
+
+            return stack_p;
+        }
+
+        size_t page_size = sysconf(_SC_PAGESIZE);
+        size_t size = MYS_FIBER_STACK_SIZE + page_size;
+        void *buf_p = mmap(NULL,
+                           size,
+                           PROT_READ | PROT_WRITE,
+                           MAP_PRIVATE | MAP_ANONYMOUS,
+                           -1,
+                           0);
+
+        if (buf_p == MAP_FAILED) {
+            std::cout << "error: failed to allocate fiber stack" << std::endl;
+            exit(1);
+        }
+
+        if (mprotect(buf_p, page_size, PROT_NONE) != 0) {
+            std::cout << "error: failed to protect fiber stack" << std::endl;
+            exit(1);
+        }
+
+        stack_p = new FiberStack;
+        stack_p->buf_p = (char *)buf_p;
+        stack_p->size = size;
+
+        return stack_p;
+    }
+
+    void free(FiberStack *stack_p)
+    {
+        if (length < MYS_FIBER_STACK_POOL_SIZE) {
+            stack_p->next_p = head_p;
+            head_p = stack_p;
+            length++;
+        } else {
+            munmap(stack_p->buf_p, stack_p->size);
+            delete stack_p;
+        }
+    }
+};
+
+static FiberStackPool stack_pool;
+
+#endif
+
 struct SchedulerFiber {
     enum State {
         CURRENT = 0,
@@ -12,8 +104,13 @@ struct SchedulerFiber {
     };
 
     mys::shared_ptr<Fiber> m_fiber;
+#if defined(MYS_FIBER_THREADS)
     uv_thread_t thread;
     uv_cond_t cond;
+#else
+    ucontext_t context;
+    FiberStack *stack_p;
+#endif
     SchedulerFiber *next_p;
     SchedulerFiber *waiter_p;
     int prio;
@@ -27,7 +124,11 @@ struct SchedulerFiber {
     SchedulerFiber(const mys::shared_ptr<Fiber>& fiber)
     {
         m_fiber = fiber;
+#if defined(MYS_FIBER_THREADS)
         uv_cond_init(&cond);
+#else
+        stack_p = NULL;
+#endif
         state = State::SUSPENDED;
         prio = 0;
         waiter_p = NULL;
@@ -39,8 +140,14 @@ struct SchedulerFiber {
 };
 
 struct Scheduler {
+#if defined(MYS_FIBER_THREADS)
     // To ensure that only one fiber is running at a time.
     uv_mutex_t mutex;
+#else
+    // Stack of a stopped fiber. Freed by the next fiber as it cannot
+    // be freed while still running on it.
+    FiberStack *stopped_stack_p;
+#endif
     SchedulerFiber *current_p;
     SchedulerFiber *ready_head_p;
 
@@ -100,17 +207,39 @@ struct Scheduler {
         }
     }
 
+#if !defined(MYS_FIBER_THREADS)
+    void free_stopped_stack()
+    {
+        if (stopped_stack_p != NULL) {
+            stack_pool.free(stopped_stack_p);
+            stopped_stack_p = NULL;
+        }
+    }
+#endif
+
     void swap(SchedulerFiber *in_p, SchedulerFiber *out_p, bool end)
     {
-        // Signal scheduled fiber to start;
         out_p->traceback_top_p = mys::traceback_top_p;
         out_p->traceback_bottom_p = mys::traceback_bottom_p;
+
+#if defined(MYS_FIBER_THREADS)
+        // Signal scheduled fiber to start;
         uv_cond_signal(&in_p->cond);
 
         if (!end) {
             // Pause current fiber.
             uv_cond_wait(&out_p->cond, &mutex);
         }
+#else
+        if (end) {
+            stopped_stack_p = out_p->stack_p;
+            out_p->stack_p = NULL;
+            setcontext(&in_p->context);
+        } else {
+            swapcontext(&out_p->context, &in_p->context);
+            free_stopped_stack();
+        }
+#endif
 
         mys::traceback_top_p = out_p->traceback_top_p;
         mys::traceback_bottom_p = out_p->traceback_bottom_p;
@@ -256,17 +385,8 @@ mys::shared_ptr<Fiber> current()
     return scheduler.current_p->m_fiber;
 }
 
-// Fiber (currently thread) entry function.
-static void start_fiber_main(void *arg_p)
+static void run_fiber(SchedulerFiber *fiber_p)
 {
-    SchedulerFiber *fiber_p = (SchedulerFiber *)arg_p;
-
-    uv_mutex_lock(&scheduler.mutex);
-
-    if (fiber_p->state != SchedulerFiber::State::CURRENT) {
-        uv_cond_wait(&fiber_p->cond, &scheduler.mutex);
-    }
-
     __MYS_TRACEBACK_INIT();
     fiber_p->traceback_top_p = traceback_top_p;
     fiber_p->traceback_bottom_p = traceback_bottom_p;
@@ -290,6 +410,22 @@ static void start_fiber_main(void *arg_p)
 
     fiber_p->waiter_p = NULL;
     scheduler.reschedule(true);
+}
+
+#if defined(MYS_FIBER_THREADS)
+
+// Fiber thread entry function.
+static void start_fiber_main(void *arg_p)
+{
+    SchedulerFiber *fiber_p = (SchedulerFiber *)arg_p;
+
+    uv_mutex_lock(&scheduler.mutex);
+
+    if (fiber_p->state != SchedulerFiber::State::CURRENT) {
+        uv_cond_wait(&fiber_p->cond, &scheduler.mutex);
+    }
+
+    run_fiber(fiber_p);
     uv_mutex_unlock(&scheduler.mutex);
 }
 
@@ -302,6 +438,34 @@ static void start_detailed(SchedulerFiber *fiber_p)
     scheduler.resume(fiber_p);
 }
 
+#else
+
+// Fiber entry function, called on the fiber's stack the first time
+// it is scheduled. Never returns as the stopped fiber is never
+// scheduled again.
+static void start_fiber_main()
+{
+    scheduler.free_stopped_stack();
+    run_fiber(scheduler.current_p);
+}
+
+static void start_detailed(SchedulerFiber *fiber_p)
+{
+    fiber_p->stack_p = stack_pool.alloc();
+
+    if (getcontext(&fiber_p->context) != 0) {
+        throw std::exception();
+    }
+
+    fiber_p->context.uc_stack.ss_sp = fiber_p->stack_p->buf_p;
+    fiber_p->context.uc_stack.ss_size = fiber_p->stack_p->size;
+    fiber_p->context.uc_link = NULL;
+    makecontext(&fiber_p->context, start_fiber_main, 0);
+    scheduler.resume(fiber_p);
+}
+
+#endif
+
 void start(const mys::shared_ptr<Fiber>& fiber)
 {
     if (fiber->data_p != NULL) {
@@ -389,8 +553,12 @@ void init()
 {
     uv_signal_init(uv_default_loop(), &sigint);
     uv_signal_init(uv_default_loop(), &sigterm);
+#if defined(MYS_FIBER_THREADS)
     uv_mutex_init(&scheduler.mutex);
     uv_mutex_lock(&scheduler.mutex);
+#else
+    scheduler.stopped_stack_p = NULL;
+#endif
     scheduler.ready_head_p = NULL;
 
     main_fiber = mys::make_shared<Main>();
@@ -407,6 +575,54 @@ void init()
     start_detailed(fiber_p);
 }
 
+static void stop_handle(uv_handle_t *handle_p, void *arg_p)
+{
+    if (uv_is_closing(handle_p)) {
+        return;
+    }
+
+    switch (handle_p->type) {
+    case UV_TIMER:
+        uv_timer_stop((uv_timer_t *)handle_p);
+        break;
+    case UV_POLL:
+        uv_poll_stop((uv_poll_t *)handle_p);
+        break;
+    case UV_SIGNAL:
+        uv_signal_stop((uv_signal_t *)handle_p);
+        break;
+    case UV_TCP:
+    case UV_NAMED_PIPE:
+    case UV_TTY:
+        uv_read_stop((uv_stream_t *)handle_p);
+        break;
+    default:
+        break;
+    }
+}
+
+// Only the current fiber continues to run in a process created by
+// fork(). Other fibers are never scheduled again, and their pending
+// IO is stopped as it belongs to the parent process.
+void init_after_fork()
+{
+    uv_loop_fork(uv_default_loop());
+    uv_walk(uv_default_loop(), stop_handle, NULL);
+
+    SchedulerFiber *idle_p = (SchedulerFiber *)idle_fiber->data_p;
+
+    scheduler.ready_head_p = NULL;
+#if defined(MYS_FIBER_THREADS)
+    // Only the forking thread exists in the new process.
+    idle_p->state = SchedulerFiber::State::SUSPENDED;
+    uv_cond_init(&idle_p->cond);
+    start_detailed(idle_p);
+#else
+    idle_p->state = SchedulerFiber::State::READY;
+    scheduler.ready_push(idle_p);
+#endif
+}
+
 Fiber::Fiber()
 {
     data_p = NULL;
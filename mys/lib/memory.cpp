@@ -6,6 +6,46 @@ namespace mys {
 long long number_of_allocated_objects = 0;
 long long number_of_object_decrements = 0;
 long long number_of_object_frees = 0;
+long long number_of_pool_reuses = 0;
+long long number_of_pool_chunks = 0;
+long long number_of_large_allocations = 0;
+long long number_of_stack_objects = 0;
+#endif
+
+#if !defined(MYS_MEMORY_MALLOC)
+
+// Blocks are carved from chunks of this size.
+static const size_t MEMORY_POOL_CHUNK_SIZE = 65536;
+
+thread_local MemoryPool memory_pool;
+
+// Returns a new block of given size class, or nullptr if out of
+// memory. Called when the free list of the size class is empty.
+uint64_t *memory_pool_allocate_block(size_t size_class)
+{
+    size_t size = (size_class + 1) * MEMORY_POOL_BLOCK_SIZE;
+
+    if (memory_pool.chunk_left < size) {
+        // The remainder of the current chunk, if any, is lost.
+        memory_pool.chunk_p = (uint8_t *)std::malloc(MEMORY_POOL_CHUNK_SIZE);
+
+        if (memory_pool.chunk_p == nullptr) {
+            memory_pool.chunk_left = 0;
+
+            return nullptr;
+        }
+
+        memory_pool.chunk_left = MEMORY_POOL_CHUNK_SIZE;
+        INCREMENT_NUMBER_OF_POOL_CHUNKS;
+    }
+
+    uint64_t *block_p = (uint64_t *)memory_pool.chunk_p;
+    memory_pool.chunk_p += size;
+    memory_pool.chunk_left -= size;
+
+    return block_p;
+}
+
 #endif
 
 }
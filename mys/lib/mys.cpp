@@ -1,3 +1,4 @@
+#include <charconv>
 #include <iomanip>
 #include <alloca.h>
 #include <getopt.h>
@@ -6,6 +7,8 @@
 #include "unicodectype.cpp"
 #include "fiber.cpp"
 #include "memory.cpp"
+#include "output.cpp"
+#include "utf8.cpp"
 #include "whereami.c"
 
 extern void __application_init(void);
@@ -115,16 +118,32 @@ operator<<(std::ostream& os, const std::exception& e)
     return os;
 }
 
+// Write given characters as UTF-8. ASCII characters are written as
+// they are. Other strings are encoded in chunks on the stack, and
+// each chunk is written at once.
+static void write_utf8(std::ostream& os, const CharVector& chars)
+{
+    if (chars.is_ascii()) {
+        os.write((const char *)chars.latin1(), chars.size());
+    } else {
+        u8 buf[4096];
+        size_t size = chars.size();
+        size_t end;
+
+        for (size_t begin = 0; begin < size; begin = end) {
+            end = std::min(begin + sizeof(buf) / 4, size);
+            os.write((const char *)&buf[0],
+                     encode_utf8(chars, begin, end, &buf[0]));
+        }
+    }
+}
+
 std::ostream&
 operator<<(std::ostream& os, const String& obj)
 {
     if (obj.m_string) {
         os << "\"";
-
-        for (u64 i = 0; i < obj.m_string->size(); i++) {
-            os << PrintChar((*obj.m_string)[i]);
-        }
-
+        write_utf8(os, *obj.m_string);
         os << "\"";
     } else {
         os << "None";
@@ -136,9 +155,7 @@ operator<<(std::ostream& os, const String& obj)
 std::ostream& operator<<(std::ostream& os, const PrintString& obj)
 {
     if (obj.m_value.m_string) {
-        for (u64 i = 0; i < obj.m_value.m_string->size(); i++) {
-            os << PrintChar((*obj.m_value.m_string)[i]);
-        }
+        write_utf8(os, *obj.m_value.m_string);
     } else {
         os << "None";
     }
@@ -428,6 +445,7 @@ int main(int argc, char * const argv[])
                &test_pattern_p);
 
     ignore_sigpipe();
+    output_init();
 
     __MYS_TRACEBACK_INIT();
     init();
@@ -527,6 +545,7 @@ int main(int argc, char * const argv[])
     int res = 1;
 
     ignore_sigpipe();
+    output_init();
 
     __MYS_TRACEBACK_INIT();
     init();
@@ -571,62 +590,6 @@ std::ostream& operator<<(std::ostream& os, const Bool& obj)
     return os;
 }
 
-size_t encode_utf8(char *dst_p, i32 ch)
-{
-    size_t size;
-
-    if (ch < 0x80) {
-        dst_p[0] = ch;
-        size = 1;
-    } else if (ch < 0x800) {
-        dst_p[0] = (ch >> 6) | 0xc0;
-        dst_p[1] = (ch & 0x3f) | 0x80;
-        size = 2;
-    } else if (ch < 0x10000) {
-        dst_p[0] = (ch >> 0xc) | 0xe0;
-        dst_p[1] = ((ch >> 6) & 0x3f) | 0x80;
-        dst_p[2] = (ch & 0x3f) | 0x80;
-        size = 3;
-    } else if (ch < 0x200000) {
-        dst_p[0] = (ch >> 0x12) | 0xf0;
-        dst_p[1] = ((ch >> 0xc) & 0x3f) | 0x80;
-        dst_p[2] = ((ch >> 6) & 0x3f) | 0x80;
-        dst_p[3] = (ch & 0x3f) | 0x80;
-        size = 4;
-    } else {
-        size = 0;
-    }
-
-    return size;
-}
-
-size_t decode_utf8(char *src_p, size_t size, i32 *ch)
-{
-    if ((src_p[0] & 0x80) == 0) {
-        *ch = src_p[0];
-        size = 1;
-    } else if ((src_p[0] & 0xe0) == 0xc0) {
-        *ch = (src_p[0] & 0x1f) << 6;
-        *ch += src_p[1] & 0x3f;
-        size = 2;
-    } else if ((src_p[0] & 0xf0) == 0xe0) {
-        *ch = (src_p[0] & 0x0f) << 12;
-        *ch += (src_p[1] & 0x3f) << 6;
-        *ch += (src_p[2] & 0x3f);
-        size = 3;
-    } else if ((src_p[0] & 0xf8) == 0xf0) {
-        *ch = (src_p[0] & 0x07) << 18;
-        *ch += (src_p[1] & 0x3f) << 12;
-        *ch += (src_p[2] & 0x3f) << 6;
-        *ch += (src_p[3] & 0x3f);
-        size = 4;
-    } else {
-        size = 0;
-    }
-
-    return size;
-}
-
 std::ostream& operator<<(std::ostream& os, const Char& obj)
 {
     char buf[4];
@@ -651,10 +614,7 @@ std::ostream& operator<<(std::ostream& os, const PrintChar& obj)
     size_t size;
 
     size = encode_utf8(&buf[0], obj.m_value.m_value);
-
-    for (size_t i = 0; i < size; i++) {
-        os << buf[i];
-    }
+    os.write(&buf[0], size);
 
     return os;
 }
@@ -703,6 +663,24 @@ const RegexMatch& regexmatch_not_none(const RegexMatch& obj)
     return obj;
 }
 
+StringBuilder& stringbuilder_not_none(StringBuilder& obj)
+{
+    if (!obj.m_string) {
+        abort_is_none();
+    }
+
+    return obj;
+}
+
+const StringBuilder& stringbuilder_not_none(const StringBuilder& obj)
+{
+    if (!obj.m_string) {
+        abort_is_none();
+    }
+
+    return obj;
+}
+
 Bytes bytes_not_none(Bytes obj)
 {
     if (!obj.m_bytes) {
@@ -723,8 +701,12 @@ std::ostream& operator<<(std::ostream& os, Object& obj)
 String::String(const char *str)
 {
     if (str) {
+        size_t length = strlen(str);
+
         m_string = mys::make_shared<CharVector>();
-        for (size_t i = 0; i < strlen(str); i++) {
+        m_string->reserve(length);
+
+        for (size_t i = 0; i < length; i++) {
             append(Char(str[i]));
         }
     } else {
@@ -734,25 +716,11 @@ String::String(const char *str)
 
 String::String(const Bytes& bytes)
 {
-    size_t size;
-    i32 ch;
-    size_t pos;
-
     if (bytes.m_bytes) {
         m_string = mys::make_shared<CharVector>();
-        pos = 0;
 
-        while (pos < bytes.m_bytes->size()) {
-            size = decode_utf8((char *)&bytes.m_bytes->data()[pos],
-                               bytes.m_bytes->size() - pos,
-                               &ch);
-
-            if (size == 0) {
-                mys::make_shared<ValueError>("invalid UTF-8")->__throw();
-            }
-
-            m_string->push_back(Char(ch));
-            pos += size;
+        if (!decode_utf8(bytes.m_bytes->data(), bytes.m_bytes->size(), *m_string)) {
+            mys::make_shared<ValueError>("invalid UTF-8")->__throw();
         }
     } else {
         m_string = nullptr;
@@ -761,9 +729,6 @@ String::String(const Bytes& bytes)
 
 String::String(const Bytes& bytes, i64 begin, i64 end)
 {
-    size_t size;
-    i32 ch;
-
     if (bytes.m_bytes) {
         if (begin > bytes.m_bytes->size()) {
             begin = bytes.m_bytes->size();
@@ -775,27 +740,22 @@ String::String(const Bytes& bytes, i64 begin, i64 end)
 
         m_string = mys::make_shared<CharVector>();
 
-        while (begin < end) {
-            size = decode_utf8((char *)&bytes.m_bytes->data()[begin],
-                               end - begin,
-                               &ch);
-
-            if (size == 0) {
+        if (begin < end) {
+            if (!decode_utf8(&bytes.m_bytes->data()[begin], end - begin, *m_string)) {
                 mys::make_shared<ValueError>("invalid UTF-8")->__throw();
             }
-
-            m_string->push_back(Char(ch));
-            begin += size;
         }
     } else {
         m_string = nullptr;
     }
 }
 
-String String::operator+(const String& other)
+String String::operator+(const String& other) const
 {
     String res("");
 
+    res.m_string->reserve(m_string->size() + other.m_string->size(),
+                          m_string->is_wide() || other.m_string->is_wide());
     res.append(*this);
     res.append(other);
 
@@ -828,15 +788,13 @@ String String::operator*(int value) const
 Bytes String::to_utf8() const
 {
     Bytes res({});
-    size_t size;
-    char buf[4];
-
-    for (const auto & ch : *m_string) {
-        size = encode_utf8(&buf[0], ch.m_value);
+    size_t size = m_string->size();
 
-        for (size_t i = 0; i < size; i++) {
-            res += buf[i];
-        }
+    if (m_string->is_ascii()) {
+        res.m_bytes->assign(m_string->latin1(), m_string->latin1() + size);
+    } else {
+        res.m_bytes->resize(utf8_size(*m_string, 0, size));
+        encode_utf8(*m_string, 0, size, res.m_bytes->data());
     }
 
     return res;
@@ -881,8 +839,28 @@ void String::from_unsigned(std::stringstream& ss, u64 value, char radix)
     }
 }
 
+// Decimal numbers are formatted without a string stream, as they are
+// common in f-strings.
+template<typename T>
+static mys::shared_ptr<CharVector> format_decimal(T value)
+{
+    char buf[24];
+    auto res = std::to_chars(&buf[0], &buf[24], value);
+    auto chars = mys::make_shared<CharVector>();
+
+    chars->append((const u8 *)&buf[0], (const u8 *)res.ptr);
+
+    return chars;
+}
+
 String::String(i64 value, char radix)
 {
+    if (radix == 'd') {
+        m_string = format_decimal(value);
+
+        return;
+    }
+
     std::stringstream ss;
     int msb = 0;
 
@@ -896,6 +874,12 @@ String::String(i64 value, char radix)
 
 String::String(u64 value, char radix)
 {
+    if (radix == 'd') {
+        m_string = format_decimal(value);
+
+        return;
+    }
+
     std::stringstream ss;
 
     from_unsigned(ss, value, radix);
@@ -908,40 +892,42 @@ String::String(u64 value, char radix)
 String String::set_case(CaseMode mode) const
 {
     String res;
-    res.m_string = mys::make_shared<CharVector>(*m_string.get());
+    size_t size = m_string->size();
 
-    auto i = res.m_string->begin();
-    int index = 0;
-    while (i != res.m_string->end()) {
+    res.m_string = mys::make_shared<CharVector>();
+    res.m_string->reserve(size);
+
+    for (size_t index = 0; index < size; index++) {
+        Char ch = (*m_string)[index];
         Py_UCS4 mapped[3];
         int n;
 
         if (mode == CaseMode::CAPITALIZE && index == 0) {
-            n = _PyUnicode_ToTitleFull(*i, mapped);
+            n = _PyUnicode_ToTitleFull(ch, mapped);
         }
         else if ((mode == CaseMode::LOWER || mode == CaseMode::CAPITALIZE)
-                 && i->m_value == GREEK_CAPTIAL_LETTER_SIGMA) {
+                 && ch.m_value == GREEK_CAPTIAL_LETTER_SIGMA) {
             uint32_t c;
-            int j;
+            i64 j;
 
             // Lower case sigma at the end of a word is different than
             // in other positions, use the following regexp to detect this situation:
             // \p{cased}\p{case-ignorable}*U+03A3!(\p{case-ignorable}*\p{cased})
 
             for (j = index - 1; j >= 0; j--) {
-                c = res.m_string->at(j).m_value;
+                c = (*m_string)[j].m_value;
                 if (!_PyUnicode_IsCaseIgnorable(c)) {
                     break;
                 }
             }
             bool final_sigma = j >= 0 && _PyUnicode_IsCased(c);
             if (final_sigma) {
-                for (j = index + 1; j < res.m_string->size(); j++) {
-                    c = res.m_string->at(j).m_value;
+                for (j = index + 1; j < size; j++) {
+                    c = (*m_string)[j].m_value;
                     if (!_PyUnicode_IsCaseIgnorable(c))
                         break;
                 }
-                final_sigma = j == res.m_string->size() || !_PyUnicode_IsCased(c);
+                final_sigma = j == size || !_PyUnicode_IsCased(c);
             }
             mapped[0] = final_sigma ? GREEK_SMALL_LETTER_FINAL_SIGMA : GREEK_SMALL_LETTER_SIGMA;
             n = 1;
@@ -950,33 +936,19 @@ String String::set_case(CaseMode mode) const
             switch (mode) {
               case CaseMode::LOWER:
               case CaseMode::CAPITALIZE:
-                  n = _PyUnicode_ToLowerFull(*i, mapped);
+                  n = _PyUnicode_ToLowerFull(ch, mapped);
                   break;
               case CaseMode::UPPER:
-                  n = _PyUnicode_ToUpperFull(*i, mapped);
+                  n = _PyUnicode_ToUpperFull(ch, mapped);
                   break;
               case CaseMode::FOLD:
-                  n = _PyUnicode_ToFoldedFull(*i, mapped);
+                  n = _PyUnicode_ToFoldedFull(ch, mapped);
                   break;
             }
         }
 
-        if (n == 1) {
-            *i = mapped[0];
-            ++i;
-            index += 1;
-        }
-        else {
-            CharVector vmapped;
-            vmapped.resize(n);
-            for (int j = 0; j < n; ++j)  {
-                vmapped[j] = mapped[j];
-            }
-
-            i = res.m_string->erase(i);
-            auto j = res.m_string->insert(i, vmapped.begin(), vmapped.end());
-            i = j + vmapped.size();
-            index += vmapped.size();
+        for (int k = 0; k < n; k++) {
+            res.m_string->push_back(Char(mapped[k]));
         }
     }
 
@@ -1047,9 +1019,22 @@ String String::__str__()
 {
     String res("");
 
-    res.m_string->insert(res.m_string->end(),
-                         shared_ptr_not_none(m_string)->begin(),
-                         shared_ptr_not_none(m_string)->end());
+    res.m_string->append(*shared_ptr_not_none(m_string));
+
+    return res;
+}
+
+// Characters [begin, end) as a string sharing characters with this
+// string when possible. Strings are immutable, so the whole string is
+// itself.
+String String::substring(size_t begin, size_t end) const
+{
+    if ((begin == 0) && (end == m_string->size())) {
+        return *this;
+    }
+
+    String res;
+    res.m_string = CharVector::view(m_string, begin, end);
 
     return res;
 }
@@ -1090,15 +1075,14 @@ String String::get(std::optional<i64> _begin, std::optional<i64> _end,
         end = (step < 0) ? size - 1 : size;
     }
 
+    if (step == 1) {
+        return substring(begin, end);
+    }
+
     String res("");
     int i = begin;
 
-    if (step == 1) {
-        res.m_string->resize(end - begin);
-        std::copy(m_string->begin() + begin,
-                  m_string->begin() + end,
-                  res.m_string->begin());
-    } else if (step > 0) {
+    if (step > 0) {
         while (i < end) {
             res.append((*m_string)[i]);
             i += step;
@@ -1115,7 +1099,7 @@ String String::get(std::optional<i64> _begin, std::optional<i64> _end,
 
 #if !defined(MYS_UNSAFE)
 
-Char& String::get(i64 index) const
+Char String::get(i64 index) const
 {
     if (index < 0) {
         index = m_string->size() + index;
@@ -1300,14 +1284,26 @@ String input(String prompt)
 String String::join(const mys::shared_ptr<List<String>>& list) const
 {
     String res("");
-    size_t j = 0;
+    const auto& strings = list->m_list;
 
-    for (const auto &i : list->m_list) {
-        res.append(i);
-        if (j < list->m_list.size() - 1) {
-            res.append(*this);
-        }
-        ++j;
+    if (strings.empty()) {
+        return res;
+    }
+
+    size_t size = m_string->size() * (strings.size() - 1);
+    bool is_wide = (strings.size() > 1) && m_string->is_wide();
+
+    for (const auto& string : strings) {
+        size += string.m_string->size();
+        is_wide |= string.m_string->is_wide();
+    }
+
+    res.m_string->reserve(size, is_wide);
+    res.append(strings[0]);
+
+    for (size_t i = 1; i < strings.size(); i++) {
+        res.append(*this);
+        res.append(strings[i]);
     }
 
     return res;
@@ -1366,31 +1362,9 @@ i64 String::find(const String& sub, std::optional<i64> _begin, std::optional<i64
     }
 
     if (reverse) {
-        auto it_begin = m_string->rbegin() + (size - end);
-        auto it_end = m_string->rbegin() + (size - begin);
-        auto it_match = std::search(it_begin,
-                                    it_end,
-                                    sub.m_string->rbegin(),
-                                    sub.m_string->rend());
-
-        if (it_match == it_end) {
-            return -1;
-        }
-
-        return it_end - it_match - sub.m_string->size() + begin;
+        return m_string->find_reverse(*sub.m_string, begin, end);
     } else {
-        auto it_begin = m_string->begin() + begin;
-        auto it_end = m_string->begin() + end;
-        auto it_match = std::search(it_begin,
-                                    it_end,
-                                    sub.m_string->begin(),
-                                    sub.m_string->end());
-
-        if (it_match == it_end) {
-            return -1;
-        }
-
-        return it_match - it_begin + begin;
+        return m_string->find(*sub.m_string, begin, end);
     }
 }
 
@@ -1403,28 +1377,15 @@ mys::shared_ptr<List<String>> String::split(const String& separator) const
             mys::make_shared<ValueError>("empty separator")->__throw();
         }
 
-        auto it = m_string->begin();
-
-        while (it != m_string->end()) {
-            auto it_sep = std::search(it,
-                                      m_string->end(),
-                                      separator.m_string->begin(),
-                                      separator.m_string->end());
+        size_t size = m_string->size();
+        size_t begin = 0;
 
-            String part("");
-            part.m_string->resize(it_sep - it);
-            std::copy(it, it_sep, part.m_string->begin());
-            it = it_sep + separator.m_string->size();
-            list->append(part);
-
-            if (it_sep == m_string->end()) {
-                break;
-            }
-        }
+        m_string->find_all(*separator.m_string, 0, size, [&](size_t index) {
+            list->append(substring(begin, index));
+            begin = index + separator.m_string->size();
+        });
 
-        if (it == m_string->end()) {
-            list->append(String(""));
-        }
+        list->append(substring(begin, size));
     } else {
         list->append(*this);
     }
@@ -1434,9 +1395,6 @@ mys::shared_ptr<List<String>> String::split(const String& separator) const
 
 String String::strip_left_right(std::optional<const String> chars, bool left, bool right) const
 {
-    String res;
-    res.m_string = mys::make_shared<CharVector>(*m_string.get());
-
     // Characters to strip not given or given as None.
     bool whitespace = !chars.has_value() || !chars->m_string;
 
@@ -1445,42 +1403,32 @@ String String::strip_left_right(std::optional<const String> chars, bool left, bo
         return *this;
     }
 
+    auto is_stripped = [&](Char ch) {
+        if (whitespace) {
+            return _PyUnicode_IsWhitespace(ch) != 0;
+        } else {
+            return std::find(chars->m_string->begin(),
+                             chars->m_string->end(),
+                             ch) != chars->m_string->end();
+        }
+    };
+
+    size_t begin = 0;
+    size_t end = m_string->size();
+
     if (left) {
-        auto begin = res.m_string->begin();
-        for (; begin != res.m_string->end(); ++begin) {
-            if (whitespace) {
-                if (!_PyUnicode_IsWhitespace(*begin)) {
-                    break;
-                }
-            }
-            else {
-                auto i = std::find(chars->m_string->begin(), chars->m_string->end(), *begin);
-                if (i == chars->m_string->end()) {
-                    break;
-                }
-            }
+        while (begin < end && is_stripped((*m_string)[begin])) {
+            begin++;
         }
-        res.m_string->erase(res.m_string->begin(), begin);
     }
 
     if (right) {
-        auto end = res.m_string->rbegin();
-        for (; end != res.m_string->rend(); ++end) {
-            if (whitespace) {
-                if (!_PyUnicode_IsWhitespace(*end)) {
-                    break;
-                }
-            }
-            else {
-                auto i = std::find(chars->m_string->begin(), chars->m_string->end(), *end);
-                if (i == chars->m_string->end()) {
-                    break;
-                }
-            }
+        while (end > begin && is_stripped((*m_string)[end - 1])) {
+            end--;
         }
-        res.m_string->erase(end.base(), res.m_string->end());
     }
-    return res;
+
+    return substring(begin, end);
 }
 
 String String::strip(std::optional<const String> chars) const
@@ -1500,19 +1448,16 @@ String String::strip_right(std::optional<const String> chars) const
 
 SharedTuple<String, String, String> String::partition(const Char& chr) const
 {
-    auto i = std::find(m_string->begin(), m_string->end(), chr);
-    if (i == m_string->end()) {
+    i64 index = m_string->find(CharVector({chr}), 0, m_string->size());
+
+    if (index == -1) {
         return mys::make_shared<Tuple<String, String, String>>(*this, "", "");
     }
 
-    String a("");
-    a.m_string->insert(a.m_string->end(), m_string->begin(), i);
-    String b("");
-    b.append(chr);
-    String c("");
-    c.m_string->insert(c.m_string->end(), i + 1, m_string->end());
-
-    return mys::make_shared<Tuple<String, String, String>>(a, b, c);
+    return mys::make_shared<Tuple<String, String, String>>(
+        substring(0, index),
+        String(chr),
+        substring(index + 1, m_string->size()));
 }
 
 SharedTuple<String, String, String> String::partition(const String& str) const
@@ -1521,28 +1466,28 @@ SharedTuple<String, String, String> String::partition(const String& str) const
         mys::make_shared<ValueError>("separator is None")->__throw();
     }
 
-    auto i = std::search(m_string->begin(), m_string->end(),
-                         str.m_string->begin(), str.m_string->end());
-    if (i == m_string->end()) {
+    i64 index = m_string->find(*str.m_string, 0, m_string->size());
+    if (index == -1) {
         return mys::make_shared<Tuple<String, String, String>>(*this, "", "");
     }
 
-    String a("");
-    a.m_string->insert(a.m_string->end(), m_string->begin(), i);
-    String b("");
-    b.m_string->insert(b.m_string->end(), i + str.length(), m_string->end());
-
-    return mys::make_shared<Tuple<String, String, String>>(a, str, b);
+    return mys::make_shared<Tuple<String, String, String>>(
+        substring(0, index),
+        str,
+        substring(index + str.length(), m_string->size()));
 }
 
 String String::replace(const Char& old, const Char& _new) const
 {
-    String res;
-    res.m_string = mys::make_shared<CharVector>(*m_string.get());
+    String res("");
 
-    for (auto& ch : *res.m_string) {
-        if (ch.m_value == old.m_value) {
-            ch.m_value = _new.m_value;
+    res.m_string->reserve(m_string->size());
+
+    for (auto ch : *m_string) {
+        if (ch == old) {
+            res.m_string->push_back(_new);
+        } else {
+            res.m_string->push_back(ch);
         }
     }
 
@@ -1551,21 +1496,29 @@ String String::replace(const Char& old, const Char& _new) const
 
 String String::replace(const String& old, const String& _new) const
 {
-    String res;
-    res.m_string = mys::make_shared<CharVector>(*m_string.get());
+    String res("");
+    size_t size = m_string->size();
+    size_t begin = 0;
 
-    auto i = res.m_string->begin();
-    while (i != res.m_string->end()) {
-        auto s = std::search(i, res.m_string->end(),
-                             old.m_string->begin(), old.m_string->end());
-        if (s == res.m_string->end()) {
-            break;
+    if (old.m_string->size() == 0) {
+        for (auto ch : *m_string) {
+            res.m_string->append(*_new.m_string);
+            res.m_string->push_back(ch);
         }
-        i = res.m_string->erase(s, s + old.m_string->size());
-        i = res.m_string->insert(i, _new.m_string->begin(), _new.m_string->end());
-        i += _new.m_string->size();
+
+        res.m_string->append(*_new.m_string);
+
+        return res;
     }
 
+    m_string->find_all(*old.m_string, 0, size, [&](size_t index) {
+        res.m_string->append(*m_string, begin, index);
+        res.m_string->append(*_new.m_string);
+        begin = index + old.m_string->size();
+    });
+
+    res.m_string->append(*m_string, begin, size);
+
     return res;
 }
 
@@ -1581,7 +1534,7 @@ Bool String::is_alpha() const
     }
 
     return std::all_of(m_string->begin(), m_string->end(),
-                       [](Char& c) {
+                       [](Char c) {
                            return _PyUnicode_IsAlpha(c.m_value);
                        });
 }
@@ -1593,7 +1546,7 @@ Bool String::is_digit() const
     }
 
     return std::all_of(m_string->begin(), m_string->end(),
-                       [](Char& c) {
+                       [](Char c) {
                            return _PyUnicode_IsDigit(c.m_value);
                        });
 }
@@ -1605,7 +1558,7 @@ Bool String::is_numeric() const
     }
 
     return std::all_of(m_string->begin(), m_string->end(),
-                       [](Char& c) {
+                       [](Char c) {
                            return _PyUnicode_IsNumeric(c.m_value);
                        });
 }
@@ -1617,7 +1570,7 @@ Bool String::is_space() const
     }
 
     return std::all_of(m_string->begin(), m_string->end(),
-                       [](Char& c) {
+                       [](Char c) {
                            return _PyUnicode_IsWhitespace(c.m_value);
                        });
 }
@@ -1629,7 +1582,7 @@ Bool String::is_upper() const
     }
 
     if (!std::any_of(m_string->begin(), m_string->end(),
-                     [](Char& c) {
+                     [](Char c) {
                          return _PyUnicode_IsCased(c.m_value);
                      })) {
         return false;
@@ -1647,7 +1600,7 @@ Bool String::is_lower() const
     }
 
     if (!std::any_of(m_string->begin(), m_string->end(),
-                     [](Char& c) {
+                     [](Char c) {
                          return _PyUnicode_IsCased(c.m_value);
                      })) {
         return false;
@@ -1705,13 +1658,7 @@ String bytes_str(const Bytes& value)
 String string_str(const String& value)
 {
     if (value.m_string) {
-        String res("");
-
-        res.m_string->insert(res.m_string->end(),
-                             value.m_string->begin(),
-                             value.m_string->end());
-
-        return res;
+        return value;
     } else {
         return String("None");
     }
@@ -1722,9 +1669,7 @@ String string_with_quotes(const String& value)
     if (value.m_string) {
         String res("\"");
 
-        res.m_string->insert(res.m_string->end(),
-                             value.m_string->begin(),
-                             value.m_string->end());
+        res.m_string->append(*value.m_string);
         res += "\"";
 
         return res;
@@ -1733,6 +1678,26 @@ String string_with_quotes(const String& value)
     }
 }
 
+String stringbuilder_str(const StringBuilder& value)
+{
+    if (value.m_string) {
+        return value.to_string();
+    } else {
+        return String("None");
+    }
+}
+
+std::ostream& operator<<(std::ostream& os, const StringBuilder& obj)
+{
+    if (obj.m_string) {
+        os << PrintString(*obj.m_string);
+    } else {
+        os << "None";
+    }
+
+    return os;
+}
+
 String regexmatch_str(const RegexMatch& value)
 {
     if (value.m_match_data) {
@@ -1917,8 +1882,11 @@ String RegexMatch::group(int index) const
     }
 
     String res("");
-    res.m_string->resize(length);
-    std::copy(buffer, buffer + length, res.m_string->begin());
+    res.m_string->reserve(length);
+
+    for (PCRE2_SIZE i = 0; i < length; i++) {
+        res.m_string->push_back(Char(buffer[i]));
+    }
 
     pcre2_substring_free(buffer);
 
@@ -1952,7 +1920,7 @@ SharedDict<String, String> RegexMatch::group_dict() const
             }
             name.append(Char(ptr[1 + c]));
         }
-        res->m_map[name] = group(index);
+        res->__setitem__(name, group(index));
     }
 
     return res;
@@ -1993,18 +1961,130 @@ String Regex::get_error(int error)
     buffer.resize(1024);
 
     length = pcre2_get_error_message(error, buffer.data(), buffer.size());
-    if (length > 0) {
-        res.m_string->resize(length);
-        std::copy(buffer.begin(), buffer.begin() + length, res.m_string->begin());
+    for (int i = 0; i < length; i++) {
+        res.m_string->push_back(Char(buffer[i]));
     }
+
     return res;
 }
 
+// Match context with a JIT stack on the heap, shared by all JIT
+// compiled regexes in a thread. The default JIT stack is only 32 KiB
+// on the machine stack, which is too small for some patterns and may
+// be the small stack of a fiber.
+struct RegexMatchContext {
+    pcre2_match_context *context_p;
+    pcre2_jit_stack *jit_stack_p;
+
+    RegexMatchContext() : context_p(nullptr), jit_stack_p(nullptr)
+    {
+    }
+
+    ~RegexMatchContext()
+    {
+        pcre2_jit_stack_free(jit_stack_p);
+        pcre2_match_context_free(context_p);
+    }
+};
+
+static thread_local RegexMatchContext regex_match_context;
+
+CompiledRegex::CompiledRegex(pcre2_code *code_p)
+    : m_code_p(code_p), m_is_jit_compiled(false), m_match_data_p(nullptr)
+{
+#if !defined(MYS_REGEX_NO_JIT)
+    // Fails if PCRE2 is built without JIT support, and the regex is
+    // then interpreted.
+    m_is_jit_compiled = (pcre2_jit_compile(code_p, PCRE2_JIT_COMPLETE) == 0);
+#endif
+}
+
+CompiledRegex::~CompiledRegex()
+{
+    pcre2_match_data_free(m_match_data_p);
+    pcre2_code_free(m_code_p);
+}
+
+pcre2_match_data *CompiledRegex::take_match_data()
+{
+    pcre2_match_data *match_data_p = m_match_data_p;
+
+    if (match_data_p != nullptr) {
+        m_match_data_p = nullptr;
+    } else {
+        match_data_p = pcre2_match_data_create_from_pattern(m_code_p, NULL);
+
+        if (match_data_p == nullptr) {
+            throw std::bad_alloc();
+        }
+    }
+
+    return match_data_p;
+}
+
+void CompiledRegex::give_back_match_data(pcre2_match_data *match_data_p)
+{
+    if (m_match_data_p == nullptr) {
+        m_match_data_p = match_data_p;
+    } else {
+        pcre2_match_data_free(match_data_p);
+    }
+}
+
+pcre2_match_context *CompiledRegex::match_context() const
+{
+    if (!m_is_jit_compiled) {
+        return NULL;
+    }
+
+    if (regex_match_context.context_p == nullptr) {
+        regex_match_context.context_p = pcre2_match_context_create(NULL);
+        regex_match_context.jit_stack_p = pcre2_jit_stack_create(32 * 1024,
+                                                                 1024 * 1024,
+                                                                 NULL);
+        pcre2_jit_stack_assign(regex_match_context.context_p,
+                               NULL,
+                               regex_match_context.jit_stack_p);
+    }
+
+    return regex_match_context.context_p;
+}
+
+// Maximum number of compiled regexes in the cache. The cache is
+// cleared when full, as programs that create more regexes than this
+// at runtime are unlikely to reuse them.
+static const size_t REGEX_CACHE_MAX_SIZE = 256;
+
+struct RegexCacheKey {
+    uint32_t options;
+    String regex;
+
+    bool operator==(const RegexCacheKey& other) const
+    {
+        return (options == other.options) && (regex == other.regex);
+    }
+};
+
+struct RegexCacheKeyHash {
+    size_t operator()(const RegexCacheKey& key) const
+    {
+        return std::hash<String>()(key.regex) ^ key.options;
+    }
+};
+
+// Compiled regexes by pattern and options, so that regexes created
+// from the same strings at runtime, for example in a loop, are only
+// compiled once. Compiled regexes are immutable and shared by all
+// regex objects created from the same pattern and options.
+static thread_local std::unordered_map<RegexCacheKey,
+                                       std::shared_ptr<CompiledRegex>,
+                                       RegexCacheKeyHash> regex_cache;
+
 Regex::Regex(const String& regex, const String& flags)
 {
     int pcreError;
     PCRE2_SIZE pcreErrorOffset;
-    PCRE2_SPTR regex_sptr = reinterpret_cast<PCRE2_SPTR>(regex.m_string->data());
+    PCRE2_SPTR regex_sptr;
     PCRE2_SIZE length = regex.m_string->size();
     uint32_t options = PCRE2_UTF | PCRE2_UCP;
     PCRE2_UCHAR empty[] = { 0 };
@@ -2028,8 +2108,18 @@ Regex::Regex(const String& regex, const String& flags)
         }
     }
 
+    auto it = regex_cache.find(RegexCacheKey{options, regex});
+
+    if (it != regex_cache.end()) {
+        m_compiled = it->second;
+
+        return;
+    }
+
     if (length == 0) {
         regex_sptr = empty;
+    } else {
+        regex_sptr = reinterpret_cast<PCRE2_SPTR>(regex.m_string->ucs4());
     }
 
     pcre2_code *compiled_p = pcre2_compile(regex_sptr,
@@ -2051,46 +2141,176 @@ Regex::Regex(const String& regex, const String& flags)
         mys::make_shared<ValueError>(message)->__throw();
     }
 
-    m_compiled.reset(compiled_p,
-                     [](pcre2_code *code) {
-                         pcre2_code_free(code);
-                     });
+    m_compiled = std::make_shared<CompiledRegex>(compiled_p);
+
+    if (regex_cache.size() == REGEX_CACHE_MAX_SIZE) {
+        regex_cache.clear();
+    }
+
+    regex_cache[RegexCacheKey{options, regex}] = m_compiled;
+}
+
+// Returns given string as a PCRE2 subject. An empty string may not
+// have a buffer.
+static PCRE2_SPTR regex_subject(const String& string)
+{
+    static const PCRE2_UCHAR empty[] = { 0 };
+
+    if (string.m_string->size() == 0) {
+        return empty;
+    }
+
+    return reinterpret_cast<PCRE2_SPTR>(string.m_string->ucs4());
 }
 
 RegexMatch Regex::match(const String& string) const
 {
-    std::shared_ptr<pcre2_match_data> match_data;
-    PCRE2_SPTR string_sptr = reinterpret_cast<PCRE2_SPTR>(string.m_string->data());
-    PCRE2_SIZE length = string.m_string->size();
-    PCRE2_UCHAR empty[] = { 0 };
     int error;
 
-    if (length == 0) {
-        string_sptr = empty;
+    pcre2_match_data *match_data_p = m_compiled->take_match_data();
+    error = pcre2_match(m_compiled->m_code_p,
+                        regex_subject(string),
+                        string.m_string->size(),
+                        0,
+                        0,
+                        match_data_p,
+                        m_compiled->match_context());
+
+    if (error < 0) {
+        m_compiled->give_back_match_data(match_data_p);
+
+        if (error == PCRE2_ERROR_NOMATCH) {
+            return RegexMatch();
+        } else {
+            mys::make_shared<IndexError>(get_error(error))->__throw();
+        }
+    }
+
+    return make_match(match_data_p, string);
+}
+
+// Searches for the next match in given subject, starting at given
+// offset, and moves the offset to the end of the match. An empty match
+// is not allowed at the offset if the previous match was empty, as the
+// search would otherwise never advance. Returns 1 if found, 0 if not,
+// or a negative PCRE2 error code.
+int Regex::find(PCRE2_SPTR subject,
+                PCRE2_SIZE length,
+                PCRE2_SIZE& offset,
+                bool& is_previous_match_empty,
+                pcre2_match_data *match_data_p) const
+{
+    while (offset <= length) {
+        uint32_t options = 0;
+
+        // PCRE2 checks that the subject is valid UTF from given offset
+        // to the end of the subject. The first search starts at the
+        // beginning, so later searches need not check it again, which
+        // would make finding all matches quadratic.
+        if (offset > 0) {
+            options |= PCRE2_NO_UTF_CHECK;
+        }
+
+        if (is_previous_match_empty) {
+            options |= PCRE2_NOTEMPTY_ATSTART | PCRE2_ANCHORED;
+        }
+
+        int error = pcre2_match(m_compiled->m_code_p,
+                                subject,
+                                length,
+                                offset,
+                                options,
+                                match_data_p,
+                                m_compiled->match_context());
+
+        if (error == PCRE2_ERROR_NOMATCH) {
+            if (!is_previous_match_empty) {
+                break;
+            }
+
+            // No non-empty match at the offset. Search again from
+            // the next character.
+            is_previous_match_empty = false;
+            offset++;
+        } else if (error < 0) {
+            return error;
+        } else {
+            PCRE2_SIZE *ovector = pcre2_get_ovector_pointer(match_data_p);
+            is_previous_match_empty = (ovector[0] == ovector[1]);
+            offset = ovector[1];
+
+            return 1;
+        }
     }
 
-    match_data.reset(pcre2_match_data_create_from_pattern(m_compiled.get(), NULL),
-                     [](pcre2_match_data *data) {
-                         pcre2_match_data_free(data);
-                     });
+    offset = length + 1;
+
+    return 0;
+}
+
+// Returns a match owning given match data, which is given back to the
+// compiled regex when the match is destroyed.
+RegexMatch Regex::make_match(pcre2_match_data *match_data_p,
+                             const String& string) const
+{
+    auto compiled = m_compiled;
+    std::shared_ptr<pcre2_match_data> match_data(
+        match_data_p,
+        [compiled](pcre2_match_data *match_data_p) {
+            compiled->give_back_match_data(match_data_p);
+        });
+
+    return RegexMatch(match_data,
+                      std::shared_ptr<pcre2_code>(m_compiled,
+                                                  m_compiled->m_code_p),
+                      string);
+}
+
+RegexMatch RegexMatchIterator::next()
+{
+    pcre2_match_data *match_data_p = m_regex.m_compiled->take_match_data();
+    int res = m_regex.find(regex_subject(m_string),
+                           m_string.m_string->size(),
+                           m_offset,
+                           m_is_previous_match_empty,
+                           match_data_p);
+
+    if (res <= 0) {
+        m_regex.m_compiled->give_back_match_data(match_data_p);
+
+        if (res < 0) {
+            mys::make_shared<IndexError>(Regex::get_error(res))->__throw();
+        }
 
-    error = pcre2_match(m_compiled.get(), string_sptr, length, 0, 0,
-                        match_data.get(), NULL);
-    if (error == PCRE2_ERROR_NOMATCH) {
         return RegexMatch();
     }
-    else if (error < 0) {
-        mys::make_shared<IndexError>(get_error(error))->__throw();
+
+    return m_regex.make_match(match_data_p, m_string);
+}
+
+mys::shared_ptr<List<RegexMatch>> Regex::find_all(const String& string) const
+{
+    auto res = mys::make_shared<List<RegexMatch>>();
+    RegexMatchIterator iterator(*this, string);
+
+    while (true) {
+        RegexMatch match = iterator.next();
+
+        if (!match.m_match_data) {
+            break;
+        }
+
+        res->append(match);
     }
 
-    return RegexMatch(match_data, m_compiled, string);
+    return res;
 }
 
 String Regex::replace(const String& subject, const String& replacement, int flags) const
 {
-    PCRE2_SPTR subject_sptr = reinterpret_cast<PCRE2_SPTR>(subject.m_string->data());
+    PCRE2_SPTR subject_sptr = reinterpret_cast<PCRE2_SPTR>(subject.m_string->ucs4());
     PCRE2_SIZE subject_length = subject.m_string->size();
-    PCRE2_SPTR replacement_sptr = reinterpret_cast<PCRE2_SPTR>(replacement.m_string->data());
+    PCRE2_SPTR replacement_sptr = reinterpret_cast<PCRE2_SPTR>(replacement.m_string->ucs4());
     PCRE2_SIZE replacement_length = replacement.m_string->size();
     auto pcre_output = std::vector<PCRE2_UCHAR>();
     PCRE2_SIZE out_length = 1024;
@@ -2111,11 +2331,14 @@ String Regex::replace(const String& subject, const String& replacement, int flag
         options |= PCRE2_SUBSTITUTE_GLOBAL;
     }
 
+    pcre2_match_data *match_data_p = m_compiled->take_match_data();
+
     while (retry--) {
         pcre_output.resize(out_length);
-        error = pcre2_substitute(m_compiled.get(),
+        error = pcre2_substitute(m_compiled->m_code_p,
                                  subject_sptr, subject_length,
-                                 0, options, NULL, NULL,
+                                 0, options, match_data_p,
+                                 m_compiled->match_context(),
                                  replacement_sptr, replacement_length,
                                  pcre_output.data(), &out_length);
         if (error != PCRE2_ERROR_NOMEMORY) {
@@ -2123,6 +2346,8 @@ String Regex::replace(const String& subject, const String& replacement, int flag
         }
     }
 
+    m_compiled->give_back_match_data(match_data_p);
+
     if (error < 0) {
         mys::make_shared<IndexError>(get_error(error))->__throw();
     }
@@ -2137,21 +2362,40 @@ String Regex::replace(const String& subject, const String& replacement, int flag
 
 mys::shared_ptr<List<String>> Regex::split(const String& string) const
 {
-    String split(string);
-    List<String> res;
+    auto res = mys::make_shared<List<String>>();
+    PCRE2_SPTR subject = regex_subject(string);
+    PCRE2_SIZE length = string.m_string->size();
+    PCRE2_SIZE offset = 0;
+    PCRE2_SIZE begin = 0;
+    bool is_previous_match_empty = false;
+    pcre2_match_data *match_data_p = m_compiled->take_match_data();
+    PCRE2_SIZE *ovector = pcre2_get_ovector_pointer(match_data_p);
+    int res_find;
+
     while (true) {
-        RegexMatch m = match(split);
-        if (m.m_match_data && m.get_num_matches() > 0) {
-            auto [begin, end] = m.span(0)->m_tuple;
-            res.append(split.get(0, begin, 1));
-            split = split.get(end, split.length(), 1);
-        }
-        else {
-            res.append(split);
+        res_find = find(subject,
+                        length,
+                        offset,
+                        is_previous_match_empty,
+                        match_data_p);
+
+        if (res_find <= 0) {
             break;
         }
+
+        res->append(string.get(begin, ovector[0], 1));
+        begin = ovector[1];
+    }
+
+    m_compiled->give_back_match_data(match_data_p);
+
+    if (res_find < 0) {
+        mys::make_shared<IndexError>(get_error(res_find))->__throw();
     }
-    return mys::make_shared<List<String>>(res);
+
+    res->append(string.get(begin, length, 1));
+
+    return res;
 }
 
 Bytes::Bytes(u64 size)
@@ -2244,19 +2488,14 @@ i64 Bytes::find(const Bytes& needle,
         return -1;
     }
 
-    auto i_begin = m_bytes->begin() + begin;
-    auto i_end = m_bytes->begin() + end;
-
-    auto s = std::search(i_begin,
-                         i_end,
-                         needle.m_bytes->begin(),
-                         needle.m_bytes->end());
+    Searcher searcher(needle.m_bytes->data(), needle.m_bytes->size());
+    i64 index = searcher.find(m_bytes->data() + begin, end - begin);
 
-    if (s == i_end) {
+    if (index == -1) {
         return -1;
     }
 
-    return s - i_begin + begin;
+    return begin + index;
 }
 
 Bytes Bytes::get(std::optional<i64> _begin, std::optional<i64> _end,
@@ -6,6 +6,8 @@
 #include "mys/common.hpp"
 #include "mys/utils.hpp"
 #include "mys/traceback.hpp"
+#include "mys/hash.hpp"
+#include "mys/output.hpp"
 
 // Mys defined types
 #include "mys/types/number.hpp"
@@ -13,9 +15,11 @@
 #include "mys/types/char.hpp"
 #include "mys/types/bytes.hpp"
 #include "mys/types/string.hpp"
+#include "mys/types/string_builder.hpp"
 #include "mys/types/object.hpp"
 #include "mys/types/tuple.hpp"
 #include "mys/types/list.hpp"
+#include "mys/types/deque.hpp"
 #include "mys/types/dict.hpp"
 #include "mys/types/set.hpp"
 #include "mys/types/generators.hpp"
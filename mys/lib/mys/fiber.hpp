@@ -37,6 +37,8 @@ bool sleep(f64 seconds);
 
 void init();
 
+void init_after_fork();
+
 void enable_signal(int signum);
 
 void disable_signal(int signum);
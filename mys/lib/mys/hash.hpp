@@ -0,0 +1,115 @@
+#pragma once
+
+#include <cstring>
+#include "common.hpp"
+#include "types/number.hpp"
+
+namespace mys {
+
+// Fast non-cryptographic hashing of arbitrary data, based on wyhash
+// (final version 4, public domain).
+
+static inline void hash_multiply(u64 *a_p, u64 *b_p)
+{
+    __uint128_t r = *a_p;
+
+    r *= *b_p;
+    *a_p = (u64)r;
+    *b_p = (u64)(r >> 64);
+}
+
+static inline u64 hash_mix(u64 a, u64 b)
+{
+    hash_multiply(&a, &b);
+
+    return a ^ b;
+}
+
+static inline u64 hash_read_8(const u8 *p)
+{
+    u64 value;
+
+    std::memcpy(&value, p, 8);
+
+    return value;
+}
+
+static inline u64 hash_read_4(const u8 *p)
+{
+    u32 value;
+
+    std::memcpy(&value, p, 4);
+
+    return value;
+}
+
+static inline u64 hash_read_3(const u8 *p, size_t size)
+{
+    return (((u64)p[0]) << 16) | (((u64)p[size >> 1]) << 8) | p[size - 1];
+}
+
+static inline u64 hash_bytes(const void *data_p, size_t size, u64 seed = 0)
+{
+    static const u64 secret[4] = {
+        0x2d358dccaa6c78a5ull,
+        0x8bb84b93962eacc9ull,
+        0x4b33a62ed433d4a3ull,
+        0x4d5a2da51de1aa47ull
+    };
+    const u8 *p = (const u8 *)data_p;
+    u64 a;
+    u64 b;
+
+    seed ^= hash_mix(seed ^ secret[0], secret[1]);
+
+    if (size <= 16) {
+        if (size >= 4) {
+            a = (hash_read_4(p) << 32) | hash_read_4(p + ((size >> 3) << 2));
+            b = ((hash_read_4(p + size - 4) << 32)
+                 | hash_read_4(p + size - 4 - ((size >> 3) << 2)));
+        } else if (size > 0) {
+            a = hash_read_3(p, size);
+            b = 0;
+        } else {
+            a = 0;
+            b = 0;
+        }
+    } else {
+        size_t i = size;
+
+        if (i > 48) {
+            u64 seed_1 = seed;
+            u64 seed_2 = seed;
+
+            do {
+                seed = hash_mix(hash_read_8(p) ^ secret[1],
+                                hash_read_8(p + 8) ^ seed);
+                seed_1 = hash_mix(hash_read_8(p + 16) ^ secret[2],
+                                  hash_read_8(p + 24) ^ seed_1);
+                seed_2 = hash_mix(hash_read_8(p + 32) ^ secret[3],
+                                  hash_read_8(p + 40) ^ seed_2);
+                p += 48;
+                i -= 48;
+            } while (i > 48);
+
+            seed ^= seed_1 ^ seed_2;
+        }
+
+        while (i > 16) {
+            seed = hash_mix(hash_read_8(p) ^ secret[1], hash_read_8(p + 8) ^ seed);
+            i -= 16;
+            p += 16;
+        }
+
+        a = hash_read_8(p + i - 16);
+        b = hash_read_8(p + i - 8);
+    }
+
+    a ^= secret[1];
+    b ^= seed;
+    hash_multiply(&a, &b);
+
+    return hash_mix(a ^ secret[0] ^ size, b ^ secret[1]);
+}
+
+}
@@ -15,16 +15,112 @@ void print_traceback(void);
 extern long long number_of_allocated_objects;
 extern long long number_of_object_decrements;
 extern long long number_of_object_frees;
+extern long long number_of_pool_reuses;
+extern long long number_of_pool_chunks;
+extern long long number_of_large_allocations;
+extern long long number_of_stack_objects;
 
 #    define INCREMENT_NUMBER_OF_ALLOCATED_OBJECTS number_of_allocated_objects++
 #    define DECREMENT_NUMBER_OF_ALLOCATED_OBJECTS number_of_allocated_objects--
 #    define INCREMENT_NUMBER_OF_OBJECT_DECREMENTS number_of_object_decrements++
 #    define INCREMENT_NUMBER_OF_OBJECT_FREES number_of_object_frees++
+#    define INCREMENT_NUMBER_OF_POOL_REUSES number_of_pool_reuses++
+#    define INCREMENT_NUMBER_OF_POOL_CHUNKS number_of_pool_chunks++
+#    define INCREMENT_NUMBER_OF_LARGE_ALLOCATIONS number_of_large_allocations++
+#    define INCREMENT_NUMBER_OF_STACK_OBJECTS number_of_stack_objects++
 #else
 #    define INCREMENT_NUMBER_OF_ALLOCATED_OBJECTS
 #    define DECREMENT_NUMBER_OF_ALLOCATED_OBJECTS
 #    define INCREMENT_NUMBER_OF_OBJECT_DECREMENTS
 #    define INCREMENT_NUMBER_OF_OBJECT_FREES
+#    define INCREMENT_NUMBER_OF_POOL_REUSES
+#    define INCREMENT_NUMBER_OF_POOL_CHUNKS
+#    define INCREMENT_NUMBER_OF_LARGE_ALLOCATIONS
+#    define INCREMENT_NUMBER_OF_STACK_OBJECTS
+#endif
+
+#if defined(MYS_MEMORY_MALLOC)
+
+inline void *memory_allocate(size_t size)
+{
+    return std::malloc(size);
+}
+
+inline void memory_deallocate(void *buf_p)
+{
+    std::free(buf_p);
+}
+
+#else
+
+// Small objects are allocated from thread local pools of fixed size
+// blocks, one pool per size class. Freed blocks are put in a free
+// list and reused by later allocations of the same size class, so
+// most allocations and frees are a few instructions without locking.
+// Blocks are never returned to the system. A block may be freed by
+// another thread than the one that allocated it, and is then reused
+// by that thread.
+//
+// Each block starts with its size class, followed by the memory
+// returned to the caller. Larger objects are allocated with malloc()
+// with the same prefix.
+const size_t MEMORY_POOL_BLOCK_SIZE = 16;
+const size_t MEMORY_POOL_NUMBER_OF_SIZE_CLASSES = 16;
+const size_t MEMORY_POOL_LARGE = MEMORY_POOL_NUMBER_OF_SIZE_CLASSES;
+
+struct MemoryPool {
+    void *free_lists[MEMORY_POOL_NUMBER_OF_SIZE_CLASSES];
+    uint8_t *chunk_p;
+    size_t chunk_left;
+};
+
+extern thread_local MemoryPool memory_pool;
+
+uint64_t *memory_pool_allocate_block(size_t size_class);
+
+inline void *memory_allocate(size_t size)
+{
+    size += sizeof(uint64_t);
+    size_t size_class = (size - 1) / MEMORY_POOL_BLOCK_SIZE;
+    uint64_t *block_p;
+
+    if (size_class < MEMORY_POOL_NUMBER_OF_SIZE_CLASSES) {
+        block_p = (uint64_t *)memory_pool.free_lists[size_class];
+
+        if (block_p != nullptr) {
+            memory_pool.free_lists[size_class] = *(void **)block_p;
+            INCREMENT_NUMBER_OF_POOL_REUSES;
+        } else {
+            block_p = memory_pool_allocate_block(size_class);
+        }
+    } else {
+        block_p = (uint64_t *)std::malloc(size);
+        size_class = MEMORY_POOL_LARGE;
+        INCREMENT_NUMBER_OF_LARGE_ALLOCATIONS;
+    }
+
+    if (block_p == nullptr) {
+        return nullptr;
+    }
+
+    block_p[0] = size_class;
+
+    return block_p + 1;
+}
+
+inline void memory_deallocate(void *buf_p)
+{
+    uint64_t *block_p = ((uint64_t *)buf_p) - 1;
+    size_t size_class = block_p[0];
+
+    if (size_class < MEMORY_POOL_NUMBER_OF_SIZE_CLASSES) {
+        *(void **)block_p = memory_pool.free_lists[size_class];
+        memory_pool.free_lists[size_class] = block_p;
+    } else {
+        std::free(block_p);
+    }
+}
+
 #endif
 
 // A shared pointer class for single threaded applications made
@@ -92,7 +188,7 @@ public:
         count() -= 1;
 
         if (count() == 0) {
-            std::free(m_buf_p);
+            memory_deallocate(m_buf_p);
             DECREMENT_NUMBER_OF_ALLOCATED_OBJECTS;
             INCREMENT_NUMBER_OF_OBJECT_FREES;
         }
@@ -166,7 +262,7 @@ shared_ptr<T> make_shared(Args&&... args)
 {
     shared_ptr<T> p;
 
-    p.m_buf_p = std::malloc(sizeof(uint64_t) + sizeof(T));
+    p.m_buf_p = memory_allocate(sizeof(uint64_t) + sizeof(T));
 
     if (p.m_buf_p == nullptr) {
         print_traceback();
@@ -180,7 +276,7 @@ shared_ptr<T> make_shared(Args&&... args)
     try {
         new(p.get()) T(std::forward<Args>(args)...);
     } catch (...) {
-        std::free(p.m_buf_p);
+        memory_deallocate(p.m_buf_p);
         p.m_buf_p = nullptr;
 
         throw;
@@ -191,6 +287,62 @@ shared_ptr<T> make_shared(Args&&... args)
     return p;
 }
 
+// Storage for an object that is known not to outlive the block it is
+// created in, as found by the transpiler's escape analysis. The object
+// is created in the storage instead of on the heap, and shared
+// pointers to it work as usual. The storage holds a reference of its
+// own, so the object is destroyed, but never freed, when the last
+// pointer to it is gone. The storage must be declared before the
+// variable holding the pointer, so that it is destroyed after it.
+template<class T>
+class StackObject final
+{
+public:
+    // The object is placed as if allocated from a pool block.
+    alignas(16) uint8_t m_buf[2 * sizeof(uint64_t) + sizeof(T)];
+
+    StackObject() noexcept
+    {
+        count() = 0;
+    }
+
+    ~StackObject()
+    {
+        if (count() == 0) {
+            return;
+        }
+
+        count() -= 1;
+
+#if !defined(MYS_UNSAFE)
+        if (count() != 0) {
+            print_traceback();
+            std::cerr << "\nPanic(message=\"Stack object still referenced.\")\n";
+            abort();
+        }
+#endif
+    }
+
+    uint32_t& count() noexcept
+    {
+        return ((uint32_t *)&m_buf[sizeof(uint64_t)])[0];
+    }
+
+    template<class... Args>
+    shared_ptr<T> make(Args&&... args)
+    {
+        shared_ptr<T> p;
+
+        new(&m_buf[2 * sizeof(uint64_t)]) T(std::forward<Args>(args)...);
+        p.m_buf_p = &m_buf[sizeof(uint64_t)];
+        p.count() = 2;
+        p.object_count() = 1;
+        INCREMENT_NUMBER_OF_STACK_OBJECTS;
+
+        return p;
+    }
+};
+
 template<class T, class U>
 shared_ptr<T> dynamic_pointer_cast(const shared_ptr<U>& ptr)
 {
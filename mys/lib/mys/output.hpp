@@ -0,0 +1,36 @@
+#pragma once
+
+#include <streambuf>
+
+namespace mys {
+
+// Standard output buffer, installed in std::cout. Output is written
+// to the file descriptor when the buffer is full or flushed, which
+// makes printing large outputs to pipes and files cheap. Output is
+// also written after each newline if the file descriptor is a
+// terminal, so interactive output is not delayed.
+class OutputBuffer final : public std::streambuf
+{
+public:
+    OutputBuffer(int fd);
+
+protected:
+    int_type overflow(int_type ch) override;
+    std::streamsize xsputn(const char *buf_p, std::streamsize size) override;
+    int sync() override;
+
+private:
+    static const size_t SIZE = 65536;
+
+    int m_fd;
+    bool m_is_tty;
+    char m_buf[SIZE];
+
+    void set_put_position(char *position_p);
+    bool flush_buffer();
+    bool write_all(const char *buf_p, size_t size);
+};
+
+void output_init();
+
+}
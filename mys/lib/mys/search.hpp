@@ -0,0 +1,436 @@
+#pragma once
+
+#include <cstring>
+#if defined(__SSE2__)
+#include <immintrin.h>
+#endif
+#include "common.hpp"
+#include "types/number.hpp"
+
+namespace mys {
+
+// Index of the first given value in given data, or -1 if not found.
+static inline i64 find_value(const u8 *data_p, size_t size, u32 value)
+{
+    if (value > 0xff) {
+        return -1;
+    }
+
+    const void *found_p = std::memchr(data_p, value, size);
+
+    if (found_p == nullptr) {
+        return -1;
+    }
+
+    return (const u8 *)found_p - data_p;
+}
+
+static inline i64 find_value(const u32 *data_p, size_t size, u32 value)
+{
+    size_t i = 0;
+
+#if defined(__SSE2__)
+    __m128i value_128 = _mm_set1_epi32(value);
+
+    for (; i + 4 <= size; i += 4) {
+        __m128i chunk = _mm_loadu_si128((const __m128i *)&data_p[i]);
+        u32 mask = _mm_movemask_ps(_mm_castsi128_ps(_mm_cmpeq_epi32(chunk, value_128)));
+
+        if (mask != 0) {
+            return i + __builtin_ctz(mask);
+        }
+    }
+#endif
+
+    for (; i < size; i++) {
+        if (data_p[i] == value) {
+            return i;
+        }
+    }
+
+    return -1;
+}
+
+// Index of the last given value in given data, or -1 if not found.
+static inline i64 find_value_reverse(const u8 *data_p, size_t size, u32 value)
+{
+    if (value > 0xff) {
+        return -1;
+    }
+
+#if defined(__SSE2__)
+    __m128i value_128 = _mm_set1_epi8(value);
+
+    for (; size >= 16; size -= 16) {
+        __m128i chunk = _mm_loadu_si128((const __m128i *)&data_p[size - 16]);
+        u32 mask = _mm_movemask_epi8(_mm_cmpeq_epi8(chunk, value_128));
+
+        if (mask != 0) {
+            return size - 16 + 31 - __builtin_clz(mask);
+        }
+    }
+#endif
+
+    while (size > 0) {
+        size--;
+
+        if (data_p[size] == value) {
+            return size;
+        }
+    }
+
+    return -1;
+}
+
+static inline i64 find_value_reverse(const u32 *data_p, size_t size, u32 value)
+{
+#if defined(__SSE2__)
+    __m128i value_128 = _mm_set1_epi32(value);
+
+    for (; size >= 4; size -= 4) {
+        __m128i chunk = _mm_loadu_si128((const __m128i *)&data_p[size - 4]);
+        u32 mask = _mm_movemask_ps(_mm_castsi128_ps(_mm_cmpeq_epi32(chunk, value_128)));
+
+        if (mask != 0) {
+            return size - 4 + 31 - __builtin_clz(mask);
+        }
+    }
+#endif
+
+    while (size > 0) {
+        size--;
+
+        if (data_p[size] == value) {
+            return size;
+        }
+    }
+
+    return -1;
+}
+
+#if defined(__SSE2__)
+static inline __m128i simd_broadcast(const u8 *, u32 value)
+{
+    return _mm_set1_epi8(value);
+}
+
+static inline __m128i simd_broadcast(const u32 *, u32 value)
+{
+    return _mm_set1_epi32(value);
+}
+
+// One bit per value; 16 bits for bytes and 4 bits for UCS-4
+// characters.
+static inline u32 simd_equal_mask(const u8 *data_p, __m128i value)
+{
+    return _mm_movemask_epi8(
+        _mm_cmpeq_epi8(_mm_loadu_si128((const __m128i *)data_p), value));
+}
+
+static inline u32 simd_equal_mask(const u32 *data_p, __m128i value)
+{
+    return _mm_movemask_ps(_mm_castsi128_ps(
+        _mm_cmpeq_epi32(_mm_loadu_si128((const __m128i *)data_p), value)));
+}
+#endif
+
+// Finds a needle in haystacks. Single characters are found with
+// find_value(). With SSE2, longer needles are found by comparing
+// their first and last characters at 16 bytes worth of positions at
+// a time, and the rest of the needle only where both are equal.
+// Without SSE2, short needles are found by their first (or last)
+// character and longer needles with Boyer-Moore-Horspool. The skip
+// table of Boyer-Moore-Horspool is indexed by the low byte of
+// characters, which only makes shifts shorter for characters above
+// 0xff. The needle must outlive the searcher.
+template<typename N>
+class Searcher {
+public:
+    // Shorter needles are found by their first (or last) character.
+    static const size_t SKIP_TABLE_MIN_SIZE = 4;
+
+    const N *m_needle_p;
+    size_t m_size;
+    bool m_reverse;
+#if !defined(__SSE2__)
+    size_t m_skip[256];
+#endif
+
+    Searcher(const N *needle_p, size_t size, bool reverse = false) :
+        m_needle_p(needle_p),
+        m_size(size),
+        m_reverse(reverse)
+    {
+#if !defined(__SSE2__)
+        if (size < SKIP_TABLE_MIN_SIZE) {
+            return;
+        }
+
+        for (size_t i = 0; i < 256; i++) {
+            m_skip[i] = size;
+        }
+
+        if (reverse) {
+            for (size_t i = size - 1; i > 0; i--) {
+                m_skip[needle_p[i] & 0xff] = i;
+            }
+        } else {
+            for (size_t i = 0; i < size - 1; i++) {
+                m_skip[needle_p[i] & 0xff] = size - 1 - i;
+            }
+        }
+#endif
+    }
+
+    // Index of the first (or last if reverse) occurrence of the needle
+    // in given haystack, or -1 if not found. An empty needle is found
+    // at the beginning (or end if reverse).
+    template<typename H>
+    i64 find(const H *haystack_p, size_t size) const
+    {
+        if (m_size == 0) {
+            return m_reverse ? size : 0;
+        }
+
+        if (m_size > size) {
+            return -1;
+        }
+
+        if (m_size == 1) {
+            if (m_reverse) {
+                return find_value_reverse(haystack_p, size, m_needle_p[0]);
+            } else {
+                return find_value(haystack_p, size, m_needle_p[0]);
+            }
+        }
+
+#if defined(__SSE2__)
+        if (m_reverse) {
+            return find_simd_reverse(haystack_p, size);
+        } else {
+            return find_simd(haystack_p, size);
+        }
+#else
+        if (m_reverse) {
+            if (m_size < SKIP_TABLE_MIN_SIZE) {
+                return find_by_last(haystack_p, size);
+            } else {
+                return find_horspool_reverse(haystack_p, size);
+            }
+        } else {
+            if (m_size < SKIP_TABLE_MIN_SIZE) {
+                return find_by_first(haystack_p, size);
+            } else {
+                return find_horspool(haystack_p, size);
+            }
+        }
+#endif
+    }
+
+private:
+    template<typename H>
+    static bool is_equal(const H *haystack_p, const N *needle_p, size_t size)
+    {
+        if constexpr (sizeof(H) == sizeof(N)) {
+            return std::memcmp(haystack_p, needle_p, size * sizeof(N)) == 0;
+        } else {
+            for (size_t i = 0; i < size; i++) {
+                if ((u32)haystack_p[i] != (u32)needle_p[i]) {
+                    return false;
+                }
+            }
+
+            return true;
+        }
+    }
+
+    // True if the needle is at given position, given that its first
+    // and last characters are.
+    template<typename H>
+    bool is_match(const H *haystack_p) const
+    {
+        return is_equal(&haystack_p[1], &m_needle_p[1], m_size - 2);
+    }
+
+#if defined(__SSE2__)
+    template<typename H>
+    i64 find_simd(const H *haystack_p, size_t size) const
+    {
+        const size_t lanes = 16 / sizeof(H);
+        size_t last = size - m_size;
+        size_t pos = 0;
+        u32 first_ch = m_needle_p[0];
+        u32 last_ch = m_needle_p[m_size - 1];
+        __m128i first = simd_broadcast(haystack_p, first_ch);
+        __m128i last_ = simd_broadcast(haystack_p, last_ch);
+        u32 mask;
+        size_t index;
+
+        for (; pos + lanes <= last + 1; pos += lanes) {
+            mask = (simd_equal_mask(&haystack_p[pos], first)
+                    & simd_equal_mask(&haystack_p[pos + m_size - 1], last_));
+
+            while (mask != 0) {
+                index = pos + __builtin_ctz(mask);
+
+                if (is_match(&haystack_p[index])) {
+                    return index;
+                }
+
+                mask &= (mask - 1);
+            }
+        }
+
+        for (; pos <= last; pos++) {
+            if (((u32)haystack_p[pos] == first_ch)
+                && ((u32)haystack_p[pos + m_size - 1] == last_ch)
+                && is_match(&haystack_p[pos])) {
+                return pos;
+            }
+        }
+
+        return -1;
+    }
+
+    template<typename H>
+    i64 find_simd_reverse(const H *haystack_p, size_t size) const
+    {
+        const size_t lanes = 16 / sizeof(H);
+        // Positions [0, end) are left to search.
+        size_t end = size - m_size + 1;
+        u32 first_ch = m_needle_p[0];
+        u32 last_ch = m_needle_p[m_size - 1];
+        __m128i first = simd_broadcast(haystack_p, first_ch);
+        __m128i last_ = simd_broadcast(haystack_p, last_ch);
+        u32 mask;
+        size_t index;
+
+        for (; end >= lanes; end -= lanes) {
+            size_t pos = end - lanes;
+
+            mask = (simd_equal_mask(&haystack_p[pos], first)
+                    & simd_equal_mask(&haystack_p[pos + m_size - 1], last_));
+
+            while (mask != 0) {
+                u32 bit = 31 - __builtin_clz(mask);
+                index = pos + bit;
+
+                if (is_match(&haystack_p[index])) {
+                    return index;
+                }
+
+                mask &= ~(1u << bit);
+            }
+        }
+
+        while (end > 0) {
+            end--;
+
+            if (((u32)haystack_p[end] == first_ch)
+                && ((u32)haystack_p[end + m_size - 1] == last_ch)
+                && is_match(&haystack_p[end])) {
+                return end;
+            }
+        }
+
+        return -1;
+    }
+#else
+    template<typename H>
+    i64 find_by_first(const H *haystack_p, size_t size) const
+    {
+        size_t last = size - m_size;
+        size_t pos = 0;
+        i64 index;
+
+        while (pos <= last) {
+            index = find_value(&haystack_p[pos], last - pos + 1, m_needle_p[0]);
+
+            if (index == -1) {
+                break;
+            }
+
+            pos += index;
+
+            if (is_equal(&haystack_p[pos + 1], &m_needle_p[1], m_size - 1)) {
+                return pos;
+            }
+
+            pos++;
+        }
+
+        return -1;
+    }
+
+    template<typename H>
+    i64 find_by_last(const H *haystack_p, size_t size) const
+    {
+        size_t end = size - m_size + 1;
+        i64 index;
+
+        while (end > 0) {
+            index = find_value_reverse(&haystack_p[0], end, m_needle_p[0]);
+
+            if (index == -1) {
+                break;
+            }
+
+            if (is_equal(&haystack_p[index + 1], &m_needle_p[1], m_size - 1)) {
+                return index;
+            }
+
+            end = index;
+        }
+
+        return -1;
+    }
+
+    template<typename H>
+    i64 find_horspool(const H *haystack_p, size_t size) const
+    {
+        u32 last = m_needle_p[m_size - 1];
+        size_t pos = 0;
+        u32 ch;
+
+        while (pos <= size - m_size) {
+            ch = haystack_p[pos + m_size - 1];
+
+            if ((ch == last) && is_equal(&haystack_p[pos], m_needle_p, m_size - 1)) {
+                return pos;
+            }
+
+            pos += m_skip[ch & 0xff];
+        }
+
+        return -1;
+    }
+
+    template<typename H>
+    i64 find_horspool_reverse(const H *haystack_p, size_t size) const
+    {
+        u32 first = m_needle_p[0];
+        size_t pos = size - m_size;
+        size_t skip;
+        u32 ch;
+
+        while (true) {
+            ch = haystack_p[pos];
+
+            if ((ch == first)
+                && is_equal(&haystack_p[pos + 1], &m_needle_p[1], m_size - 1)) {
+                return pos;
+            }
+
+            skip = m_skip[ch & 0xff];
+
+            if (skip > pos) {
+                return -1;
+            }
+
+            pos -= skip;
+        }
+    }
+#endif
+};
+
+}
@@ -2,6 +2,7 @@
 
 #include "../common.hpp"
 #include "number.hpp"
+#include "bool.hpp"
 
 namespace mys {
 
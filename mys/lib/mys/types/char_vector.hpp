@@ -0,0 +1,773 @@
+#pragma once
+
+#include <algorithm>
+#include <cstring>
+#include <iterator>
+#include "../common.hpp"
+#include "../hash.hpp"
+#include "../memory.hpp"
+#include "../search.hpp"
+#include "../utf8.hpp"
+#include "number.hpp"
+#include "char.hpp"
+
+namespace mys {
+
+// Bytes stored in the object itself as long as they fit, so that
+// short strings need no heap allocation besides the object holding
+// them. The bytes may also be borrowed from someone else, in which
+// case they are copied before the vector grows.
+class Latin1Vector final {
+public:
+    static const size_t INLINE_SIZE = 16;
+
+    u8 *m_data_p;
+    size_t m_size;
+    size_t m_capacity;
+    u8 m_inline[INLINE_SIZE];
+
+    Latin1Vector() : m_data_p(m_inline), m_size(0), m_capacity(INLINE_SIZE)
+    {
+    }
+
+    Latin1Vector(const Latin1Vector& other) : Latin1Vector()
+    {
+        append(other.begin(), other.end());
+    }
+
+    Latin1Vector(Latin1Vector&& other) : Latin1Vector()
+    {
+        *this = std::move(other);
+    }
+
+    ~Latin1Vector()
+    {
+        reset();
+    }
+
+    Latin1Vector& operator=(const Latin1Vector& other)
+    {
+        if (this != &other) {
+            clear();
+            append(other.begin(), other.end());
+        }
+
+        return *this;
+    }
+
+    Latin1Vector& operator=(Latin1Vector&& other)
+    {
+        if (this == &other) {
+            return *this;
+        }
+
+        if (other.is_inline()) {
+            clear();
+            append(other.begin(), other.end());
+        } else {
+            reset();
+            m_data_p = other.m_data_p;
+            m_size = other.m_size;
+            m_capacity = other.m_capacity;
+            other.m_data_p = other.m_inline;
+            other.m_capacity = INLINE_SIZE;
+        }
+
+        other.m_size = 0;
+
+        return *this;
+    }
+
+    u8 *data()
+    {
+        return m_data_p;
+    }
+
+    const u8 *data() const
+    {
+        return m_data_p;
+    }
+
+    size_t size() const
+    {
+        return m_size;
+    }
+
+    const u8 *begin() const
+    {
+        return m_data_p;
+    }
+
+    const u8 *end() const
+    {
+        return m_data_p + m_size;
+    }
+
+    u8 operator[](size_t index) const
+    {
+        return m_data_p[index];
+    }
+
+    void reserve(size_t capacity)
+    {
+        if (capacity <= m_capacity) {
+            return;
+        }
+
+        capacity = std::max(capacity, 2 * m_capacity);
+        u8 *data_p = new u8[capacity];
+        std::memcpy(data_p, m_data_p, m_size);
+
+        if (is_allocated()) {
+            delete[] m_data_p;
+        }
+
+        m_data_p = data_p;
+        m_capacity = capacity;
+    }
+
+    void push_back(u8 value)
+    {
+        if (m_size >= m_capacity) {
+            reserve(m_size + 1);
+        }
+
+        m_data_p[m_size++] = value;
+    }
+
+    template<typename T>
+    void append(const T *first_p, const T *last_p)
+    {
+        size_t size = last_p - first_p;
+
+        reserve(m_size + size);
+
+        if constexpr (sizeof(T) == 1) {
+            std::memcpy(&m_data_p[m_size], first_p, size);
+        } else {
+            std::copy(first_p, last_p, &m_data_p[m_size]);
+        }
+
+        m_size += size;
+    }
+
+    void clear()
+    {
+        if (is_borrowed()) {
+            m_data_p = m_inline;
+            m_capacity = INLINE_SIZE;
+        }
+
+        m_size = 0;
+    }
+
+    // Clear and free any heap allocated memory.
+    void reset()
+    {
+        if (is_allocated()) {
+            delete[] m_data_p;
+        }
+
+        m_data_p = m_inline;
+        m_capacity = INLINE_SIZE;
+        m_size = 0;
+    }
+
+    // Use given bytes instead of own bytes. The bytes must not change
+    // as long as they are borrowed.
+    void borrow(const u8 *data_p, size_t size)
+    {
+        reset();
+        m_data_p = (u8 *)data_p;
+        m_size = size;
+        m_capacity = 0;
+    }
+
+    bool is_borrowed() const
+    {
+        return m_capacity == 0;
+    }
+
+    // Copy borrowed bytes, if any, to own memory.
+    void unborrow()
+    {
+        if (is_borrowed()) {
+            const u8 *data_p = m_data_p;
+            size_t size = m_size;
+
+            clear();
+            append(data_p, data_p + size);
+        }
+    }
+
+    bool operator==(const Latin1Vector& other) const
+    {
+        return ((m_size == other.m_size)
+                && (std::memcmp(m_data_p, other.m_data_p, m_size) == 0));
+    }
+
+    bool operator<(const Latin1Vector& other) const
+    {
+        int res = std::memcmp(m_data_p, other.m_data_p, std::min(m_size, other.m_size));
+
+        if (res != 0) {
+            return res < 0;
+        }
+
+        return m_size < other.m_size;
+    }
+
+private:
+    bool is_inline() const
+    {
+        return m_data_p == m_inline;
+    }
+
+    bool is_allocated() const
+    {
+        return !is_inline() && !is_borrowed();
+    }
+};
+
+// The characters of a string, in the spirit of PEP 393. Characters
+// are stored with one byte each (Latin-1) as long as all of them fit,
+// and with four bytes each (UCS-4) otherwise. A vector is only wide
+// if at least one of its characters does not fit in one byte, so
+// vectors of different widths are never equal.
+//
+// Characters can only be added at the end. Their hash is calculated
+// when first needed and then cached until the characters are
+// modified.
+//
+// A vector may be a view of Latin-1 characters of another vector,
+// see view(), which are copied when the view is modified. A view
+// keeps all characters of the other vector alive.
+class CharVector final {
+public:
+    // Read only random access iterator.
+    class const_iterator {
+    public:
+        using iterator_category = std::random_access_iterator_tag;
+        using value_type = Char;
+        using difference_type = std::ptrdiff_t;
+        using pointer = void;
+        using reference = Char;
+
+        const CharVector *m_vector_p;
+        size_t m_index;
+
+        const_iterator() : m_vector_p(nullptr), m_index(0)
+        {
+        }
+
+        const_iterator(const CharVector *vector_p, size_t index) :
+            m_vector_p(vector_p),
+            m_index(index)
+        {
+        }
+
+        Char operator*() const
+        {
+            return (*m_vector_p)[m_index];
+        }
+
+        Char operator[](difference_type offset) const
+        {
+            return (*m_vector_p)[m_index + offset];
+        }
+
+        const_iterator& operator++()
+        {
+            m_index++;
+
+            return *this;
+        }
+
+        const_iterator operator++(int)
+        {
+            const_iterator it = *this;
+
+            m_index++;
+
+            return it;
+        }
+
+        const_iterator& operator--()
+        {
+            m_index--;
+
+            return *this;
+        }
+
+        const_iterator operator--(int)
+        {
+            const_iterator it = *this;
+
+            m_index--;
+
+            return it;
+        }
+
+        const_iterator& operator+=(difference_type offset)
+        {
+            m_index += offset;
+
+            return *this;
+        }
+
+        const_iterator& operator-=(difference_type offset)
+        {
+            m_index -= offset;
+
+            return *this;
+        }
+
+        const_iterator operator+(difference_type offset) const
+        {
+            return const_iterator(m_vector_p, m_index + offset);
+        }
+
+        const_iterator operator-(difference_type offset) const
+        {
+            return const_iterator(m_vector_p, m_index - offset);
+        }
+
+        difference_type operator-(const const_iterator& other) const
+        {
+            return (difference_type)m_index - (difference_type)other.m_index;
+        }
+
+        bool operator==(const const_iterator& other) const
+        {
+            return m_index == other.m_index;
+        }
+
+        bool operator!=(const const_iterator& other) const
+        {
+            return m_index != other.m_index;
+        }
+
+        bool operator<(const const_iterator& other) const
+        {
+            return m_index < other.m_index;
+        }
+
+        bool operator>(const const_iterator& other) const
+        {
+            return m_index > other.m_index;
+        }
+
+        bool operator<=(const const_iterator& other) const
+        {
+            return m_index <= other.m_index;
+        }
+
+        bool operator>=(const const_iterator& other) const
+        {
+            return m_index >= other.m_index;
+        }
+    };
+
+    using iterator = const_iterator;
+    using const_reverse_iterator = std::reverse_iterator<const_iterator>;
+    using reverse_iterator = const_reverse_iterator;
+
+    // Used when not wide.
+    Latin1Vector m_latin1;
+    // Used when wide. Also used as a cache of the characters in UCS-4
+    // when not wide, see ucs4().
+    std::vector<u32> m_ucs4;
+    bool m_is_wide = false;
+    // Zero if not yet calculated.
+    size_t m_hash = 0;
+    // The vector owning the borrowed characters if a view.
+    mys::shared_ptr<CharVector> m_owner;
+
+    CharVector()
+    {
+    }
+
+    CharVector(std::initializer_list<Char> il)
+    {
+        reserve(il.size());
+
+        for (auto ch : il) {
+            push_back(ch);
+        }
+    }
+
+    CharVector(const CharVector& other) :
+        m_latin1(other.m_latin1),
+        m_is_wide(other.m_is_wide)
+    {
+        if (m_is_wide) {
+            m_ucs4 = other.m_ucs4;
+        }
+    }
+
+    CharVector(CharVector&& other) = default;
+
+    CharVector(const CharVector& other, size_t begin, size_t end)
+    {
+        append(other, begin, end);
+    }
+
+    CharVector& operator=(const CharVector& other)
+    {
+        if (this != &other) {
+            clear();
+            append(other);
+        }
+
+        return *this;
+    }
+
+    CharVector& operator=(CharVector&& other) = default;
+
+    size_t size() const
+    {
+        if (m_is_wide) {
+            return m_ucs4.size();
+        } else {
+            return m_latin1.size();
+        }
+    }
+
+    bool empty() const
+    {
+        return size() == 0;
+    }
+
+    bool is_wide() const
+    {
+        return m_is_wide;
+    }
+
+    Char operator[](size_t index) const
+    {
+        if (m_is_wide) {
+            return Char(m_ucs4[index]);
+        } else {
+            return Char(m_latin1[index]);
+        }
+    }
+
+    const_iterator begin() const
+    {
+        return const_iterator(this, 0);
+    }
+
+    const_iterator end() const
+    {
+        return const_iterator(this, size());
+    }
+
+    const_reverse_iterator rbegin() const
+    {
+        return const_reverse_iterator(end());
+    }
+
+    const_reverse_iterator rend() const
+    {
+        return const_reverse_iterator(begin());
+    }
+
+    // Characters if not wide.
+    const u8 *latin1() const
+    {
+        return m_latin1.data();
+    }
+
+    // Characters in UCS-4, for example for PCRE2. Converted and cached
+    // if not wide.
+    const u32 *ucs4()
+    {
+        if (!m_is_wide && m_ucs4.size() != m_latin1.size()) {
+            m_ucs4.assign(m_latin1.begin(), m_latin1.end());
+        }
+
+        return m_ucs4.data();
+    }
+
+    // True if all characters are ASCII. Always false if wide.
+    bool is_ascii() const
+    {
+        if (m_is_wide) {
+            return false;
+        }
+
+        return ascii_length(m_latin1.data(), m_latin1.size()) == m_latin1.size();
+    }
+
+    void reserve(size_t size)
+    {
+        if (m_is_wide) {
+            m_ucs4.reserve(size);
+        } else {
+            unborrow();
+            m_latin1.reserve(size);
+        }
+    }
+
+    // Reserve space for given number of characters. The vector is
+    // widened first if any of the characters will be wide, so that
+    // they are not converted later.
+    void reserve(size_t size, bool is_wide)
+    {
+        if (is_wide && !m_is_wide) {
+            modified();
+            widen();
+        }
+
+        reserve(size);
+    }
+
+    void clear()
+    {
+        m_latin1.clear();
+        m_ucs4.clear();
+        m_is_wide = false;
+        m_hash = 0;
+        m_owner = nullptr;
+    }
+
+    // Characters [begin, end) of given vector. Latin-1 characters
+    // that do not fit in the vector object itself are borrowed from
+    // given vector instead of copied.
+    static mys::shared_ptr<CharVector> view(const mys::shared_ptr<CharVector>& chars,
+                                            size_t begin,
+                                            size_t end)
+    {
+        auto res = mys::make_shared<CharVector>();
+
+        if (begin >= end) {
+            return res;
+        }
+
+        if (!chars->m_is_wide && (end - begin > Latin1Vector::INLINE_SIZE)) {
+            res->m_latin1.borrow(chars->m_latin1.data() + begin, end - begin);
+            res->m_owner = chars->m_owner ? chars->m_owner : chars;
+        } else {
+            res->append(*chars, begin, end);
+        }
+
+        return res;
+    }
+
+    void push_back(const Char& ch)
+    {
+        modified();
+
+        if (m_is_wide) {
+            m_ucs4.push_back(ch.m_value);
+        } else if (fits_latin1(ch.m_value)) {
+            m_latin1.push_back(ch.m_value);
+        } else {
+            widen();
+            m_ucs4.push_back(ch.m_value);
+        }
+    }
+
+    // Append given Latin-1 characters.
+    void append(const u8 *first_p, const u8 *last_p)
+    {
+        if (first_p == last_p) {
+            return;
+        }
+
+        modified();
+
+        if (m_is_wide) {
+            m_ucs4.insert(m_ucs4.end(), first_p, last_p);
+        } else {
+            m_latin1.append(first_p, last_p);
+        }
+    }
+
+    // Append given characters.
+    void append(const u32 *first_p, const u32 *last_p)
+    {
+        if (first_p == last_p) {
+            return;
+        }
+
+        modified();
+
+        if (m_is_wide) {
+            m_ucs4.insert(m_ucs4.end(), first_p, last_p);
+        } else if (std::all_of(first_p, last_p, fits_latin1)) {
+            m_latin1.append(first_p, last_p);
+        } else {
+            widen();
+            m_ucs4.insert(m_ucs4.end(), first_p, last_p);
+        }
+    }
+
+    // Append characters [begin, end) of given vector.
+    void append(const CharVector& other, size_t begin, size_t end)
+    {
+        if (begin >= end) {
+            return;
+        }
+
+        if (other.m_is_wide) {
+            append(other.m_ucs4.data() + begin, other.m_ucs4.data() + end);
+        } else {
+            append(other.m_latin1.data() + begin, other.m_latin1.data() + end);
+        }
+    }
+
+    void append(const CharVector& other)
+    {
+        append(other, 0, other.size());
+    }
+
+    bool operator==(const CharVector& other) const
+    {
+        if (m_is_wide != other.m_is_wide) {
+            return false;
+        }
+
+        if (m_is_wide) {
+            return m_ucs4 == other.m_ucs4;
+        } else {
+            return m_latin1 == other.m_latin1;
+        }
+    }
+
+    bool operator!=(const CharVector& other) const
+    {
+        return !(*this == other);
+    }
+
+    bool operator<(const CharVector& other) const
+    {
+        if (!m_is_wide && !other.m_is_wide) {
+            return m_latin1 < other.m_latin1;
+        }
+
+        return std::lexicographical_compare(begin(), end(),
+                                            other.begin(), other.end());
+    }
+
+    // Index of the first occurrence of given characters in [begin,
+    // end), or -1 if not found.
+    i64 find(const CharVector& sub, size_t begin, size_t end) const
+    {
+        return visit(sub, [&](auto data_p, auto sub_p) -> i64 {
+            Searcher searcher(sub_p, sub.size());
+            i64 index = searcher.find(data_p + begin, end - begin);
+
+            return (index == -1) ? -1 : begin + index;
+        });
+    }
+
+    // Index of the last occurrence of given characters in [begin,
+    // end), or -1 if not found.
+    i64 find_reverse(const CharVector& sub, size_t begin, size_t end) const
+    {
+        return visit(sub, [&](auto data_p, auto sub_p) -> i64 {
+            Searcher searcher(sub_p, sub.size(), true);
+            i64 index = searcher.find(data_p + begin, end - begin);
+
+            return (index == -1) ? -1 : begin + index;
+        });
+    }
+
+    // Call given function with the index of each non-overlapping
+    // occurrence of given non-empty characters in [begin, end), from
+    // the beginning. The searcher is only created once.
+    template<typename Function>
+    void find_all(const CharVector& sub, size_t begin, size_t end, Function function) const
+    {
+        visit(sub, [&](auto data_p, auto sub_p) -> i64 {
+            Searcher searcher(sub_p, sub.size());
+            i64 index;
+
+            while (begin < end) {
+                index = searcher.find(data_p + begin, end - begin);
+
+                if (index == -1) {
+                    break;
+                }
+
+                function(begin + index);
+                begin += index + sub.size();
+            }
+
+            return 0;
+        });
+    }
+
+    size_t hash()
+    {
+        if (m_hash == 0) {
+            if (m_is_wide) {
+                m_hash = hash_bytes(m_ucs4.data(), m_ucs4.size() * sizeof(u32));
+            } else {
+                m_hash = hash_bytes(m_latin1.data(), m_latin1.size());
+            }
+
+            if (m_hash == 0) {
+                m_hash = 1;
+            }
+        }
+
+        return m_hash;
+    }
+
+private:
+    static bool fits_latin1(u32 value)
+    {
+        return value <= 0xff;
+    }
+
+    // Call given function with pointers to the characters of this and
+    // given vector.
+    template<typename Function>
+    i64 visit(const CharVector& other, Function function) const
+    {
+        if (m_is_wide) {
+            if (other.m_is_wide) {
+                return function(m_ucs4.data(), other.m_ucs4.data());
+            } else {
+                return function(m_ucs4.data(), other.m_latin1.data());
+            }
+        } else {
+            if (other.m_is_wide) {
+                // Wide characters are never found among Latin-1
+                // characters.
+                return -1;
+            } else {
+                return function(m_latin1.data(), other.m_latin1.data());
+            }
+        }
+    }
+
+    void unborrow()
+    {
+        if (m_owner) {
+            m_latin1.unborrow();
+            m_owner = nullptr;
+        }
+    }
+
+    void modified()
+    {
+        m_hash = 0;
+        unborrow();
+
+        if (!m_is_wide && !m_ucs4.empty()) {
+            std::vector<u32>().swap(m_ucs4);
+        }
+    }
+
+    void widen()
+    {
+        m_ucs4.assign(m_latin1.begin(), m_latin1.end());
+        m_latin1.reset();
+        m_is_wide = true;
+    }
+};
+
+}
@@ -0,0 +1,131 @@
+#pragma once
+
+#include "../common.hpp"
+#include "../errors/index.hpp"
+
+namespace mys {
+
+// A double ended queue in a ring buffer. Amortised O(1) push and pop
+// at both ends. The buffer size is always a power of two.
+template<typename T>
+class Deque final
+{
+public:
+    std::vector<T> m_buf;
+    size_t m_head;
+    size_t m_length;
+
+    Deque() : m_head(0), m_length(0)
+    {
+    }
+
+    i64 length() const
+    {
+        return m_length;
+    }
+
+    void clear()
+    {
+        m_buf.clear();
+        m_head = 0;
+        m_length = 0;
+    }
+
+    void push_back(const T& value)
+    {
+        if (m_length == m_buf.size()) {
+            grow();
+        }
+
+        m_buf[index(m_length)] = value;
+        m_length++;
+    }
+
+    void push_front(const T& value)
+    {
+        if (m_length == m_buf.size()) {
+            grow();
+        }
+
+        m_head = index(m_buf.size() - 1);
+        m_buf[m_head] = value;
+        m_length++;
+    }
+
+    T pop_front()
+    {
+        raise_if_empty();
+        T value = std::move(m_buf[m_head]);
+        // Release references as early as possible.
+        m_buf[m_head] = T();
+        m_head = index(1);
+        m_length--;
+
+        return value;
+    }
+
+    T pop_back()
+    {
+        raise_if_empty();
+        size_t i = index(m_length - 1);
+        T value = std::move(m_buf[i]);
+        m_buf[i] = T();
+        m_length--;
+
+        return value;
+    }
+
+    T& front()
+    {
+        raise_if_empty();
+
+        return m_buf[m_head];
+    }
+
+    T& back()
+    {
+        raise_if_empty();
+
+        return m_buf[index(m_length - 1)];
+    }
+
+    T& get(i64 pos)
+    {
+        if (pos < 0) {
+            pos += m_length;
+        }
+
+        if (pos < 0 || pos >= (i64)m_length) {
+            mys::make_shared<IndexError>("deque index out of range")->__throw();
+        }
+
+        return m_buf[index(pos)];
+    }
+
+private:
+    size_t index(size_t offset) const
+    {
+        return (m_head + offset) & (m_buf.size() - 1);
+    }
+
+    void raise_if_empty() const
+    {
+        if (m_length == 0) {
+            mys::make_shared<IndexError>("deque is empty")->__throw();
+        }
+    }
+
+    void grow()
+    {
+        std::vector<T> buf(m_buf.empty() ? 8 : 2 * m_buf.size());
+
+        for (size_t i = 0; i < m_length; i++) {
+            buf[i] = std::move(m_buf[index(i)]);
+        }
+
+        m_buf = std::move(buf);
+        m_head = 0;
+    }
+};
+
+}
@@ -10,32 +10,119 @@
 namespace mys {
 
 // Dicts.
+//
+// A compact hash table in the spirit of CPython's dict. Items are
+// stored in insertion order in a dense array, and a sparse table of
+// indexes into the dense array is used for lookups with open
+// addressing. Removed items are marked as deleted in the dense array
+// and are dropped when the table is resized. The number of used slots
+// in the sparse table never exceeds the number of entries in the
+// dense array, which is kept below two thirds of the table size, so
+// there is always an empty slot ending each probe sequence.
 template<typename TK, typename TV>
 class Dict final
 {
 public:
-    std::unordered_map<TK, TV> m_map;
+    struct Entry {
+        std::pair<TK, TV> item;
+        size_t hash;
+        bool is_deleted;
+    };
+
+    // Iterates over all items in insertion order.
+    class const_iterator {
+    public:
+        const Entry *m_entry_p;
+        const Entry *m_end_p;
+
+        const_iterator(const Entry *entry_p, const Entry *end_p)
+            : m_entry_p(entry_p), m_end_p(end_p)
+        {
+            skip_deleted();
+        }
+
+        const std::pair<TK, TV>& operator*() const
+        {
+            return m_entry_p->item;
+        }
+
+        const std::pair<TK, TV> *operator->() const
+        {
+            return &m_entry_p->item;
+        }
+
+        const_iterator& operator++()
+        {
+            m_entry_p++;
+            skip_deleted();
+
+            return *this;
+        }
+
+        bool operator==(const const_iterator& other) const
+        {
+            return m_entry_p == other.m_entry_p;
+        }
+
+        bool operator!=(const const_iterator& other) const
+        {
+            return m_entry_p != other.m_entry_p;
+        }
+
+    private:
+        void skip_deleted()
+        {
+            while ((m_entry_p != m_end_p) && m_entry_p->is_deleted) {
+                m_entry_p++;
+            }
+        }
+    };
 
-    Dict() : m_map(std::unordered_map<TK, TV>())
+    static constexpr u32 EMPTY = 0xffffffff;
+    static constexpr u32 DELETED = 0xfffffffe;
+
+    std::vector<Entry> m_entries;
+    std::vector<u32> m_indexes;
+    size_t m_length;
+
+    Dict() : m_length(0)
     {
     }
 
-    Dict(std::initializer_list<std::pair<TK, TV>> il)
+    Dict(std::initializer_list<std::pair<TK, TV>> il) : m_length(0)
     {
-        m_map.insert(il.begin(), il.end());
+        reserve(il.size());
+
+        for (const auto& [key, value] : il) {
+            __setitem__(key, value);
+        }
     }
 
     void __setitem__(const TK& key, const TV& value)
     {
-        m_map[key] = value;
+        size_t hash = std::hash<TK>()(key);
+        i64 index = lookup(key, hash);
+
+        if (index != -1) {
+            m_entries[index].item.second = value;
+        } else if (m_entries.size() < capacity()) {
+            insert(key, value, hash);
+        } else {
+            // Key and value may be items in this dict, and are copied
+            // before resizing.
+            TK key_copy = key;
+            TV value_copy = value;
+            resize(m_length + 1);
+            insert(key_copy, value_copy, hash);
+        }
     }
 
     const TV& get(const TK& key, const TV& default_value, bool insert_if_missing)
     {
-        auto it = m_map.find(key);
+        i64 index = find(key);
 
-        if (it != m_map.end()) {
-            return it->second;
+        if (index != -1) {
+            return m_entries[index].item.second;
         } else {
             if (insert_if_missing) {
                 __setitem__(key, default_value);
@@ -47,10 +134,10 @@ public:
 
     const TV& get(const TK& key, const TV& default_value)
     {
-        auto it = m_map.find(key);
+        i64 index = find(key);
 
-        if (it != m_map.end()) {
-            return it->second;
+        if (index != -1) {
+            return m_entries[index].item.second;
         } else {
             return default_value;
         }
@@ -58,78 +145,152 @@ public:
 
     const TV& get(const TK& key) const
     {
-        auto it = m_map.find(key);
+        i64 index = find(key);
 
-        if (it != m_map.end()) {
-            return it->second;
-        } else {
+        if (index == -1) {
             mys::make_shared<KeyError>("key does not exist")->__throw();
         }
+
+        return m_entries[index].item.second;
     }
 
     TV& get(const TK& key)
     {
-        auto it = m_map.find(key);
+        i64 index = find(key);
 
-        if (it != m_map.end()) {
-            return it->second;
-        } else {
+        if (index == -1) {
             mys::make_shared<KeyError>("key does not exist")->__throw();
         }
+
+        return m_entries[index].item.second;
     }
 
     mys::shared_ptr<List<TK>> keys() const
     {
         std::vector<TK> keys;
-        for (const auto& kv : m_map) {
-            keys.push_back(kv.first);
+        keys.reserve(m_length);
+
+        for (const auto& [key, value] : *this) {
+            keys.push_back(key);
         }
+
         return mys::make_shared<List<TK>>(keys);
     }
 
     mys::shared_ptr<List<TV>> values() const
     {
         std::vector<TV> values;
-        for (const auto& kv : m_map) {
-            values.push_back(kv.second);
+        values.reserve(m_length);
+
+        for (const auto& [key, value] : *this) {
+            values.push_back(value);
         }
+
         return mys::make_shared<List<TV>>(values);
     }
 
     TV pop(const TK& key, const TV& def)
     {
-        const auto& i = m_map.find(key);
-        TV value;
-        if (i == m_map.end()) {
-            value = def;
+        if (m_length == 0) {
+            return def;
         }
-        else {
-            value = i->second;
-            m_map.erase(i);
+
+        size_t slot = lookup_slot(key, std::hash<TK>()(key));
+        u32 index = m_indexes[slot];
+
+        if (index == EMPTY) {
+            return def;
         }
+
+        // The entry is kept, but its slot may be reused by another
+        // key. Its item is reset to release references as early as
+        // possible.
+        Entry& entry = m_entries[index];
+        TV value = std::move(entry.item.second);
+        entry.item = std::pair<TK, TV>();
+        entry.is_deleted = true;
+        m_indexes[slot] = DELETED;
+        m_length--;
+
         return value;
     }
 
     void clear()
     {
-        m_map.clear();
+        m_entries.clear();
+        m_indexes.clear();
+        m_length = 0;
     }
 
     void update(const mys::shared_ptr<Dict<TK, TV>>& other)
     {
-        for (const auto& i : other->m_map) {
-            m_map[i.first] = i.second;
+        if (other.get() == this) {
+            return;
+        }
+
+        reserve(m_length + other->m_length);
+
+        for (const auto& entry : other->m_entries) {
+            if (entry.is_deleted) {
+                continue;
+            }
+
+            i64 index = lookup(entry.item.first, entry.hash);
+
+            if (index != -1) {
+                m_entries[index].item.second = entry.item.second;
+            } else {
+                insert(entry.item.first, entry.item.second, entry.hash);
+            }
         }
     }
 
     i64 length() const
     {
-        return m_map.size();
+        return m_length;
     }
 
     bool __contains__(const TK& key) const
     {
-        return m_map.find(key) != m_map.end();
+        return find(key) != -1;
+    }
+
+    const_iterator begin() const
+    {
+        return const_iterator(m_entries.data(),
+                              m_entries.data() + m_entries.size());
+    }
+
+    const_iterator end() const
+    {
+        return const_iterator(m_entries.data() + m_entries.size(),
+                              m_entries.data() + m_entries.size());
+    }
+
+    // Advance given iterator in a for loop over the dict, which had
+    // given length when the loop started. Dicts must not be modified
+    // while iterated over, which is detected as a changed length or
+    // moved entries.
+    void next_in_loop(const_iterator& it, i64 length) const
+    {
+#if !defined(MYS_UNSAFE)
+        if (((i64)m_length != length)
+            || (it.m_end_p != m_entries.data() + m_entries.size())) {
+            print_traceback();
+            std::cerr << "\nPanic(message=\"Dict modified during iteration.\")\n";
+            abort();
+        }
+#endif
+
+        ++it;
+    }
+
+    // Make room for given number of items.
+    void reserve(size_t size)
+    {
+        if (m_entries.size() - m_length + size > capacity()) {
+            resize(size);
+        }
     }
 
     String __str__()
@@ -138,6 +299,150 @@ public:
         ss << *this;
         return String(ss.str().c_str());
     }
+
+    bool operator==(const Dict<TK, TV>& other) const
+    {
+        if (m_length != other.m_length) {
+            return false;
+        }
+
+        for (const auto& entry : m_entries) {
+            if (entry.is_deleted) {
+                continue;
+            }
+
+            i64 index = other.lookup(entry.item.first, entry.hash);
+
+            if (index == -1) {
+                return false;
+            }
+
+            if (!(other.m_entries[index].item.second == entry.item.second)) {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+private:
+    // Maximum number of entries, including deleted, before resizing.
+    size_t capacity() const
+    {
+        return 2 * m_indexes.size() / 3;
+    }
+
+    i64 find(const TK& key) const
+    {
+        if (m_length == 0) {
+            return -1;
+        }
+
+        return lookup(key, std::hash<TK>()(key));
+    }
+
+    // Returns the index of the entry with given key, or -1 if
+    // missing.
+    i64 lookup(const TK& key, size_t hash) const
+    {
+        if (m_indexes.empty()) {
+            return -1;
+        }
+
+        u32 index = m_indexes[lookup_slot(key, hash)];
+
+        if (index == EMPTY) {
+            return -1;
+        }
+
+        return index;
+    }
+
+    // Returns the slot of given key, or the empty slot ending the
+    // probe sequence if missing. Uses the same perturbed probing as
+    // CPython so that all bits of the hash take part, which is needed
+    // as integers hash to themselves.
+    size_t lookup_slot(const TK& key, size_t hash) const
+    {
+        size_t mask = m_indexes.size() - 1;
+        size_t perturb = hash;
+        size_t slot = hash & mask;
+
+        while (true) {
+            u32 index = m_indexes[slot];
+
+            if (index == EMPTY) {
+                return slot;
+            }
+
+            if (index != DELETED) {
+                const Entry& entry = m_entries[index];
+
+                if ((entry.hash == hash)
+                    && std::equal_to<TK>()(entry.item.first, key)) {
+                    return slot;
+                }
+            }
+
+            perturb >>= 5;
+            slot = (5 * slot + 1 + perturb) & mask;
+        }
+    }
+
+    // Insert given key, which must not be in the dict, without
+    // resizing.
+    void insert(const TK& key, const TV& value, size_t hash)
+    {
+        size_t mask = m_indexes.size() - 1;
+        size_t perturb = hash;
+        size_t slot = hash & mask;
+
+        while (m_indexes[slot] < DELETED) {
+            perturb >>= 5;
+            slot = (5 * slot + 1 + perturb) & mask;
+        }
+
+        m_indexes[slot] = m_entries.size();
+        m_entries.push_back(Entry{{key, value}, hash, false});
+        m_length++;
+    }
+
+    // Drop deleted entries and rebuild the index table with room for
+    // at least given number of items.
+    void resize(size_t size)
+    {
+        size_t indexes_size = 8;
+
+        while (2 * indexes_size / 3 < size) {
+            indexes_size *= 2;
+        }
+
+        if (m_length != m_entries.size()) {
+            auto it = std::remove_if(m_entries.begin(),
+                                     m_entries.end(),
+                                     [](const Entry& entry) {
+                                         return entry.is_deleted;
+                                     });
+            m_entries.erase(it, m_entries.end());
+        }
+
+        m_entries.reserve(2 * indexes_size / 3);
+        m_indexes.assign(indexes_size, EMPTY);
+        size_t mask = indexes_size - 1;
+
+        for (size_t index = 0; index < m_entries.size(); index++) {
+            size_t hash = m_entries[index].hash;
+            size_t perturb = hash;
+            size_t slot = hash & mask;
+
+            while (m_indexes[slot] != EMPTY) {
+                perturb >>= 5;
+                slot = (5 * slot + 1 + perturb) & mask;
+            }
+
+            m_indexes[slot] = index;
+        }
+    }
 };
 
 template<class TK, class TV> std::ostream&
@@ -148,10 +453,9 @@ operator<<(std::ostream& os, const Dict<TK, TV>& dict)
     os << "{";
     delim_p = "";
 
-    for (auto item = dict.m_map.begin();
-         item != dict.m_map.end();
-         item++, delim_p = ", ") {
-        os << delim_p << item->first << ": " << item->second;
+    for (const auto& [key, value] : dict) {
+        os << delim_p << key << ": " << value;
+        delim_p = ", ";
     }
 
     os << "}";
@@ -166,7 +470,7 @@ operator==(const mys::shared_ptr<Dict<TK, TV>>& a,
     if (!a && !b) {
         return true;
     } else {
-        return shared_ptr_not_none(a)->m_map == shared_ptr_not_none(b)->m_map;
+        return *shared_ptr_not_none(a) == *shared_ptr_not_none(b);
     }
 }
 
@@ -183,7 +487,7 @@ create_list_from_dict(const mys::shared_ptr<Dict<TK, TV>>& dict)
 {
     auto list = mys::make_shared<List<mys::shared_ptr<Tuple<TK, TV>>>>();
 
-    for (auto const& [key, value] : shared_ptr_not_none(dict)->m_map) {
+    for (const auto& [key, value] : *shared_ptr_not_none(dict)) {
         list->append(mys::make_shared<Tuple<TK, TV>>(key, value));
     }
 
@@ -81,6 +81,22 @@ public:
 #endif
     }
 
+    // Item at given index in a for loop over the list, which had
+    // given length when the loop started. Lists must not be modified
+    // while iterated over, which is detected as a changed length.
+    const T& get_in_loop(size_t index, size_t length) const
+    {
+#if !defined(MYS_UNSAFE)
+        if (m_list.size() != length) {
+            print_traceback();
+            std::cerr << "\nPanic(message=\"List modified during iteration.\")\n";
+            abort();
+        }
+#endif
+
+        return m_list[index];
+    }
+
     mys::shared_ptr<List<T>> slice(std::optional<i64> _begin,
                                    std::optional<i64> _end,
                                    i64 step)
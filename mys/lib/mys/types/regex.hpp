@@ -83,10 +83,29 @@ public:
     SharedList<String> groups() const;
 };
 
+// A compiled regex, shared by all regex objects created from the same
+// pattern and flags, and by their matches. The pattern is JIT compiled
+// if supported by PCRE2.
+class CompiledRegex final
+{
+public:
+    pcre2_code *m_code_p;
+    bool m_is_jit_compiled;
+    // Match data not used by any match, reused by the next match to
+    // avoid an allocation per match.
+    pcre2_match_data *m_match_data_p;
+
+    CompiledRegex(pcre2_code *code_p);
+    ~CompiledRegex();
+    pcre2_match_data *take_match_data();
+    void give_back_match_data(pcre2_match_data *match_data_p);
+    pcre2_match_context *match_context() const;
+};
+
 class Regex final
 {
 public:
-    std::shared_ptr<pcre2_code> m_compiled;
+    std::shared_ptr<CompiledRegex> m_compiled;
 
     static String get_error(int error);
     Regex() : m_compiled(nullptr) {};
@@ -94,6 +113,63 @@ public:
     RegexMatch match(const String& string) const;
     String replace(const String& subject, const String& replacement, int flags = 0) const;
     mys::shared_ptr<List<String>> split(const String& string) const;
+    mys::shared_ptr<List<RegexMatch>> find_all(const String& string) const;
+    int find(PCRE2_SPTR subject,
+             PCRE2_SIZE length,
+             PCRE2_SIZE& offset,
+             bool& is_previous_match_empty,
+             pcre2_match_data *match_data_p) const;
+    RegexMatch make_match(pcre2_match_data *match_data_p,
+                          const String& string) const;
+};
+
+// Finds matches one at a time, each starting where the previous match
+// ended. For loops over Regex.find_all() use it to not create a list
+// of all matches.
+class RegexMatchIterator final
+{
+public:
+    Regex m_regex;
+    String m_string;
+    PCRE2_SIZE m_offset;
+    bool m_is_previous_match_empty;
+
+    RegexMatchIterator(const Regex& regex, const String& string)
+        : m_regex(regex),
+          m_string(string),
+          m_offset(0),
+          m_is_previous_match_empty(false)
+    {
+    }
+
+    // Returns the next match, or None if there are no more matches.
+    RegexMatch next();
+};
+
+// A regex literal, compiled when first used. Literals are module
+// constants, and compiling them when the program is loaded would both
+// slow down the start of all programs and raise errors for invalid
+// literals outside of any try block.
+class RegexLiteral final
+{
+public:
+    String m_regex;
+    String m_flags;
+    mutable Regex m_value;
+
+    RegexLiteral(const String& regex, const String& flags)
+        : m_regex(regex), m_flags(flags)
+    {
+    }
+
+    const Regex& get() const
+    {
+        if (!m_value.m_compiled) {
+            m_value = Regex(m_regex, m_flags);
+        }
+
+        return m_value;
+    }
 };
 
 inline bool operator==(const Regex& a, const Regex& b)
@@ -11,197 +11,439 @@ template<typename T> class Set;
 template <typename T>
 using SharedSet = mys::shared_ptr<Set<T>>;
 
-template<typename T>
-static bool contains(const std::unordered_set<T>& set, const T& e)
-{
-    return set.find(e) != set.end();
-}
-
+// Sets.
+//
+// A flat hash table with open addressing, using the same perturbed
+// probing as dicts. Each slot stores an item and its hash, so items
+// are never hashed again when the table is resized or when items are
+// moved between sets. Removed items leave deleted slots behind, that
+// are reused by later inserts and dropped when the table is resized.
+//
+// Set operations iterate over the smaller set when possible, and the
+// in-place variants modify the set without creating temporary sets.
 template<typename T>
 class Set final
 {
 public:
-    std::unordered_set<T> m_set;
+    enum class SlotState : u8 {
+        EMPTY,
+        USED,
+        DELETED
+    };
+
+    struct Slot {
+        T item;
+        size_t hash;
+        SlotState state;
+    };
+
+    // Iterates over all items in the set.
+    class const_iterator {
+    public:
+        using iterator_category = std::forward_iterator_tag;
+        using value_type = T;
+        using difference_type = std::ptrdiff_t;
+        using pointer = const T *;
+        using reference = const T&;
+
+        const Slot *m_slot_p;
+        const Slot *m_end_p;
+
+        const_iterator(const Slot *slot_p, const Slot *end_p)
+            : m_slot_p(slot_p), m_end_p(end_p)
+        {
+            skip_unused();
+        }
+
+        const T& operator*() const
+        {
+            return m_slot_p->item;
+        }
+
+        const T *operator->() const
+        {
+            return &m_slot_p->item;
+        }
+
+        const_iterator& operator++()
+        {
+            m_slot_p++;
+            skip_unused();
+
+            return *this;
+        }
 
-    Set() {}
-    Set(const Set<T>& other) : m_set(other.m_set) {}
-    Set(const SharedList<T>& other) : m_set(other->m_list.begin(), other->m_list.end()) {}
-    Set(std::initializer_list<T> il) : m_set(il) {}
-    Set(const std::vector<T>& v) : m_set(v.begin(), v.end()) {}
+        const_iterator operator++(int)
+        {
+            const_iterator it = *this;
+            ++(*this);
+
+            return it;
+        }
+
+        bool operator==(const const_iterator& other) const
+        {
+            return m_slot_p == other.m_slot_p;
+        }
+
+        bool operator!=(const const_iterator& other) const
+        {
+            return m_slot_p != other.m_slot_p;
+        }
+
+    private:
+        void skip_unused()
+        {
+            while ((m_slot_p != m_end_p) && (m_slot_p->state != SlotState::USED)) {
+                m_slot_p++;
+            }
+        }
+    };
+
+    std::vector<Slot> m_slots;
+    // Number of items.
+    size_t m_length;
+    // Number of used and deleted slots.
+    size_t m_fill;
+
+    Set() : m_length(0), m_fill(0)
+    {
+    }
+
+    Set(const Set<T>& other) = default;
+
+    Set(const SharedList<T>& other) : Set(other->m_list)
+    {
+    }
+
+    Set(std::initializer_list<T> il) : Set()
+    {
+        reserve(il.size());
+
+        for (const auto& item : il) {
+            add(item);
+        }
+    }
+
+    Set(const std::vector<T>& v) : Set()
+    {
+        reserve(v.size());
+
+        for (const auto& item : v) {
+            add(item);
+        }
+    }
 
     bool operator==(const Set<T>& other) const
     {
-        return m_set == other.m_set;
+        return (m_length == other.m_length) && is_subset(other);
     }
 
     bool operator!=(const Set<T>& other) const
     {
-        return m_set != other.m_set;
+        return !(*this == other);
     }
 
-    void add(const T& elem)
+    void add(const T& item)
     {
-        m_set.insert(elem);
+        insert(item, std::hash<T>()(item));
     }
 
     void clear()
     {
-        m_set.clear();
+        m_slots.clear();
+        m_length = 0;
+        m_fill = 0;
     }
 
-    void discard(const T& elem)
+    void discard(const T& item)
     {
-        auto it = m_set.find(elem);
+        Slot *slot_p = find(item);
 
-        if (it != m_set.end()) {
-            m_set.erase(it);
+        if (slot_p != nullptr) {
+            erase(slot_p);
         }
     }
 
-    void remove(const T& elem)
+    void remove(const T& item)
     {
-        auto it = m_set.find(elem);
+        Slot *slot_p = find(item);
 
-        if (it != m_set.end()) {
-            m_set.erase(it);
-        } else {
+        if (slot_p == nullptr) {
             mys::make_shared<KeyError>("element does not exist")->__throw();
         }
+
+        erase(slot_p);
     }
 
     SharedSet<T> intersection(const SharedSet<T>& other) const
     {
+        const Set<T> *small_p = this;
+        const Set<T> *large_p = other.operator->();
+
+        if (small_p->m_length > large_p->m_length) {
+            std::swap(small_p, large_p);
+        }
+
         auto res = mys::make_shared<Set<T>>();
-        for (const auto& e : m_set) {
-            if (mys::contains(other->m_set, e)) {
-                res->m_set.insert(e);
+        res->reserve(small_p->m_length);
+
+        for (const auto& slot : small_p->m_slots) {
+            if (slot.state == SlotState::USED) {
+                if (large_p->find(slot.item, slot.hash) != nullptr) {
+                    res->insert_new(slot.item, slot.hash);
+                }
             }
         }
+
         return res;
     }
 
-    SharedSet<T> intersection_update(const SharedSet<T>& other)
+    void intersection_update(const SharedSet<T>& other)
     {
-        auto s = intersection(other);
-        m_set = s->m_set;
-        return s;
+        const Set<T>& other_set = *other.operator->();
+
+        if (&other_set == this) {
+            return;
+        }
+
+        if (m_length <= other_set.m_length) {
+            for (auto& slot : m_slots) {
+                if (slot.state == SlotState::USED) {
+                    if (other_set.find(slot.item, slot.hash) == nullptr) {
+                        erase(&slot);
+                    }
+                }
+            }
+        } else {
+            // The result has at most as many items as the other set.
+            std::vector<Slot> slots;
+            slots.swap(m_slots);
+            m_length = 0;
+            m_fill = 0;
+            reserve(other_set.m_length);
+
+            for (const auto& slot : other_set.m_slots) {
+                if (slot.state == SlotState::USED) {
+                    if (find_in(slots, slot.item, slot.hash) != nullptr) {
+                        insert_new(slot.item, slot.hash);
+                    }
+                }
+            }
+        }
     }
 
     SharedSet<T> difference(const SharedSet<T>& other) const
     {
-        auto res = mys::make_shared<Set<T>>();
-        for (const auto& e : m_set) {
-            if (!mys::contains(other->m_set, e)) {
-                res->m_set.insert(e);
+        const Set<T>& other_set = *other.operator->();
+        SharedSet<T> res;
+
+        if (other_set.m_length < m_length) {
+            res = mys::make_shared<Set<T>>(*this);
+            res->difference_update(other);
+        } else {
+            res = mys::make_shared<Set<T>>();
+            res->reserve(m_length);
+
+            for (const auto& slot : m_slots) {
+                if (slot.state == SlotState::USED) {
+                    if (other_set.find(slot.item, slot.hash) == nullptr) {
+                        res->insert_new(slot.item, slot.hash);
+                    }
+                }
             }
         }
+
         return res;
     }
 
-    SharedSet<T> difference_update(const SharedSet<T>& other)
+    void difference_update(const SharedSet<T>& other)
     {
-        auto s = difference(other);
-        m_set = s->m_set;
-        return s;
+        const Set<T>& other_set = *other.operator->();
+
+        if (&other_set == this) {
+            clear();
+        } else if (other_set.m_length < m_length) {
+            for (const auto& slot : other_set.m_slots) {
+                if (slot.state == SlotState::USED) {
+                    Slot *slot_p = find(slot.item, slot.hash);
+
+                    if (slot_p != nullptr) {
+                        erase(slot_p);
+                    }
+                }
+            }
+        } else {
+            for (auto& slot : m_slots) {
+                if (slot.state == SlotState::USED) {
+                    if (other_set.find(slot.item, slot.hash) != nullptr) {
+                        erase(&slot);
+                    }
+                }
+            }
+        }
     }
 
     SharedSet<T> _union(const SharedSet<T>& other) const
     {
-        auto res = mys::make_shared<Set<T>>(*this);
-        res->m_set.insert(other->m_set.begin(), other->m_set.end());
+        const Set<T> *small_p = this;
+        const Set<T> *large_p = other.operator->();
+
+        if (small_p->m_length > large_p->m_length) {
+            std::swap(small_p, large_p);
+        }
+
+        auto res = mys::make_shared<Set<T>>(*large_p);
+        res->update_from(*small_p);
+
         return res;
     }
 
-    SharedSet<T> update(const SharedSet<T>& other)
+    void update(const SharedSet<T>& other)
     {
-        auto s = _union(other);
-        m_set = s->m_set;
-        return s;
+        const Set<T>& other_set = *other.operator->();
+
+        if (&other_set != this) {
+            update_from(other_set);
+        }
     }
 
     SharedSet<T> symmetric_difference(const SharedSet<T>& other) const
     {
-        auto res = mys::make_shared<Set<T>>();
-        for (const auto& e : m_set) {
-            if (!mys::contains(other->m_set, e)) {
-                res->m_set.insert(e);
-            }
-        }
-        for (const auto& e : other->m_set) {
-            if (!mys::contains(m_set, e)) {
-                res->m_set.insert(e);
-            }
+        const Set<T> *small_p = this;
+        const Set<T> *large_p = other.operator->();
+
+        if (small_p->m_length > large_p->m_length) {
+            std::swap(small_p, large_p);
         }
+
+        auto res = mys::make_shared<Set<T>>(*large_p);
+        res->symmetric_difference_update_from(*small_p);
+
         return res;
     }
 
-    SharedSet<T> symmetric_difference_update(const SharedSet<T>& other)
+    void symmetric_difference_update(const SharedSet<T>& other)
     {
-        auto s = symmetric_difference(other);
-        m_set = s->m_set;
-        return s;
+        const Set<T>& other_set = *other.operator->();
+
+        if (&other_set == this) {
+            clear();
+        } else {
+            symmetric_difference_update_from(other_set);
+        }
     }
 
     bool is_disjoint(const SharedSet<T>& other) const
     {
-        for (const auto& e : m_set) {
-            if (mys::contains(other->m_set, e)) {
-                return false;
+        const Set<T> *small_p = this;
+        const Set<T> *large_p = other.operator->();
+
+        if (small_p->m_length > large_p->m_length) {
+            std::swap(small_p, large_p);
+        }
+
+        for (const auto& slot : small_p->m_slots) {
+            if (slot.state == SlotState::USED) {
+                if (large_p->find(slot.item, slot.hash) != nullptr) {
+                    return false;
+                }
             }
         }
+
         return true;
     }
 
     bool is_superset(const SharedSet<T>& other) const
     {
-        if (m_set.size() < other->m_set.size()) {
-            return false;
-        }
-        for (const auto& e : other->m_set) {
-            if (!mys::contains(m_set, e)) {
-                return false;
-            }
-        }
-        return true;
+        return other->is_subset(*this);
     }
 
     bool is_proper_superset(const SharedSet<T>& other) const
     {
-        if (m_set.size() <= other->m_set.size()) {
+        if (m_length <= other->m_length) {
             return false;
         }
+
         return is_superset(other);
     }
 
     bool is_subset(const SharedSet<T>& other) const
     {
-        if (m_set.size() > other->m_set.size()) {
+        return is_subset(*other.operator->());
+    }
+
+    bool is_subset(const Set<T>& other) const
+    {
+        if (m_length > other.m_length) {
             return false;
         }
-        for (const auto& e : m_set) {
-            if (!mys::contains(other->m_set, e)) {
-                return false;
+
+        for (const auto& slot : m_slots) {
+            if (slot.state == SlotState::USED) {
+                if (other.find(slot.item, slot.hash) == nullptr) {
+                    return false;
+                }
             }
         }
+
         return true;
     }
 
     bool is_proper_subset(const SharedSet<T>& other) const
     {
-        if (m_set.size() >= other->m_set.size()) {
+        if (m_length >= other->m_length) {
             return false;
         }
+
         return is_subset(other);
     }
 
     i64 length() const
     {
-        return m_set.size();
+        return m_length;
     }
 
     bool __contains__(const T& value) const
     {
-        return mys::contains(m_set, value);
+        return find(value) != nullptr;
+    }
+
+    const_iterator begin() const
+    {
+        return const_iterator(m_slots.data(), m_slots.data() + m_slots.size());
+    }
+
+    const_iterator end() const
+    {
+        return const_iterator(m_slots.data() + m_slots.size(),
+                              m_slots.data() + m_slots.size());
+    }
+
+    // Advance given iterator in a for loop over the set, which had
+    // given length when the loop started. Sets must not be modified
+    // while iterated over, which is detected as a changed length or
+    // moved slots.
+    void next_in_loop(const_iterator& it, i64 length) const
+    {
+#if !defined(MYS_UNSAFE)
+        if (((i64)m_length != length)
+            || (it.m_end_p != m_slots.data() + m_slots.size())) {
+            print_traceback();
+            std::cerr << "\nPanic(message=\"Set modified during iteration.\")\n";
+            abort();
+        }
+#endif
+
+        ++it;
+    }
+
+    // Make room for given number of items.
+    void reserve(size_t size)
+    {
+        if (m_fill - m_length + size > capacity()) {
+            resize(size);
+        }
     }
 
     String __str__()
@@ -213,20 +455,191 @@ public:
 
     T __min__() const
     {
-        if (m_set.size() == 0) {
+        if (m_length == 0) {
             mys::make_shared<ValueError>("min() arg is an empty sequence")->__throw();
         }
 
-        return *std::min_element(m_set.begin(), m_set.end());
+        return *std::min_element(begin(), end());
     }
 
     T __max__() const
     {
-        if (m_set.size() == 0) {
+        if (m_length == 0) {
             mys::make_shared<ValueError>("max() arg is an empty sequence")->__throw();
         }
 
-        return *std::max_element(m_set.begin(), m_set.end());
+        return *std::max_element(begin(), end());
+    }
+
+private:
+    // Maximum number of used and deleted slots before resizing.
+    size_t capacity() const
+    {
+        return 2 * m_slots.size() / 3;
+    }
+
+    const Slot *find(const T& item) const
+    {
+        if (m_length == 0) {
+            return nullptr;
+        }
+
+        return find_in(m_slots, item, std::hash<T>()(item));
+    }
+
+    Slot *find(const T& item)
+    {
+        return const_cast<Slot *>(static_cast<const Set<T> *>(this)->find(item));
+    }
+
+    const Slot *find(const T& item, size_t hash) const
+    {
+        if (m_length == 0) {
+            return nullptr;
+        }
+
+        return find_in(m_slots, item, hash);
+    }
+
+    Slot *find(const T& item, size_t hash)
+    {
+        return const_cast<Slot *>(
+            static_cast<const Set<T> *>(this)->find(item, hash));
+    }
+
+    // Returns the slot with given item in given slots, or nullptr if
+    // missing.
+    static const Slot *find_in(const std::vector<Slot>& slots,
+                               const T& item,
+                               size_t hash)
+    {
+        if (slots.empty()) {
+            return nullptr;
+        }
+
+        size_t mask = slots.size() - 1;
+        size_t perturb = hash;
+        size_t index = hash & mask;
+
+        while (true) {
+            const Slot& slot = slots[index];
+
+            if (slot.state == SlotState::EMPTY) {
+                return nullptr;
+            }
+
+            if ((slot.state == SlotState::USED)
+                && (slot.hash == hash)
+                && std::equal_to<T>()(slot.item, item)) {
+                return &slot;
+            }
+
+            perturb >>= 5;
+            index = (5 * index + 1 + perturb) & mask;
+        }
+    }
+
+    // Add given item if missing.
+    void insert(const T& item, size_t hash)
+    {
+        if (find(item, hash) != nullptr) {
+            return;
+        }
+
+        if (m_fill >= capacity()) {
+            // The item may be in this set's slots, so it is copied
+            // before resizing.
+            T item_copy = item;
+            resize(2 * m_length + 1);
+            insert_new(item_copy, hash);
+        } else {
+            insert_new(item, hash);
+        }
+    }
+
+    // Add given item, which must not be in the set. There must be
+    // room for it.
+    void insert_new(const T& item, size_t hash)
+    {
+        size_t mask = m_slots.size() - 1;
+        size_t perturb = hash;
+        size_t index = hash & mask;
+
+        while (m_slots[index].state == SlotState::USED) {
+            perturb >>= 5;
+            index = (5 * index + 1 + perturb) & mask;
+        }
+
+        Slot& slot = m_slots[index];
+
+        if (slot.state == SlotState::EMPTY) {
+            m_fill++;
+        }
+
+        slot.item = item;
+        slot.hash = hash;
+        slot.state = SlotState::USED;
+        m_length++;
+    }
+
+    void erase(Slot *slot_p)
+    {
+        // Release references as early as possible.
+        slot_p->item = T();
+        slot_p->state = SlotState::DELETED;
+        m_length--;
+    }
+
+    void update_from(const Set<T>& other)
+    {
+        reserve(m_length + other.m_length);
+
+        for (const auto& slot : other.m_slots) {
+            if (slot.state == SlotState::USED) {
+                if (find(slot.item, slot.hash) == nullptr) {
+                    insert_new(slot.item, slot.hash);
+                }
+            }
+        }
+    }
+
+    void symmetric_difference_update_from(const Set<T>& other)
+    {
+        reserve(m_length + other.m_length);
+
+        for (const auto& slot : other.m_slots) {
+            if (slot.state == SlotState::USED) {
+                Slot *slot_p = find(slot.item, slot.hash);
+
+                if (slot_p != nullptr) {
+                    erase(slot_p);
+                } else {
+                    insert_new(slot.item, slot.hash);
+                }
+            }
+        }
+    }
+
+    // Drop deleted slots and rebuild the table with room for at least
+    // given number of items.
+    void resize(size_t size)
+    {
+        size_t slots_size = 8;
+
+        while (2 * slots_size / 3 < size) {
+            slots_size *= 2;
+        }
+
+        std::vector<Slot> slots(slots_size);
+        slots.swap(m_slots);
+        m_length = 0;
+        m_fill = 0;
+
+        for (auto& slot : slots) {
+            if (slot.state == SlotState::USED) {
+                insert_new(std::move(slot.item), slot.hash);
+            }
+        }
     }
 };
 
@@ -238,8 +651,9 @@ std::ostream& operator<<(std::ostream& os, const Set<T>& obj)
     os << "{";
     delim_p = "";
 
-    for (auto item = obj.m_set.begin(); item != obj.m_set.end(); item++, delim_p = ", ") {
-        os << delim_p << *item;
+    for (const auto& item : obj) {
+        os << delim_p << item;
+        delim_p = ", ";
     }
 
     os << "}";
@@ -253,7 +667,7 @@ bool operator==(const SharedSet<T>& a, const SharedSet<T>& b)
     if (!a && !b) {
         return true;
     } else {
-        return shared_ptr_not_none(a)->m_set == shared_ptr_not_none(b)->m_set;
+        return *shared_ptr_not_none(a) == *shared_ptr_not_none(b);
     }
 }
 
@@ -5,6 +5,7 @@
 #include "bool.hpp"
 #include "char.hpp"
 #include "bytes.hpp"
+#include "char_vector.hpp"
 
 namespace mys {
 
@@ -24,9 +25,9 @@ private:
 
     enum class CaseMode { LOWER, UPPER, FOLD, CAPITALIZE };
     String set_case(CaseMode mode) const;
+    String substring(size_t begin, size_t end) const;
 
 public:
-    typedef std::vector<Char> CharVector;
     mys::shared_ptr<CharVector> m_string;
 
     String() : m_string(nullptr)
@@ -96,9 +97,7 @@ public:
 
     void append(const String& other)
     {
-        m_string->insert(m_string->end(),
-                         other.m_string->begin(),
-                         other.m_string->end());
+        m_string->append(*other.m_string);
     }
 
     void append(const Char& other)
@@ -106,19 +105,27 @@ public:
         m_string->push_back(other);
     }
 
+    // Characters are shared by copies of a string, and are copied
+    // before appending unless only used by this string.
     void operator+=(const String& other)
     {
-        m_string = mys::make_shared<CharVector>(*m_string.get());
+        if ((m_string.use_count() > 1) || (m_string.get() == other.m_string.get())) {
+            m_string = mys::make_shared<CharVector>(*m_string.get());
+        }
+
         append(other);
     }
 
     void operator+=(const Char& other)
     {
-        m_string = mys::make_shared<CharVector>(*m_string.get());
+        if (m_string.use_count() > 1) {
+            m_string = mys::make_shared<CharVector>(*m_string.get());
+        }
+
         append(other);
     }
 
-    String operator+(const String& other);
+    String operator+(const String& other) const;
 
     String operator*(int value) const;
     void operator*=(int value);
@@ -160,9 +167,9 @@ public:
     Bytes to_utf8() const;
 
 #if !defined(MYS_UNSAFE)
-    Char& get(i64 index) const;
+    Char get(i64 index) const;
 #else
-    Char& get(i64 index) const
+    Char get(i64 index) const
     {
         if (index < 0) {
             index = m_string->size() + index;
@@ -230,15 +237,6 @@ static inline String operator+(const char *value_p, const String& string)
     return res;
 }
 
-static inline String operator+(const String& string_1, const String& string_2)
-{
-    String res(string_1);
-
-    res += string_2;
-
-    return res;
-}
-
 #if !defined(MYS_UNSAFE)
 const String& string_not_none(const String& obj);
 
@@ -263,17 +261,7 @@ namespace std
         std::size_t operator()(mys::String const& s) const noexcept
         {
             if (s.m_string) {
-                std::size_t hash = 0;
-                int p = 53;
-                int m = 1e9 + 9;
-                long long power_of_p = 1;
-
-                for (auto v : *s.m_string) {
-                    hash = (hash + (v - 'a' + 1) * power_of_p) % m;
-                    power_of_p = (power_of_p * p) % m;
-                }
-
-                return hash;
+                return s.m_string->hash();
             } else {
                 return 0;
             }
@@ -0,0 +1,89 @@
+#pragma once
+
+#include "string.hpp"
+
+namespace mys {
+
+// Builds a string by appending to it in place. Copies of a builder
+// are the same builder, as for other objects. The string returned by
+// to_string() shares its characters with the builder, which copies
+// them the next time it is modified, so no characters are copied if
+// the builder is not modified after to_string().
+class StringBuilder final {
+private:
+    CharVector& chars()
+    {
+        if (m_string->m_string.use_count() > 1) {
+            m_string->m_string = mys::make_shared<CharVector>(*m_string->m_string);
+        }
+
+        return *m_string->m_string;
+    }
+
+public:
+    mys::shared_ptr<String> m_string;
+
+    StringBuilder() : m_string(nullptr)
+    {
+    }
+
+    StringBuilder(std::nullptr_t) : m_string(nullptr)
+    {
+    }
+
+    StringBuilder(const mys::shared_ptr<String>& string) : m_string(string)
+    {
+    }
+
+    StringBuilder& append(const String& value)
+    {
+        chars().append(*value.m_string);
+
+        return *this;
+    }
+
+    StringBuilder& append_char(const Char& value)
+    {
+        chars().push_back(value);
+
+        return *this;
+    }
+
+    // Reserve space for given number of characters in total.
+    void reserve(i64 size)
+    {
+        if (size > 0) {
+            chars().reserve(size);
+        }
+    }
+
+    i64 length() const
+    {
+        return m_string->length();
+    }
+
+    String to_string() const
+    {
+        return *m_string;
+    }
+};
+
+std::ostream& operator<<(std::ostream& os, const StringBuilder& obj);
+
+#if !defined(MYS_UNSAFE)
+StringBuilder& stringbuilder_not_none(StringBuilder& obj);
+const StringBuilder& stringbuilder_not_none(const StringBuilder& obj);
+#else
+static inline StringBuilder& stringbuilder_not_none(StringBuilder& obj)
+{
+    return obj;
+}
+
+static inline const StringBuilder& stringbuilder_not_none(const StringBuilder& obj)
+{
+    return obj;
+}
+#endif
+String stringbuilder_str(const StringBuilder& value);
+
+}
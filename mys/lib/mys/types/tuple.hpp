@@ -33,6 +33,10 @@ public:
     {
     }
 
+    Tuple(std::tuple<T...>&& tuple) : m_tuple(std::move(tuple))
+    {
+    }
+
     String __str__()
     {
         std::stringstream ss;
@@ -67,6 +71,14 @@ operator!=(const mys::shared_ptr<Tuple<T...>>& a,
 template <class ...T>
 using SharedTuple = mys::shared_ptr<Tuple<T...>>;
 
+// Functions and methods return tuples by value. The caller moves a
+// returned tuple to the heap only if it is not unpacked.
+template <class ...T>
+SharedTuple<T...> make_shared_tuple(std::tuple<T...>&& tuple)
+{
+    return mys::make_shared<Tuple<T...>>(std::move(tuple));
+}
+
 }
 
 namespace std
@@ -0,0 +1,120 @@
+#pragma once
+
+#include <cstring>
+#if defined(__SSE2__)
+#include <immintrin.h>
+#endif
+#include "common.hpp"
+#include "types/number.hpp"
+
+namespace mys {
+
+class CharVector;
+
+// Number of ASCII characters at the beginning of given data. Checks
+// 32 bytes at a time with AVX2, 16 with SSE2 and 8 otherwise.
+static inline size_t ascii_length(const u8 *data_p, size_t size)
+{
+    size_t i = 0;
+
+#if defined(__AVX2__)
+    for (; i + 32 <= size; i += 32) {
+        __m256i chunk = _mm256_loadu_si256((const __m256i *)&data_p[i]);
+        u32 mask = _mm256_movemask_epi8(chunk);
+
+        if (mask != 0) {
+            return i + __builtin_ctz(mask);
+        }
+    }
+#endif
+
+#if defined(__SSE2__)
+    for (; i + 16 <= size; i += 16) {
+        __m128i chunk = _mm_loadu_si128((const __m128i *)&data_p[i]);
+        u32 mask = _mm_movemask_epi8(chunk);
+
+        if (mask != 0) {
+            return i + __builtin_ctz(mask);
+        }
+    }
+#endif
+
+    u64 word;
+
+    for (; i + 8 <= size; i += 8) {
+        std::memcpy(&word, &data_p[i], 8);
+
+        if ((word & 0x8080808080808080ull) != 0) {
+            break;
+        }
+    }
+
+    for (; i < size; i++) {
+        if (data_p[i] & 0x80) {
+            break;
+        }
+    }
+
+    return i;
+}
+
+// Number of ASCII characters at the beginning of given UCS-4 data.
+static inline size_t ascii_length(const u32 *data_p, size_t size)
+{
+    size_t i = 0;
+
+#if defined(__AVX2__)
+    __m256i high_256 = _mm256_set1_epi32(~0x7f);
+
+    for (; i + 8 <= size; i += 8) {
+        __m256i chunk = _mm256_loadu_si256((const __m256i *)&data_p[i]);
+        __m256i is_ascii = _mm256_cmpeq_epi32(_mm256_and_si256(chunk, high_256),
+                                              _mm256_setzero_si256());
+        u32 mask = ~_mm256_movemask_ps(_mm256_castsi256_ps(is_ascii)) & 0xff;
+
+        if (mask != 0) {
+            return i + __builtin_ctz(mask);
+        }
+    }
+#endif
+
+#if defined(__SSE2__)
+    __m128i high_128 = _mm_set1_epi32(~0x7f);
+
+    for (; i + 4 <= size; i += 4) {
+        __m128i chunk = _mm_loadu_si128((const __m128i *)&data_p[i]);
+        __m128i is_ascii = _mm_cmpeq_epi32(_mm_and_si128(chunk, high_128),
+                                           _mm_setzero_si128());
+        u32 mask = ~_mm_movemask_ps(_mm_castsi128_ps(is_ascii)) & 0xf;
+
+        if (mask != 0) {
+            return i + __builtin_ctz(mask);
+        }
+    }
+#endif
+
+    for (; i < size; i++) {
+        if (data_p[i] >= 0x80) {
+            break;
+        }
+    }
+
+    return i;
+}
+
+// Size of characters [begin, end) of given vector when encoded as
+// UTF-8.
+size_t utf8_size(const CharVector& chars, size_t begin, size_t end);
+
+// Encode characters [begin, end) of given vector as UTF-8. The
+// destination must fit utf8_size() bytes. Returns the number of
+// written bytes.
+size_t encode_utf8(const CharVector& chars, size_t begin, size_t end, u8 *dst_p);
+
+// Decode given UTF-8 data and append the characters to given
+// vector. Returns false if the data is not valid UTF-8, in which
+// case the vector should not be used, as it may be wide without any
+// wide characters.
+bool decode_utf8(const u8 *data_p, size_t size, CharVector& chars);
+
+}
@@ -0,0 +1,108 @@
+#include <unistd.h>
+#include <cerrno>
+#include <cstring>
+#include <iostream>
+#include "mys/output.hpp"
+
+namespace mys {
+
+OutputBuffer::OutputBuffer(int fd) : m_fd(fd), m_is_tty(isatty(fd) == 1)
+{
+    set_put_position(&m_buf[0]);
+}
+
+OutputBuffer::int_type OutputBuffer::overflow(int_type ch)
+{
+    if (pptr() == &m_buf[SIZE]) {
+        if (!flush_buffer()) {
+            return traits_type::eof();
+        }
+    }
+
+    if (!traits_type::eq_int_type(ch, traits_type::eof())) {
+        *pptr() = traits_type::to_char_type(ch);
+        set_put_position(pptr() + 1);
+
+        if (m_is_tty && (ch == '\n')) {
+            if (!flush_buffer()) {
+                return traits_type::eof();
+            }
+        }
+    }
+
+    return traits_type::not_eof(ch);
+}
+
+std::streamsize OutputBuffer::xsputn(const char *buf_p, std::streamsize size)
+{
+    if (size > &m_buf[SIZE] - pptr()) {
+        if (!flush_buffer()) {
+            return 0;
+        }
+
+        // Too big for the buffer, so it is written directly.
+        if ((size_t)size >= SIZE) {
+            return write_all(buf_p, size) ? size : 0;
+        }
+    }
+
+    std::memcpy(pptr(), buf_p, size);
+    set_put_position(pptr() + size);
+
+    if (m_is_tty && (std::memchr(buf_p, '\n', size) != nullptr)) {
+        if (!flush_buffer()) {
+            return 0;
+        }
+    }
+
+    return size;
+}
+
+int OutputBuffer::sync()
+{
+    return flush_buffer() ? 0 : -1;
+}
+
+// The put area is empty for terminals, so every character written
+// goes through overflow(), where newlines are detected.
+void OutputBuffer::set_put_position(char *position_p)
+{
+    setp(position_p, m_is_tty ? position_p : &m_buf[SIZE]);
+}
+
+bool OutputBuffer::flush_buffer()
+{
+    bool ok = write_all(&m_buf[0], pptr() - &m_buf[0]);
+    set_put_position(&m_buf[0]);
+
+    return ok;
+}
+
+bool OutputBuffer::write_all(const char *buf_p, size_t size)
+{
+    while (size > 0) {
+        ssize_t res = write(m_fd, buf_p, size);
+
+        if (res < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+
+            return false;
+        }
+
+        buf_p += res;
+        size -= res;
+    }
+
+    return true;
+}
+
+void output_init()
+{
+    // Never deleted, as std::cout is flushed after static objects
+    // are destroyed.
+    std::cout.rdbuf(new OutputBuffer(STDOUT_FILENO));
+}
+
+}
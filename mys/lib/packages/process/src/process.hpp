@@ -0,0 +1,666 @@
+#pragma once
+
+#include <fcntl.h>
+#include <poll.h>
+#include <pthread.h>
+#include <sys/mman.h>
+#include <sys/wait.h>
+#include <unistd.h>
+#include <atomic>
+
+// Values sent between processes are encoded into messages, written to
+// pipes under process-shared locks so that messages from different
+// processes never interleave.
+namespace mys::process {
+
+class Encoder {
+public:
+    std::vector<u8> m_buf;
+
+    void write(const void *buf_p, size_t size)
+    {
+        const u8 *first_p = (const u8 *)buf_p;
+
+        m_buf.insert(m_buf.end(), first_p, first_p + size);
+    }
+
+    template<typename T>
+    void write_value(T value)
+    {
+        write(&value, sizeof(value));
+    }
+};
+
+class Decoder {
+public:
+    const u8 *m_buf_p;
+    size_t m_size;
+    size_t m_pos;
+
+    Decoder(const std::vector<u8>& buf) : m_buf_p(buf.data()),
+                                          m_size(buf.size()),
+                                          m_pos(0)
+    {
+    }
+
+    void read(void *buf_p, size_t size)
+    {
+        if (m_pos + size > m_size) {
+            std::cerr << "error: bad process message" << std::endl;
+            abort();
+        }
+
+        std::memcpy(buf_p, &m_buf_p[m_pos], size);
+        m_pos += size;
+    }
+
+    template<typename T>
+    T read_value()
+    {
+        T value;
+
+        read(&value, sizeof(value));
+
+        return value;
+    }
+};
+
+template<typename T>
+struct is_encodable : std::false_type {};
+
+// Only numbers, bools, chars, strings, bytes, and lists, tuples, dicts
+// and sets of them can be sent between processes, as class instances
+// cannot be serialized.
+template<typename T>
+void encode(Encoder&, const T&)
+{
+    static_assert(is_encodable<T>::value,
+                  "only numbers, bools, chars, strings, bytes, lists, tuples, "
+                  "dicts and sets can be sent between processes");
+}
+
+template<typename T>
+void decode(Decoder&, T&)
+{
+    static_assert(is_encodable<T>::value,
+                  "only numbers, bools, chars, strings, bytes, lists, tuples, "
+                  "dicts and sets can be sent between processes");
+}
+
+// Declared before defined as containers may contain each other.
+template<typename T>
+void encode(Encoder& encoder, const mys::shared_ptr<List<T>>& value);
+template<typename T>
+void decode(Decoder& decoder, mys::shared_ptr<List<T>>& value);
+template<typename... T>
+void encode(Encoder& encoder, const mys::shared_ptr<Tuple<T...>>& value);
+template<typename... T>
+void encode(Encoder& encoder, const std::tuple<T...>& value);
+template<typename... T>
+void decode(Decoder& decoder, mys::shared_ptr<Tuple<T...>>& value);
+template<typename TK, typename TV>
+void encode(Encoder& encoder, const mys::shared_ptr<Dict<TK, TV>>& value);
+template<typename TK, typename TV>
+void decode(Decoder& decoder, mys::shared_ptr<Dict<TK, TV>>& value);
+template<typename T>
+void encode(Encoder& encoder, const mys::shared_ptr<Set<T>>& value);
+template<typename T>
+void decode(Decoder& decoder, mys::shared_ptr<Set<T>>& value);
+
+#define MYS_PROCESS_NUMBER(type)                                \
+    static inline void encode(Encoder& encoder, type value)     \
+    {                                                           \
+        encoder.write_value(value);                             \
+    }                                                           \
+                                                                \
+    static inline void decode(Decoder& decoder, type& value)    \
+    {                                                           \
+        value = decoder.read_value<type>();                     \
+    }
+
+MYS_PROCESS_NUMBER(i8)
+MYS_PROCESS_NUMBER(i16)
+MYS_PROCESS_NUMBER(i32)
+MYS_PROCESS_NUMBER(i64)
+MYS_PROCESS_NUMBER(u8)
+MYS_PROCESS_NUMBER(u16)
+MYS_PROCESS_NUMBER(u32)
+MYS_PROCESS_NUMBER(u64)
+MYS_PROCESS_NUMBER(f32)
+MYS_PROCESS_NUMBER(f64)
+
+static inline void encode(Encoder& encoder, const Bool& value)
+{
+    encoder.write_value<u8>(value.m_value);
+}
+
+static inline void decode(Decoder& decoder, Bool& value)
+{
+    value = Bool(decoder.read_value<u8>() != 0);
+}
+
+static inline void encode(Encoder& encoder, const Char& value)
+{
+    encoder.write_value(value.m_value);
+}
+
+static inline void decode(Decoder& decoder, Char& value)
+{
+    value = Char(decoder.read_value<i32>());
+}
+
+// None is encoded as a length of -1.
+static inline void encode(Encoder& encoder, const String& value)
+{
+    if (!value.m_string) {
+        encoder.write_value<i64>(-1);
+    } else {
+        const CharVector& chars = *value.m_string;
+
+        encoder.write_value<i64>(chars.size());
+        encoder.write_value<u8>(chars.is_wide());
+
+        if (chars.is_wide()) {
+            encoder.write(chars.m_ucs4.data(), sizeof(u32) * chars.size());
+        } else {
+            encoder.write(chars.latin1(), chars.size());
+        }
+    }
+}
+
+static inline void decode(Decoder& decoder, String& value)
+{
+    i64 size = decoder.read_value<i64>();
+
+    if (size == -1) {
+        value = String();
+
+        return;
+    }
+
+    bool is_wide = decoder.read_value<u8>();
+    auto chars = mys::make_shared<CharVector>();
+
+    if (is_wide) {
+        std::vector<u32> data(size);
+        decoder.read(data.data(), sizeof(u32) * size);
+        chars->append(data.data(), data.data() + size);
+    } else {
+        std::vector<u8> data(size);
+        decoder.read(data.data(), size);
+        chars->append(data.data(), data.data() + size);
+    }
+
+    value = String();
+    value.m_string = chars;
+}
+
+static inline void encode(Encoder& encoder, const Bytes& value)
+{
+    if (!value.m_bytes) {
+        encoder.write_value<i64>(-1);
+    } else {
+        encoder.write_value<i64>(value.m_bytes->size());
+        encoder.write(value.m_bytes->data(), value.m_bytes->size());
+    }
+}
+
+static inline void decode(Decoder& decoder, Bytes& value)
+{
+    i64 size = decoder.read_value<i64>();
+
+    if (size == -1) {
+        value = Bytes();
+    } else {
+        value = Bytes();
+        value.m_bytes = mys::make_shared<std::vector<u8>>(size);
+        decoder.read(value.m_bytes->data(), size);
+    }
+}
+
+template<typename T>
+void encode(Encoder& encoder, const mys::shared_ptr<List<T>>& value)
+{
+    if (!value) {
+        encoder.write_value<i64>(-1);
+    } else {
+        encoder.write_value<i64>(value->m_list.size());
+
+        for (const auto& item : value->m_list) {
+            encode(encoder, item);
+        }
+    }
+}
+
+template<typename T>
+void decode(Decoder& decoder, mys::shared_ptr<List<T>>& value)
+{
+    i64 size = decoder.read_value<i64>();
+
+    if (size == -1) {
+        value = nullptr;
+    } else {
+        value = mys::make_shared<List<T>>();
+        value->m_list.resize(size);
+
+        for (auto& item : value->m_list) {
+            decode(decoder, item);
+        }
+    }
+}
+
+template<typename... T>
+void encode(Encoder& encoder, const mys::shared_ptr<Tuple<T...>>& value)
+{
+    if (value) {
+        encode(encoder, value->m_tuple);
+    } else {
+        encoder.write_value<u8>(0);
+    }
+}
+
+// Tuples returned by value from functions.
+template<typename... T>
+void encode(Encoder& encoder, const std::tuple<T...>& value)
+{
+    encoder.write_value<u8>(1);
+    std::apply([&encoder](const auto&... items) {
+        (encode(encoder, items), ...);
+    }, value);
+}
+
+template<typename... T>
+void decode(Decoder& decoder, mys::shared_ptr<Tuple<T...>>& value)
+{
+    if (decoder.read_value<u8>() == 0) {
+        value = nullptr;
+    } else {
+        std::tuple<T...> items;
+
+        std::apply([&decoder](auto&... items) {
+            (decode(decoder, items), ...);
+        }, items);
+        value = std::apply([](const auto&... items) {
+            return mys::make_shared<Tuple<T...>>(items...);
+        }, items);
+    }
+}
+
+template<typename TK, typename TV>
+void encode(Encoder& encoder, const mys::shared_ptr<Dict<TK, TV>>& value)
+{
+    if (!value) {
+        encoder.write_value<i64>(-1);
+    } else {
+        encoder.write_value<i64>(value->length());
+
+        for (const auto& [key, item] : *value) {
+            encode(encoder, key);
+            encode(encoder, item);
+        }
+    }
+}
+
+template<typename TK, typename TV>
+void decode(Decoder& decoder, mys::shared_ptr<Dict<TK, TV>>& value)
+{
+    i64 length = decoder.read_value<i64>();
+
+    if (length == -1) {
+        value = nullptr;
+    } else {
+        value = mys::make_shared<Dict<TK, TV>>();
+        value->reserve(length);
+
+        for (i64 i = 0; i < length; i++) {
+            TK key;
+            TV item;
+            decode(decoder, key);
+            decode(decoder, item);
+            value->__setitem__(key, item);
+        }
+    }
+}
+
+template<typename T>
+void encode(Encoder& encoder, const mys::shared_ptr<Set<T>>& value)
+{
+    if (!value) {
+        encoder.write_value<i64>(-1);
+    } else {
+        encoder.write_value<i64>(value->length());
+
+        for (const auto& item : *value) {
+            encode(encoder, item);
+        }
+    }
+}
+
+template<typename T>
+void decode(Decoder& decoder, mys::shared_ptr<Set<T>>& value)
+{
+    i64 length = decoder.read_value<i64>();
+
+    if (length == -1) {
+        value = nullptr;
+    } else {
+        value = mys::make_shared<Set<T>>();
+        value->reserve(length);
+
+        for (i64 i = 0; i < length; i++) {
+            T item;
+            decode(decoder, item);
+            value->add(item);
+        }
+    }
+}
+
+template<typename T>
+Bytes encode_value(const T& value)
+{
+    Encoder encoder;
+    Bytes message;
+
+    encode(encoder, value);
+    message.m_bytes = mys::make_shared<std::vector<u8>>(std::move(encoder.m_buf));
+
+    return message;
+}
+
+template<typename T>
+T decode_value(const Bytes& message)
+{
+    Decoder decoder(*message.m_bytes);
+    T value;
+
+    decode(decoder, value);
+
+    return value;
+}
+
+// Locks in memory shared by all processes forked after the pipe was
+// created.
+struct PipeLocks {
+    pthread_mutex_t read;
+    pthread_mutex_t write;
+};
+
+static inline void init_process_shared_mutex(pthread_mutex_t *mutex_p)
+{
+    pthread_mutexattr_t attr;
+
+    pthread_mutexattr_init(&attr);
+    pthread_mutexattr_setpshared(&attr, PTHREAD_PROCESS_SHARED);
+    pthread_mutex_init(mutex_p, &attr);
+    pthread_mutexattr_destroy(&attr);
+}
+
+static inline void *map_shared(size_t size)
+{
+    void *buf_p = mmap(NULL,
+                       size,
+                       PROT_READ | PROT_WRITE,
+                       MAP_SHARED | MAP_ANONYMOUS,
+                       -1,
+                       0);
+
+    if (buf_p == MAP_FAILED) {
+        std::cerr << "error: failed to map shared memory" << std::endl;
+        abort();
+    }
+
+    return buf_p;
+}
+
+static inline PipeLocks *create_pipe_locks()
+{
+    PipeLocks *locks_p = (PipeLocks *)map_shared(sizeof(PipeLocks));
+
+    init_process_shared_mutex(&locks_p->read);
+    init_process_shared_mutex(&locks_p->write);
+
+    return locks_p;
+}
+
+static inline bool write_all(int fd, const u8 *buf_p, size_t size)
+{
+    ssize_t res;
+
+    while (size > 0) {
+        res = ::write(fd, buf_p, size);
+
+        if (res < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+
+            return false;
+        }
+
+        buf_p += res;
+        size -= res;
+    }
+
+    return true;
+}
+
+// Blocks until given number of bytes are read from given non-blocking
+// file descriptor. Returns false on end of file.
+static inline bool read_all(int fd, u8 *buf_p, size_t size)
+{
+    ssize_t res;
+    struct pollfd pollfd;
+
+    while (size > 0) {
+        res = ::read(fd, buf_p, size);
+
+        if (res == 0) {
+            return false;
+        } else if (res < 0) {
+            if (errno == EAGAIN) {
+                pollfd.fd = fd;
+                pollfd.events = POLLIN;
+                ::poll(&pollfd, 1, -1);
+                continue;
+            } else if (errno == EINTR) {
+                continue;
+            }
+
+            return false;
+        }
+
+        buf_p += res;
+        size -= res;
+    }
+
+    return true;
+}
+
+// Writes given message, prefixed by its size.
+static inline bool write_message(int fd, PipeLocks *locks_p, const Bytes& message)
+{
+    u64 size = message.m_bytes->size();
+
+    pthread_mutex_lock(&locks_p->write);
+    bool ok = (write_all(fd, (const u8 *)&size, sizeof(size))
+               && write_all(fd, message.m_bytes->data(), size));
+    pthread_mutex_unlock(&locks_p->write);
+
+    return ok;
+}
+
+enum class ReadResult {
+    OK,
+    WOULD_BLOCK,
+    END_OF_FILE
+};
+
+// Reads a message, if any. Another process may have read the message
+// that made the pipe readable, in which case there is nothing to read.
+static inline ReadResult read_message(int fd, PipeLocks *locks_p, Bytes& message)
+{
+    u64 size;
+    ssize_t res;
+    ReadResult result = ReadResult::OK;
+
+    pthread_mutex_lock(&locks_p->read);
+
+    do {
+        res = ::read(fd, &size, 1);
+    } while ((res < 0) && (errno == EINTR));
+
+    if (res == 0) {
+        result = ReadResult::END_OF_FILE;
+    } else if (res < 0) {
+        result = ReadResult::WOULD_BLOCK;
+    } else if (!read_all(fd, (u8 *)&size + 1, sizeof(size) - 1)) {
+        result = ReadResult::END_OF_FILE;
+    } else {
+        message.m_bytes = mys::make_shared<std::vector<u8>>(size);
+
+        if (!read_all(fd, message.m_bytes->data(), size)) {
+            result = ReadResult::END_OF_FILE;
+        }
+    }
+
+    pthread_mutex_unlock(&locks_p->read);
+
+    return result;
+}
+
+// Creates a pipe with non-blocking read end. Its buffer is made
+// larger where possible, so that bigger messages can be written
+// without waiting for a reader.
+static inline void create_pipe(int *fds_p)
+{
+    if (pipe(fds_p) != 0) {
+        std::cerr << "error: failed to create pipe" << std::endl;
+        abort();
+    }
+
+    fcntl(fds_p[0], F_SETFL, fcntl(fds_p[0], F_GETFL) | O_NONBLOCK);
+#if defined(F_SETPIPE_SZ)
+    fcntl(fds_p[1], F_SETPIPE_SZ, 1024 * 1024);
+#endif
+}
+
+// Forks a process that runs given function and then exits. Returns
+// the process id in the parent.
+template<typename F>
+pid_t fork_and_run(F function)
+{
+    // Buffered output would otherwise be written by both processes.
+    std::cout.flush();
+
+    pid_t pid = fork();
+
+    if (pid < 0) {
+        std::cerr << "error: failed to fork" << std::endl;
+        abort();
+    } else if (pid == 0) {
+        int code = 0;
+
+        init_after_fork();
+
+        try {
+            function();
+        } catch (const __Error& e) {
+            print_error_traceback(e.m_error, std::cerr);
+            std::cerr << PrintString(e.m_error->__str__()) << std::endl;
+            code = 1;
+        }
+
+        std::cout.flush();
+        _exit(code);
+    }
+
+    return pid;
+}
+
+// Waits for given process to exit and returns its exit code, or 128
+// plus the signal number if killed by a signal.
+static inline i64 wait_process(pid_t pid)
+{
+    int status;
+
+    while (waitpid(pid, &status, 0) < 0) {
+        if (errno != EINTR) {
+            return -1;
+        }
+    }
+
+    if (WIFEXITED(status)) {
+        return WEXITSTATUS(status);
+    } else {
+        return 128 + WTERMSIG(status);
+    }
+}
+
+// Function results are prefixed by the index of their function.
+template<typename R>
+Bytes encode_result(i64 index, const R& value)
+{
+    Encoder encoder;
+    Bytes message;
+
+    encoder.write_value(index);
+    encode(encoder, value);
+    message.m_bytes = mys::make_shared<std::vector<u8>>(std::move(encoder.m_buf));
+
+    return message;
+}
+
+static inline i64 decode_index(const Bytes& message)
+{
+    Decoder decoder(*message.m_bytes);
+
+    return decoder.read_value<i64>();
+}
+
+template<typename R>
+R decode_result(const Bytes& message)
+{
+    Decoder decoder(*message.m_bytes);
+    R value;
+
+    decoder.read_value<i64>();
+    decode(decoder, value);
+
+    return value;
+}
+
+// Index of the next function to call, shared by all workers of a
+// call.
+static inline std::atomic<i64> *create_next_index()
+{
+    return new (map_shared(sizeof(std::atomic<i64>))) std::atomic<i64>(0);
+}
+
+// Calls functions in given list in a worker process, taking the next
+// function to call from the shared index until all are called, and
+// writes their results to given pipe. All workers stop taking new
+// functions if one fails.
+template<typename L>
+void call_functions(const L& funs,
+                    std::atomic<i64> *next_index_p,
+                    int fd,
+                    PipeLocks *locks_p)
+{
+    i64 length = funs->m_list.size();
+    i64 index;
+
+    while ((index = next_index_p->fetch_add(1)) < length) {
+        try {
+            Bytes message = encode_result(index, funs->m_list[index]->call());
+
+            if (!write_message(fd, locks_p, message)) {
+                _exit(1);
+            }
+        } catch (...) {
+            next_index_p->store(length);
+            throw;
+        }
+    }
+}
+
+}
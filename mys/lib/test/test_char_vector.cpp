@@ -0,0 +1,69 @@
+#include <string>
+#include "catch.hpp"
+#include "mys/types/char_vector.hpp"
+
+using mys::CharVector;
+using mys::Char;
+
+static mys::shared_ptr<CharVector> make_chars(const std::string& data)
+{
+    auto chars = mys::make_shared<CharVector>();
+
+    chars->append((const u8 *)data.data(), (const u8 *)data.data() + data.size());
+
+    return chars;
+}
+
+static std::string to_string(const CharVector& chars)
+{
+    return std::string((const char *)chars.latin1(), chars.size());
+}
+
+TEST_CASE("Views borrow long Latin-1 characters")
+{
+    auto chars = make_chars(std::string(20, 'a') + std::string(20, 'b'));
+    auto view = CharVector::view(chars, 10, 40);
+
+    REQUIRE(view->latin1() == chars->latin1() + 10);
+    REQUIRE(to_string(*view) == std::string(10, 'a') + std::string(20, 'b'));
+    REQUIRE(chars.use_count() == 2);
+    REQUIRE(view->hash() == make_chars(to_string(*view))->hash());
+
+    // Views of views borrow from the owner.
+    auto view_of_view = CharVector::view(view, 5, 25);
+
+    REQUIRE(view_of_view->latin1() == chars->latin1() + 15);
+    REQUIRE(view_of_view->m_owner.get() == chars.get());
+    REQUIRE(chars.use_count() == 3);
+
+    // The characters are copied when a view is modified.
+    view->push_back(Char('c'));
+
+    REQUIRE(view->latin1() != chars->latin1() + 10);
+    REQUIRE(to_string(*view) == std::string(10, 'a') + std::string(20, 'b') + "c");
+    REQUIRE(to_string(*chars) == std::string(20, 'a') + std::string(20, 'b'));
+    REQUIRE(chars.use_count() == 2);
+
+    view_of_view->clear();
+
+    REQUIRE(view_of_view->size() == 0);
+    REQUIRE(chars.use_count() == 1);
+}
+
+TEST_CASE("Views copy short and wide characters")
+{
+    auto chars = make_chars(std::string(40, 'a'));
+    auto view = CharVector::view(chars, 0, 16);
+
+    REQUIRE(view->latin1() != chars->latin1());
+    REQUIRE(view->size() == 16);
+    REQUIRE(chars.use_count() == 1);
+    REQUIRE(CharVector::view(chars, 20, 10)->size() == 0);
+
+    chars->push_back(Char(0x4e00));
+    view = CharVector::view(chars, 0, 30);
+
+    REQUIRE(view->size() == 30);
+    REQUIRE(!view->is_wide());
+    REQUIRE(chars.use_count() == 1);
+}
@@ -424,6 +424,99 @@ TEST_CASE("Statistics 3")
     REQUIRE(number_of_object_frees() == 2);
 }
 
+class Destroyed {
+public:
+    bool *m_destroyed_p;
+
+    Destroyed(bool *destroyed_p) : m_destroyed_p(destroyed_p)
+    {
+    }
+
+    ~Destroyed()
+    {
+        *m_destroyed_p = true;
+    }
+};
+
+TEST_CASE("Stack object")
+{
+    bool destroyed = false;
+
+    reset_statistics();
+
+    {
+        mys::StackObject<Destroyed> storage;
+        auto a = storage.make(&destroyed);
+        REQUIRE(a.use_count() == 2);
+        REQUIRE(((uintptr_t)a.get() % 16) == 0);
+
+        {
+            auto b = a;
+            REQUIRE(a.use_count() == 3);
+        }
+
+        REQUIRE(a.use_count() == 2);
+        REQUIRE(!destroyed);
+    }
+
+    REQUIRE(destroyed);
+    REQUIRE(number_of_allocated_objects() == 0);
+    REQUIRE(number_of_object_frees() == 0);
+}
+
+TEST_CASE("Stack object constructor throws")
+{
+    mys::StackObject<A> storage;
+    shared_ptr<A> a;
+
+    try {
+        a = storage.make();
+        FAIL();
+    } catch (const std::bad_alloc& e) {
+    }
+
+    REQUIRE(!a);
+}
+
+#if !defined(MYS_MEMORY_MALLOC)
+
+struct Large {
+    char data[1000];
+};
+
+TEST_CASE("Memory pool reuse")
+{
+    auto a = make_shared<int>(1);
+    int *a_p = a.get();
+    a = nullptr;
+
+    long long begin_number_of_pool_reuses = mys::number_of_pool_reuses;
+    long long begin_number_of_large_allocations =
+        mys::number_of_large_allocations;
+
+    // A freed block is reused by the next allocation of the same size
+    // class.
+    auto b = make_shared<int>(2);
+    REQUIRE(b.get() == a_p);
+    REQUIRE(*b == 2);
+    REQUIRE(mys::number_of_pool_reuses == begin_number_of_pool_reuses + 1);
+
+    // Large objects are not pooled.
+    auto c = make_shared<Large>();
+    REQUIRE(mys::number_of_large_allocations
+            == begin_number_of_large_allocations + 1);
+}
+
+TEST_CASE("Memory pool alignment")
+{
+    for (int i = 0; i < 100; i++) {
+        auto a = make_shared<long double>(1.0);
+        REQUIRE(((uintptr_t)a.get() % 16) == 0);
+    }
+}
+
+#endif
+
 class Item {
 public:
     int m_x;
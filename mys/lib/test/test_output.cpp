@@ -0,0 +1,75 @@
+#include "catch.hpp"
+#include "mys/output.hpp"
+#include <unistd.h>
+#include <fcntl.h>
+#include <ostream>
+#include <string>
+
+// Returns everything available in given non-blocking pipe.
+static std::string read_pipe(int fd)
+{
+    std::string data;
+    char buf[4096];
+    ssize_t size;
+
+    while ((size = read(fd, &buf[0], sizeof(buf))) > 0) {
+        data.append(&buf[0], size);
+    }
+
+    return data;
+}
+
+TEST_CASE("Output buffered until flushed")
+{
+    int fds[2];
+
+    REQUIRE(pipe(fds) == 0);
+    REQUIRE(fcntl(fds[0], F_SETFL, O_NONBLOCK) == 0);
+
+    {
+        mys::OutputBuffer buffer(fds[1]);
+        std::ostream os(&buffer);
+
+        os << "Hello" << '\n' << 5 << "\n";
+        REQUIRE(read_pipe(fds[0]) == "");
+        os << std::flush;
+        REQUIRE(read_pipe(fds[0]) == "Hello\n5\n");
+    }
+
+    close(fds[0]);
+    close(fds[1]);
+}
+
+TEST_CASE("Output larger than buffer")
+{
+    int fds[2];
+    std::string line(1000, 'a');
+    std::string big(200000, 'b');
+    std::string data;
+
+    REQUIRE(pipe(fds) == 0);
+    REQUIRE(fcntl(fds[0], F_SETFL, O_NONBLOCK) == 0);
+    REQUIRE(fcntl(fds[1], F_SETPIPE_SZ, 1048576) > 0);
+
+    {
+        mys::OutputBuffer buffer(fds[1]);
+        std::ostream os(&buffer);
+
+        for (int i = 0; i < 100; i++) {
+            os << line;
+        }
+
+        os << big;
+        os.put('c');
+        os << std::flush;
+    }
+
+    data = read_pipe(fds[0]);
+    REQUIRE(data.size() == 100 * line.size() + big.size() + 1);
+    REQUIRE(data.substr(0, line.size()) == line);
+    REQUIRE(data.substr(100 * line.size(), big.size()) == big);
+    REQUIRE(data.back() == 'c');
+
+    close(fds[0]);
+    close(fds[1]);
+}
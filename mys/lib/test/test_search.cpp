@@ -0,0 +1,94 @@
+#include <algorithm>
+#include <random>
+#include "catch.hpp"
+#include "mys/search.hpp"
+
+using mys::Searcher;
+
+template<typename H, typename N>
+static void check(const std::vector<H>& haystack, const std::vector<N>& needle)
+{
+    auto is_equal = [](auto value_1, auto value_2) {
+        return (u32)value_1 == (u32)value_2;
+    };
+    auto it = std::search(haystack.begin(), haystack.end(),
+                          needle.begin(), needle.end(),
+                          is_equal);
+    i64 expected = (it == haystack.end()) ? -1 : it - haystack.begin();
+
+    if (needle.empty()) {
+        expected = 0;
+    }
+
+    REQUIRE(Searcher(needle.data(), needle.size()).find(haystack.data(),
+                                                        haystack.size())
+            == expected);
+
+    it = std::find_end(haystack.begin(), haystack.end(),
+                       needle.begin(), needle.end(),
+                       is_equal);
+    expected = (it == haystack.end()) ? -1 : it - haystack.begin();
+
+    if (needle.empty()) {
+        expected = haystack.size();
+    }
+
+    REQUIRE(Searcher(needle.data(), needle.size(), true).find(haystack.data(),
+                                                              haystack.size())
+            == expected);
+}
+
+TEST_CASE("Search")
+{
+    std::vector<u8> haystack = {'a', 'b', 'c', 'a', 'b', 'c', 'd'};
+
+    check(haystack, std::vector<u8>{});
+    check(haystack, std::vector<u8>{'a'});
+    check(haystack, std::vector<u8>{'d'});
+    check(haystack, std::vector<u8>{'e'});
+    check(haystack, std::vector<u8>{'b', 'c'});
+    check(haystack, std::vector<u8>{'a', 'b', 'c', 'd'});
+    check(haystack, std::vector<u8>{'a', 'b', 'c', 'e'});
+    check(haystack, std::vector<u8>{'a', 'b', 'c', 'a', 'b', 'c', 'd', 'e'});
+    check(std::vector<u32>{'a', 0x1f600, 'b', 0x100 + 'b'},
+          std::vector<u32>{'b'});
+    check(std::vector<u32>{'a', 0x1f600, 0x100 + 'b', 'b', 'c', 'd'},
+          std::vector<u8>{'b', 'c', 'd'});
+    check(std::vector<u32>{0x100 + 'b', 0x100 + 'c', 0x100 + 'd', 0x100 + 'e', 'x'},
+          std::vector<u32>{'b', 'c', 'd', 'e'});
+}
+
+TEST_CASE("Search random")
+{
+    std::mt19937 generator(1);
+    std::uniform_int_distribution<int> size(0, 80);
+    std::uniform_int_distribution<int> letter(0, 2);
+
+    for (int i = 0; i < 5000; i++) {
+        std::vector<u8> haystack(size(generator));
+        std::vector<u8> needle(size(generator) % 8);
+
+        for (auto& value : haystack) {
+            value = 'a' + letter(generator);
+        }
+
+        for (auto& value : needle) {
+            value = 'a' + letter(generator);
+        }
+
+        check(haystack, needle);
+
+        std::vector<u32> wide_haystack(haystack.begin(), haystack.end());
+        std::vector<u32> wide_needle(needle.begin(), needle.end());
+
+        check(wide_haystack, needle);
+
+        for (auto& value : wide_haystack) {
+            if (letter(generator) == 0) {
+                value += 0x100;
+            }
+        }
+
+        check(wide_haystack, wide_needle);
+    }
+}
@@ -0,0 +1,114 @@
+#include <string>
+#include "catch.hpp"
+#include "mys/types/char_vector.hpp"
+#include "mys/utf8.hpp"
+
+using mys::CharVector;
+using mys::ascii_length;
+using mys::decode_utf8;
+using mys::encode_utf8;
+using mys::utf8_size;
+
+static bool decode(const std::string& data, CharVector& chars)
+{
+    return decode_utf8((const u8 *)data.data(), data.size(), chars);
+}
+
+static std::string encode(const CharVector& chars)
+{
+    std::string data(utf8_size(chars, 0, chars.size()), '\0');
+
+    data.resize(encode_utf8(chars, 0, chars.size(), (u8 *)data.data()));
+
+    return data;
+}
+
+TEST_CASE("ASCII length")
+{
+    std::string data(100, 'a');
+
+    REQUIRE(ascii_length((const u8 *)data.data(), 0) == 0);
+    REQUIRE(ascii_length((const u8 *)data.data(), data.size()) == 100);
+
+    for (size_t i = 0; i < data.size(); i++) {
+        data[i] = '\xe5';
+        REQUIRE(ascii_length((const u8 *)data.data(), data.size()) == i);
+        data[i] = 'a';
+    }
+
+    std::vector<u32> ucs4(100, 'a');
+
+    REQUIRE(ascii_length(ucs4.data(), ucs4.size()) == 100);
+
+    for (size_t i = 0; i < ucs4.size(); i++) {
+        ucs4[i] = 0x80000000;
+        REQUIRE(ascii_length(ucs4.data(), ucs4.size()) == i);
+        ucs4[i] = 0x4e00;
+        REQUIRE(ascii_length(ucs4.data(), ucs4.size()) == i);
+        ucs4[i] = 'a';
+    }
+}
+
+TEST_CASE("Decode and encode UTF-8")
+{
+    std::string data = std::string(40, 'a') + "\xc3\xb6" + std::string(20, 'b');
+    CharVector chars;
+
+    REQUIRE(decode(data, chars));
+    REQUIRE(chars.size() == 61);
+    REQUIRE(!chars.is_wide());
+    REQUIRE(chars[40].m_value == 0xf6);
+    REQUIRE(encode(chars) == data);
+
+    data.clear();
+
+    for (int i = 0; i < 300; i++) {
+        data += "\xe5\xa3\xab";
+    }
+
+    data += "x\xf0\x9f\x98\x80";
+    chars.clear();
+
+    REQUIRE(decode(data, chars));
+    REQUIRE(chars.size() == 302);
+    REQUIRE(chars.is_wide());
+    REQUIRE(chars[0].m_value == 0x58eb);
+    REQUIRE(chars[300].m_value == 'x');
+    REQUIRE(chars[301].m_value == 0x1f600);
+    REQUIRE(encode(chars) == data);
+}
+
+TEST_CASE("Decode invalid UTF-8")
+{
+    const char *invalid[] = {
+        // Unexpected continuation byte.
+        "\x80",
+        // Overlong encodings.
+        "\xc0\xaf",
+        "\xc1\xbf",
+        "\xe0\x80\xaf",
+        "\xf0\x80\x80\xaf",
+        // Surrogate.
+        "\xed\xa0\x80",
+        // Above U+10FFFF.
+        "\xf4\x90\x80\x80",
+        "\xf5\x80\x80\x80",
+        // Truncated.
+        "\xe5\xa3",
+        "ab\xf0\x9f\x98",
+        // Missing continuation byte.
+        "\xe5\x41\xab"
+    };
+
+    for (auto data_p : invalid) {
+        CharVector chars;
+
+        REQUIRE(!decode(data_p, chars));
+    }
+
+    CharVector chars;
+
+    REQUIRE(decode("\xed\x9f\xbf\xf4\x8f\xbf\xbf", chars));
+    REQUIRE(chars[0].m_value == 0xd7ff);
+    REQUIRE(chars[1].m_value == 0x10ffff);
+}
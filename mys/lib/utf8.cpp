@@ -0,0 +1,273 @@
+#include "mys/utf8.hpp"
+#include "mys/types/char_vector.hpp"
+
+namespace mys {
+
+size_t encode_utf8(char *dst_p, i32 ch)
+{
+    size_t size;
+
+    if (ch < 0x80) {
+        dst_p[0] = ch;
+        size = 1;
+    } else if (ch < 0x800) {
+        dst_p[0] = (ch >> 6) | 0xc0;
+        dst_p[1] = (ch & 0x3f) | 0x80;
+        size = 2;
+    } else if (ch < 0x10000) {
+        dst_p[0] = (ch >> 0xc) | 0xe0;
+        dst_p[1] = ((ch >> 6) & 0x3f) | 0x80;
+        dst_p[2] = (ch & 0x3f) | 0x80;
+        size = 3;
+    } else if (ch < 0x200000) {
+        dst_p[0] = (ch >> 0x12) | 0xf0;
+        dst_p[1] = ((ch >> 0xc) & 0x3f) | 0x80;
+        dst_p[2] = ((ch >> 6) & 0x3f) | 0x80;
+        dst_p[3] = (ch & 0x3f) | 0x80;
+        size = 4;
+    } else {
+        size = 0;
+    }
+
+    return size;
+}
+
+static size_t utf8_size_latin1(const u8 *data_p, size_t size)
+{
+    size_t res = size;
+
+    for (size_t i = 0; i < size; i++) {
+        res += (data_p[i] >> 7);
+    }
+
+    return res;
+}
+
+static size_t utf8_size_ucs4(const u32 *data_p, size_t size)
+{
+    size_t res = 0;
+
+    for (size_t i = 0; i < size; i++) {
+        u32 ch = data_p[i];
+
+        if (ch < 0x80) {
+            res += 1;
+        } else if (ch < 0x800) {
+            res += 2;
+        } else if (ch < 0x10000) {
+            res += 3;
+        } else if (ch < 0x200000) {
+            res += 4;
+        }
+    }
+
+    return res;
+}
+
+size_t utf8_size(const CharVector& chars, size_t begin, size_t end)
+{
+    if (chars.is_wide()) {
+        return utf8_size_ucs4(chars.m_ucs4.data() + begin, end - begin);
+    } else {
+        return utf8_size_latin1(chars.latin1() + begin, end - begin);
+    }
+}
+
+// ASCII runs are found with ascii_length() and copied at once, and
+// other characters are encoded one at a time.
+template<typename T>
+static size_t encode_utf8_chars(const T *data_p, size_t size, u8 *dst_p)
+{
+    u8 *begin_p = dst_p;
+    size_t i = 0;
+    size_t length;
+
+    while (i < size) {
+        length = ascii_length(&data_p[i], size - i);
+
+        if constexpr (sizeof(T) == 1) {
+            std::memcpy(dst_p, &data_p[i], length);
+        } else {
+            std::copy(&data_p[i], &data_p[i + length], dst_p);
+        }
+
+        dst_p += length;
+        i += length;
+
+        while ((i < size) && (data_p[i] >= 0x80)) {
+            dst_p += encode_utf8((char *)dst_p, data_p[i]);
+            i++;
+        }
+    }
+
+    return dst_p - begin_p;
+}
+
+size_t encode_utf8(const CharVector& chars, size_t begin, size_t end, u8 *dst_p)
+{
+    if (chars.is_wide()) {
+        return encode_utf8_chars(chars.m_ucs4.data() + begin, end - begin, dst_p);
+    } else {
+        return encode_utf8_chars(chars.latin1() + begin, end - begin, dst_p);
+    }
+}
+
+// Decode one multi-byte character. Returns its size, or zero if it
+// is not valid UTF-8. Overlong encodings, surrogates and characters
+// above U+10FFFF are invalid.
+static inline size_t decode_utf8_multi_byte(const u8 *data_p,
+                                            size_t size,
+                                            u32 *ch_p)
+{
+    u32 byte_0 = data_p[0];
+    u32 ch;
+
+    if ((byte_0 & 0xe0) == 0xc0) {
+        if ((size < 2) || ((data_p[1] & 0xc0) != 0x80)) {
+            return 0;
+        }
+
+        ch = (((byte_0 & 0x1f) << 6) | (data_p[1] & 0x3f));
+
+        if (ch < 0x80) {
+            return 0;
+        }
+
+        *ch_p = ch;
+
+        return 2;
+    } else if ((byte_0 & 0xf0) == 0xe0) {
+        if ((size < 3)
+            || ((data_p[1] & 0xc0) != 0x80)
+            || ((data_p[2] & 0xc0) != 0x80)) {
+            return 0;
+        }
+
+        ch = (((byte_0 & 0x0f) << 12)
+              | ((data_p[1] & 0x3f) << 6)
+              | (data_p[2] & 0x3f));
+
+        if ((ch < 0x800) || ((ch >= 0xd800) && (ch <= 0xdfff))) {
+            return 0;
+        }
+
+        *ch_p = ch;
+
+        return 3;
+    } else if ((byte_0 & 0xf8) == 0xf0) {
+        if ((size < 4)
+            || ((data_p[1] & 0xc0) != 0x80)
+            || ((data_p[2] & 0xc0) != 0x80)
+            || ((data_p[3] & 0xc0) != 0x80)) {
+            return 0;
+        }
+
+        ch = (((byte_0 & 0x07) << 18)
+              | ((data_p[1] & 0x3f) << 12)
+              | ((data_p[2] & 0x3f) << 6)
+              | (data_p[3] & 0x3f));
+
+        if ((ch < 0x10000) || (ch > 0x10ffff)) {
+            return 0;
+        }
+
+        *ch_p = ch;
+
+        return 4;
+    } else {
+        return 0;
+    }
+}
+
+// True if given UTF-8 data has any wide characters (above U+00FF),
+// assuming it is valid.
+static bool utf8_is_wide(const u8 *data_p, size_t size)
+{
+    u8 max = 0;
+
+    for (size_t i = 0; i < size; i++) {
+        max = std::max(max, data_p[i]);
+    }
+
+    return max >= 0xc4;
+}
+
+// Number of characters in given UTF-8 data, assuming it is valid.
+static size_t utf8_length(const u8 *data_p, size_t size)
+{
+    size_t length = 0;
+
+    for (size_t i = 0; i < size; i++) {
+        length += ((data_p[i] & 0xc0) != 0x80);
+    }
+
+    return length;
+}
+
+// The vector is sized once before decoding. Long ASCII runs are
+// found with ascii_length() and appended at once. Other characters,
+// including short ASCII runs, are collected in a buffer that is
+// appended when full or when a long ASCII run starts.
+bool decode_utf8(const u8 *data_p, size_t size, CharVector& chars)
+{
+    u32 buf[256];
+    size_t buf_size = 0;
+    size_t pos;
+    size_t length;
+
+    pos = ascii_length(data_p, size);
+    chars.append(data_p, data_p + pos);
+
+    if (pos == size) {
+        return true;
+    }
+
+    if (utf8_is_wide(&data_p[pos], size - pos)) {
+        chars.reserve(chars.size() + utf8_length(&data_p[pos], size - pos), true);
+    } else {
+        chars.reserve(chars.size() + size - pos);
+    }
+
+    while (pos < size) {
+        if (data_p[pos] < 0x80) {
+            length = ascii_length(&data_p[pos], size - pos);
+
+            if (length < 32) {
+                if (buf_size + length > 256) {
+                    chars.append(&buf[0], &buf[buf_size]);
+                    buf_size = 0;
+                }
+
+                std::copy(&data_p[pos], &data_p[pos + length], &buf[buf_size]);
+                buf_size += length;
+            } else {
+                chars.append(&buf[0], &buf[buf_size]);
+                buf_size = 0;
+                chars.append(&data_p[pos], &data_p[pos + length]);
+            }
+        } else {
+            if (buf_size == 256) {
+                chars.append(&buf[0], &buf[buf_size]);
+                buf_size = 0;
+            }
+
+            length = decode_utf8_multi_byte(&data_p[pos],
+                                            size - pos,
+                                            &buf[buf_size]);
+
+            if (length == 0) {
+                return false;
+            }
+
+            buf_size++;
+        }
+
+        pos += length;
+    }
+
+    chars.append(&buf[0], &buf[buf_size]);
+
+    return true;
+}
+
+}
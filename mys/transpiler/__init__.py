@@ -20,6 +20,9 @@ from .definitions import make_fully_qualified_names_module
 from .header_visitor import HeaderVisitor
 from .import_order import resolve_import_order
 from .imports_visitor import ImportsVisitor
+from .incremental import interface_hash
+from .incremental import outputs_exist
+from .incremental import source_hash
 from .source_visitor import SourceVisitor
 from .traits import ensure_that_trait_methods_are_implemented
 from .utils import CompileError
@@ -139,7 +142,51 @@ class Source:
             f'  skip_tests: {self.skip_tests}'
         ])
 
-def transpile(sources, coverage=False):
+def find_generic_modules(definitions):
+    generic_modules = set()
+
+    for module, module_definitions in definitions.items():
+        for klass in module_definitions.classes.values():
+            if klass.is_generic():
+                generic_modules.add(module)
+
+        for functions in module_definitions.functions.values():
+            for function in functions:
+                if function.is_generic():
+                    generic_modules.add(module)
+
+    return generic_modules
+
+
+def find_module_imports(sources, definitions):
+    module_imports = {}
+
+    for source in sources:
+        module_imports[source.module] = []
+
+        for imports in definitions[source.module].imports.values():
+            for imported_module, _ in imports:
+                # Missing modules are reported when visiting the
+                # importing module.
+                if imported_module not in definitions:
+                    continue
+
+                if imported_module not in module_imports[source.module]:
+                    module_imports[source.module].append(imported_module)
+
+    return module_imports
+
+
+def transpile(sources, coverage=False, cache=None):
+    """Transpile given sources to C++. Returns a list of early header,
+    header and source code for each source.
+
+    If given, `cache` is used to only transpile modules that may have
+    changed since last time. None is returned for other modules, as
+    their previously generated code is still valid.
+
+    """
+
     visitors = {}
     specialized_functions = {}
     specialized_classes = {}
@@ -160,6 +207,12 @@ def transpile(sources, coverage=False):
 
     source = None
 
+    if cache is not None:
+        hashes = {
+            source.module: (source_hash(source, coverage), interface_hash(tree))
+            for source, tree in zip(sources, trees)
+        }
+
     try:
         for source, tree in zip(sources, trees):
             ImportsVisitor().visit(tree)
@@ -188,7 +241,28 @@ def transpile(sources, coverage=False):
             make_fully_qualified_names_module(source.module,
                                               definitions[source.module])
 
+        module_imports = find_module_imports(sources, definitions)
+        ordered_modules = resolve_import_order(module_imports)
+
+        if cache is None:
+            modules_to_transpile = set(source_by_module)
+        else:
+            modules_to_transpile = cache.find_modules_to_transpile(
+                {
+                    source.module: (hashes[source.module][0]
+                                    if outputs_exist(source)
+                                    else None,
+                                    hashes[source.module][1])
+                    for source in sources
+                },
+                module_imports,
+                find_generic_modules(definitions),
+                ordered_modules)
+
         for source, tree in zip(sources, trees):
+            if source.module not in modules_to_transpile:
+                continue
+
             header_visitor, source_visitor = transpile_file(
                 tree,
                 source.source_lines,
@@ -245,27 +319,26 @@ def transpile(sources, coverage=False):
                             e.offset)
                         + f'CompileError: {e.message}'))
 
-        module_imports = {}
-
-        for source in sources:
-            module_imports[source.module] = []
+        if ordered_modules[-1] in visitors:
+            last_source_visitor = visitors[ordered_modules[-1]][1]
+            last_source_visitor.add_application_init(ordered_modules)
+            last_source_visitor.add_application_exit(ordered_modules)
 
-            for imports in definitions[source.module].imports.values():
-                for imported_module, _ in imports:
-                    if imported_module not in module_imports[source.module]:
-                        module_imports[source.module].append(imported_module)
+        generated = []
 
-        ordered_modules = resolve_import_order(module_imports)
-        last_source_visitor = visitors[ordered_modules[-1]][1]
-        last_source_visitor.add_application_init(ordered_modules)
-        last_source_visitor.add_application_exit(ordered_modules)
-
-        return [
-            (header_visitor.format_early_hpp(),
-             header_visitor.format_hpp(),
-             source_visitor.format_cpp())
-            for header_visitor, source_visitor in visitors.values()
-        ]
+        for source in sources:
+            if source.module in visitors:
+                header_visitor, source_visitor = visitors[source.module]
+                generated.append((header_visitor.format_early_hpp(),
+                                  header_visitor.format_hpp(),
+                                  source_visitor.format_cpp()))
+            else:
+                generated.append(None)
+
+        if cache is not None:
+            cache.update(hashes, ordered_modules)
+
+        return generated
     except CompileError as e:
         raise TranspilerError(
             style_traceback(
@@ -1,7 +1,9 @@
+import re
 import textwrap
 
 from ..parser import ast
 from .constant_visitor import is_constant
+from .escape_analysis import is_stack_allocatable
 from .generics import TypeVisitor
 from .generics import add_generic_class
 from .generics import find_chosen_types
@@ -40,19 +42,24 @@ from .utils import is_integer_type
 from .utils import is_primitive_type
 from .utils import is_private
 from .utils import is_regex
+from .utils import is_value_tuple
 from .utils import make_integer_literal
 from .utils import make_name
 from .utils import make_shared
 from .utils import make_shared_dict
 from .utils import make_shared_list
 from .utils import make_shared_set
+from .utils import make_shared_tuple
 from .utils import mys_to_cpp_type
 from .utils import raise_if_wrong_types
 from .utils import raise_if_wrong_visited_type
 from .utils import raise_types_differs
 from .utils import split_full_name
+from .utils import split_make_shared
+from .utils import strip_make_shared_tuple
 from .utils import strip_optional
 from .utils import strip_optional_with_result
+from .utils import value_tuple_type
 from .value_check_type_visitor import ValueCheckTypeVisitor
 from .value_type_visitor import ValueTypeVisitor
 from .value_type_visitor import intersection_of
@@ -66,6 +73,9 @@ BOOL_OPS = {
 
 FOR_LOOP_FUNCS = set(['enumerate', 'range', 'reversed', 'slice', 'zip'])
 
+RE_DECLARATION_LIKE = re.compile(
+    r'^(mys::)?(Bool|Bytes|Char|Regex|String)\(\w+\)$')
+
 
 class _Handler:
 
@@ -88,6 +98,33 @@ def is_for_loop_func_call(node):
     return node.iter.func.id in FOR_LOOP_FUNCS
 
 
+def is_assigned_in(name, nodes):
+    """Returns true if given variable is assigned to in given statements.
+
+    """
+
+    for node in nodes:
+        for child in ast.walk(node):
+            if (isinstance(child, ast.Name)
+                    and child.id == name
+                    and isinstance(child.ctx, ast.Store)):
+                return True
+
+    return False
+
+
+def loop_variable_type(name, body):
+    """Loop variables are references to the items iterated over, unless
+    assigned to in the loop body.
+
+    """
+
+    if is_assigned_in(name, body):
+        return 'auto'
+    else:
+        return 'const auto&'
+
+
 def strip_lock(text):
     if text.endswith('.lock()'):
         return text[:-7]
@@ -117,6 +154,8 @@ def wrap_not_none(obj, mys_type):
         return f'mys::regex_not_none({obj})'
     elif mys_type == 'regexmatch':
         return f'mys::regexmatch_not_none({obj})'
+    elif mys_type == 'stringbuilder':
+        return f'mys::stringbuilder_not_none({obj})'
     elif mys_type == 'bytes':
         return f'mys::bytes_not_none({obj})'
     else:
@@ -131,6 +170,8 @@ def compare_is_variable(variable, variable_mys_type):
             variable = f'{variable}.m_match_data'
         elif variable_mys_type == 'bytes':
             variable = f'{variable}.m_bytes'
+        elif variable_mys_type == 'stringbuilder':
+            variable = f'{variable}.m_string'
 
     return variable
 
@@ -151,6 +192,8 @@ def compare_assert_is_variable(variable):
         variable = f'{variable[0]}.m_bytes'
     elif mys_type == 'regexmatch':
         variable = f'{variable[0]}.m_match_data'
+    elif mys_type == 'stringbuilder':
+        variable = f'{variable[0]}.m_string'
     else:
         variable = variable[0]
 
@@ -208,6 +251,8 @@ def format_str(value, mys_type, context, with_string_quotes):
         return f'regexmatch_str({value})'
     elif mys_type == 'regex':
         return f'regex_str({value})'
+    elif mys_type == 'stringbuilder':
+        return f'stringbuilder_str({value})'
     elif context.is_enum_defined(mys_type):
         return f'mys::String({value})'
     else:
@@ -230,6 +275,8 @@ def format_assert_str(value, mys_type, context):
         return f'regexmatch_str({value})'
     elif mys_type == 'regex':
         return f'regex_str({value})'
+    elif mys_type == 'stringbuilder':
+        return f'stringbuilder_str({value})'
     elif context.is_enum_defined(mys_type):
         return f'mys::String({value})'
     else:
@@ -624,6 +671,12 @@ class BaseVisitor(ast.NodeVisitor):
         else:
             raise CompileError("not supported", node)
 
+    def handle_stringbuilder(self, node):
+        raise_if_wrong_number_of_parameters(len(node.args), 0, node)
+        self.context.mys_type = 'stringbuilder'
+
+        return 'mys::StringBuilder(mys::make_shared<mys::String>(""))'
+
     def handle_set(self, node):
         raise_if_wrong_number_of_parameters(len(node.args), 1, node)
         value = self.visit(node.args[0])
@@ -858,6 +911,9 @@ class BaseVisitor(ast.NodeVisitor):
         else:
             code = f'{full_name}({args})'
 
+        if is_value_tuple(function.returns):
+            code = make_shared_tuple(code)
+
         return code
 
     def visit_call_class(self, mys_type, node):
@@ -898,6 +954,8 @@ class BaseVisitor(ast.NodeVisitor):
             code = self.handle_char(node)
         elif name == 'regex':
             code = self.handle_regex(node)
+        elif name == 'stringbuilder':
+            code = self.handle_stringbuilder(node)
         elif name == 'set':
             code = self.handle_set(node)
         elif name in FOR_LOOP_FUNCS:
@@ -1061,6 +1119,12 @@ class BaseVisitor(ast.NodeVisitor):
 
         return '.'
 
+    def visit_call_method_stringbuilder(self, name, node):
+        spec = get_builtin_method('stringbuilder', name, node)
+        self.context.mys_type = spec.returns
+
+        return '.'
+
     def visit_call_method_char(self, name, node):
         spec = get_builtin_method('char', name, node)
         self.context.mys_type = spec.returns
@@ -1132,6 +1196,7 @@ class BaseVisitor(ast.NodeVisitor):
         op = '->'
         mys_type = strip_optional(mys_type)
         is_macro = False
+        is_user_method = False
 
         if isinstance(mys_type, list):
             self.visit_call_method_list(name, mys_type, args, node.func)
@@ -1145,6 +1210,8 @@ class BaseVisitor(ast.NodeVisitor):
             op = self.visit_call_method_regexmatch(name, node.func)
         elif mys_type == 'regex':
             op = self.visit_call_method_regex(name, node.func)
+        elif mys_type == 'stringbuilder':
+            op = self.visit_call_method_stringbuilder(name, node.func)
         elif mys_type == 'char':
             op = self.visit_call_method_char(name, node.func)
         elif mys_type == 'bytes':
@@ -1154,8 +1221,10 @@ class BaseVisitor(ast.NodeVisitor):
                                                                      mys_type,
                                                                      value,
                                                                      node)
+            is_user_method = True
         elif self.context.is_trait_defined(mys_type):
             args = self.visit_call_method_trait(name, mys_type, node)
+            is_user_method = True
         elif is_primitive_type(mys_type):
             raise CompileError(f"primitive type '{mys_type}' do not have methods",
                                node.func)
@@ -1163,8 +1232,10 @@ class BaseVisitor(ast.NodeVisitor):
             raise CompileError('None has no methods', node.func)
         elif isinstance(mys_type, GenericType):
             value, args = self.visit_call_method_generic(name, mys_type, value, node)
+            is_user_method = True
         elif isinstance(mys_type, Weak):
             mys_type = mys_type.mys_type
+            is_user_method = True
 
             if self.context.is_class_defined(mys_type):
                 op, value, args, is_macro = self.visit_call_method_class(name,
@@ -1184,9 +1255,14 @@ class BaseVisitor(ast.NodeVisitor):
         args = ', '.join(args)
 
         if is_macro:
-            return f'[&]() {{ {value}{op}{make_name(name)}({args}) }}()'
+            code = f'[&]() {{ {value}{op}{make_name(name)}({args}) }}()'
         else:
-            return f'{value}{op}{make_name(name)}({args})'
+            code = f'{value}{op}{make_name(name)}({args})'
+
+        if is_user_method and is_value_tuple(self.context.mys_type):
+            code = make_shared_tuple(code)
+
+        return code
 
     def visit_call_generic_function(self, node):
         full_name = self.context.make_full_name(node.func.value.id, node.func)
@@ -1213,8 +1289,12 @@ class BaseVisitor(ast.NodeVisitor):
                                       specialized_function,
                                       node)
         self.context.mys_type = specialized_function.returns
+        code = f'{dot2ns(specialized_full_name)}({", ".join(args)})'
 
-        return f'{dot2ns(specialized_full_name)}({", ".join(args)})'
+        if is_value_tuple(specialized_function.returns):
+            code = make_shared_tuple(code)
+
+        return code
 
     def visit_call_generic_class(self, node):
         specialized_class, specialized_full_name = add_generic_class(
@@ -1289,7 +1369,10 @@ class BaseVisitor(ast.NodeVisitor):
         elif isinstance(node.value, str):
             self.context.mys_type = 'string'
 
-            return handle_string(node.value)
+            # Strings are immutable, so all uses of a literal can share
+            # one module level instance instead of allocating a new
+            # string every time the expression is evaluated.
+            return self.create_constant('mys::String', handle_string(node.value))
         elif isinstance(node.value, bool):
             self.context.mys_type = 'bool'
 
@@ -1314,12 +1397,27 @@ class BaseVisitor(ast.NodeVisitor):
         elif is_regex(node.value):
             self.context.mys_type = 'regex'
             args = ', '.join([handle_string(s) for s in node.value])
-            return f'Regex({args})'
+            literal = self.create_constant('mys::RegexLiteral',
+                                           f'mys::RegexLiteral({args})')
+            value = f'{literal}.get()'
+            # Compiled once when first used, so already a constant.
+            self.context.constant_variables.add(value)
+
+            return value
         else:
             raise InternalError(f"constant node {ast.dump(node)}", node)
 
     def visit_Expr(self, node):
-        return self.visit(node.value) + ';'
+        value = self.visit(node.value)
+
+        # Discarded tuples are not moved to the heap.
+        value = self.strip_returned_tuple(node.value, value) or value
+
+        # C++ parses 'Bytes(name);' as a variable declaration.
+        if RE_DECLARATION_LIKE.match(value):
+            value = f'({value})'
+
+        return value + ';'
 
     def visit_binop_class(self, node, left_value_type):
         left = self.visit_check_type(node.left, left_value_type)
@@ -1330,8 +1428,12 @@ class BaseVisitor(ast.NodeVisitor):
             node)
         right = self.visit_check_type(node.right, method.args[0][0].type)
         self.context.mys_type = method.returns
+        code = f'{left}->{op_method}({right})'
+
+        if is_value_tuple(method.returns):
+            code = make_shared_tuple(code)
 
-        return f'{left}->{op_method}({right})'
+        return code
 
     def visit_BinOp(self, node):
         left_value_type = ValueTypeVisitor(self.context).visit(node.left)
@@ -1500,24 +1602,32 @@ class BaseVisitor(ast.NodeVisitor):
         return make_shared_dict(key_cpp_type, value_cpp_type, items)
 
     def visit_for_list(self, node, value, mys_type):
+        """Items are accessed without bounds checks, as the list must not
+        be modified while iterated over, which is checked by comparing
+        its length with its length when the loop started.
+
+        """
+
         item_mys_type = mys_type[0]
         items = self.unique('items')
+        length = self.unique('length')
         i = self.unique('i')
-        target_type = mys_type_to_target_cpp_type(item_mys_type)
-
+        item = f'{items}->get_in_loop({i}, {length})'
         if isinstance(node.target, ast.Tuple):
             target = []
             item_mys_type = strip_optional(item_mys_type)
+            tuple_item = self.unique('item')
+            target.append(f'    const auto& {tuple_item} = {item};')
 
-            for j, item in enumerate(node.target.elts):
-                name = item.id
+            for j, elt in enumerate(node.target.elts):
+                name = elt.id
 
                 if not name.startswith('_'):
-                    self.context.define_local_variable(name, item_mys_type[j], item)
+                    self.context.define_local_variable(name, item_mys_type[j], elt)
                     target.append(
-                        f'    {target_type} {make_name(name)} = '
-                        f'std::get<{j}>('
-                        f'{items}->get({i})->m_tuple);')
+                        f'    {loop_variable_type(name, node.body)} '
+                        f'{make_name(name)} = '
+                        f'std::get<{j}>({tuple_item}->m_tuple);')
 
             target = '\n'.join(target)
         else:
@@ -1526,7 +1636,8 @@ class BaseVisitor(ast.NodeVisitor):
             if not name.startswith('_'):
                 self.context.define_local_variable(name, item_mys_type, node.target)
 
-            target = f'    {target_type} {name} = {items}->get({i});'
+            target_type = loop_variable_type(name, node.body)
+            target = f'    {target_type} {name} = {item};'
 
         body = indent('\n'.join([
             self.visit(item)
@@ -1535,7 +1646,8 @@ class BaseVisitor(ast.NodeVisitor):
 
         return [
             f'auto {items} = {value};',
-            f'for (auto {i} = 0; {i} < {items}->length(); {i}++) {{',
+            f'const size_t {length} = {items}->m_list.size();',
+            f'for (size_t {i} = 0; {i} < {length}; {i}++) {{',
             target,
             body,
             '}'
@@ -1553,9 +1665,15 @@ class BaseVisitor(ast.NodeVisitor):
         return body
 
     def visit_for_dict(self, node, dvalue, mys_type):
+        """Dicts must not be modified while iterated over, which is
+        checked when advancing to the next item.
+
+        """
+
         key_mys_type = mys_type.key_type
         value_mys_type = mys_type.value_type
         items = self.unique('items')
+        length = self.unique('length')
         i = self.unique('i')
 
         if (not isinstance(node.target, ast.Tuple)
@@ -1583,15 +1701,25 @@ class BaseVisitor(ast.NodeVisitor):
 
         return [
             f'auto {items} = {dvalue};',
-            f'for (auto {i} : {items}->m_map) {{',
-            f'    auto {make_name(key_name)} = {i}.first;',
-            f'    auto {make_name(value_name)} = {i}.second;',
+            f'const i64 {length} = shared_ptr_not_none({items})->length();',
+            f'for (auto {i} = {items}->begin(); {i} != {items}->end(); '
+            f'{items}->next_in_loop({i}, {length})) {{',
+            f'    {loop_variable_type(key_name, node.body)} '
+            f'{make_name(key_name)} = {i}->first;',
+            f'    {loop_variable_type(value_name, node.body)} '
+            f'{make_name(value_name)} = {i}->second;',
             body,
             '}'
         ]
 
     def visit_for_set(self, node, dvalue, mys_type):
+        """Sets must not be modified while iterated over, which is
+        checked when advancing to the next item.
+
+        """
+
         items = self.unique('items')
+        length = self.unique('length')
         i = self.unique('i')
         item_name = node.target.id
 
@@ -1605,8 +1733,11 @@ class BaseVisitor(ast.NodeVisitor):
 
         return [
             f'auto {items} = {dvalue};',
-            f'for (auto {i} : {items}->m_set) {{',
-            f'    auto {make_name(item_name)} = {i};',
+            f'const i64 {length} = shared_ptr_not_none({items})->length();',
+            f'for (auto {i} = {items}->begin(); {i} != {items}->end(); '
+            f'{items}->next_in_loop({i}, {length})) {{',
+            f'    {loop_variable_type(item_name, node.body)} '
+            f'{make_name(item_name)} = *{i};',
             body,
             '}'
         ]
@@ -1633,6 +1764,52 @@ class BaseVisitor(ast.NodeVisitor):
             '}'
         ]
 
+    def is_regex_find_all(self, node):
+        if not isinstance(node, ast.Call):
+            return False
+
+        if not isinstance(node.func, ast.Attribute):
+            return False
+
+        if node.func.attr != 'find_all':
+            return False
+
+        mys_type = ValueTypeVisitor(self.context).visit(node.func.value)
+
+        return strip_optional(mys_type) == 'regex'
+
+    def visit_for_regex_find_all(self, node):
+        """Finds one match per iteration instead of creating a list of all
+        matches.
+
+        """
+
+        if not isinstance(node.target, ast.Name):
+            raise CompileError("iteration over find_all() must be done on a "
+                               "single variable",
+                               node.target)
+
+        raise_if_wrong_number_of_parameters(len(node.iter.args), 1, node.iter)
+        regex = self.visit(node.iter.func.value)
+        regex = wrap_not_none(regex, self.context.mys_type)
+        string = self.visit_check_type(node.iter.args[0], 'string')
+        matches = self.unique('matches')
+        name = node.target.id
+
+        if not name.startswith('_'):
+            self.context.define_local_variable(name, 'regexmatch', node.target)
+
+        return [
+            f'mys::RegexMatchIterator {matches}({regex}, {string});',
+            'while (true) {',
+            f'    auto {make_name(name)} = {matches}.next();',
+            f'    if (!{make_name(name)}.m_match_data) {{',
+            '        break;',
+            '    }'
+        ] + self.visit_body(node.body) + [
+            '}'
+        ]
+
     def visit_iter_parameter(self, node, expected_mys_type=None):
         value = self.visit(node)
         mys_type = self.context.mys_type
@@ -1967,6 +2144,8 @@ class BaseVisitor(ast.NodeVisitor):
             code += self.visit_for_items_body(items)
             code += self.visit_body(node.body)
             code.append('}')
+        elif self.is_regex_find_all(node.iter):
+            code = self.visit_for_regex_find_all(node)
         else:
             value = self.visit(node.iter)
             mys_type = strip_optional(self.context.mys_type)
@@ -2064,6 +2243,9 @@ class BaseVisitor(ast.NodeVisitor):
             return value
         elif is_primitive_type(cpp_type):
             return value
+        elif value in self.context.constant_variables:
+            # Already a constant, for example a string literal.
+            return value
 
         constant = self.context.constants.get(value)
 
@@ -2072,6 +2254,7 @@ class BaseVisitor(ast.NodeVisitor):
             self.context.constants[value] = (
                 variable,
                 f'static const {cpp_type} {variable} = {value};')
+            self.context.constant_variables.add(variable)
         else:
             variable = constant[0]
 
@@ -2252,15 +2435,53 @@ class BaseVisitor(ast.NodeVisitor):
 
         return f'static_cast<{type_name}>({value})'
 
+    def strip_returned_tuple(self, node, value):
+        """Returns given value as a tuple returned by value from a function
+        or method, or None if it is not.
+
+        """
+
+        if isinstance(node, (ast.Call, ast.BinOp)):
+            return strip_make_shared_tuple(value)
+        else:
+            return None
+
+    def visit_return_value_tuple(self, node, mys_type):
+        """Tuples are returned by value, and only moved to the heap by the
+        caller if needed.
+
+        """
+
+        cpp_type = value_tuple_type(mys_type, self.context)
+
+        if isinstance(node.value, ast.Tuple):
+            values = self.value_check_type_visitor.visit_tuple_values(node.value,
+                                                                      mys_type)
+            value = f'{cpp_type}({values})'
+        else:
+            value = self.visit_check_type(node.value, mys_type)
+            returned_value = self.strip_returned_tuple(node.value, value)
+
+            if returned_value is not None:
+                value = returned_value
+            else:
+                value = f'shared_ptr_not_none({value})->m_tuple'
+
+        return value, cpp_type
+
     def visit_return_value(self, node):
         mys_type = self.context.return_mys_type
 
         if mys_type is None:
             raise CompileError("function does not return any value", node.value)
 
-        value = self.visit_check_type(node.value, mys_type)
-        value = self.fix_optional_value_constant(node.value, value, mys_type)
-        cpp_type = self.mys_to_cpp_type(mys_type)
+        if is_value_tuple(mys_type):
+            value, cpp_type = self.visit_return_value_tuple(node, mys_type)
+        else:
+            value = self.visit_check_type(node.value, mys_type)
+            value = self.fix_optional_value_constant(node.value, value, mys_type)
+            cpp_type = self.mys_to_cpp_type(mys_type)
+
         res = self.unique('res')
 
         return '\n'.join([
@@ -2467,10 +2688,58 @@ class BaseVisitor(ast.NodeVisitor):
         self.context.define_local_variable(target, self.context.mys_type, node)
         cpp_type = self.mys_to_cpp_type(value_type)
 
+        return self.declare_variable(target, value_type, cpp_type, value)
+
+    def declare_variable(self, target, mys_type, cpp_type, value):
+        """Returns code declaring given local variable. New objects that
+        never escape the function are created on the stack.
+
+        """
+
+        if (target in self.context.stack_variables
+            and is_stack_allocatable(mys_type, self.context)):
+            new_object = split_make_shared(value)
+
+            if new_object is not None:
+                object_cpp_type, args = new_object
+                storage = self.unique('stack_object')
+
+                return '\n'.join([
+                    f'mys::StackObject<{object_cpp_type}> {storage};',
+                    f'{cpp_type} {make_name(target)} = {storage}.make({args});'
+                ])
+
         return f'{cpp_type} {make_name(target)} = {value};'
 
+    def visit_assign_tuple_unpack_value(self, node):
+        """Returns the unpacked value and its items. Tuple literals and
+        returned tuples are unpacked without moving them to the heap.
+
+        """
+
+        if isinstance(node, ast.Tuple):
+            items = []
+            mys_types = []
+
+            for item in node.elts:
+                items.append(self.visit(item))
+                mys_types.append(self.context.mys_type)
+
+            self.context.mys_type = Tuple(mys_types)
+            cpp_type = value_tuple_type(self.context.mys_type, self.context)
+
+            return f'{cpp_type}({", ".join(items)})', ''
+
+        value = self.visit(node)
+        returned_value = self.strip_returned_tuple(node, value)
+
+        if returned_value is not None:
+            return returned_value, ''
+        else:
+            return value, '->m_tuple'
+
     def visit_assign_tuple_unpack(self, node, target):
-        value = self.visit(node.value)
+        value, items = self.visit_assign_tuple_unpack_value(node.value)
         mys_type = self.context.mys_type
 
         if not isinstance(mys_type, Tuple):
@@ -2503,7 +2772,7 @@ class BaseVisitor(ast.NodeVisitor):
             else:
                 target = self.visit(item)
 
-            lines.append(f'{target} = std::get<{i}>({temp}->m_tuple);')
+            lines.append(f'{target} = std::get<{i}>({temp}{items});')
 
         return '\n'.join(lines)
 
@@ -2667,11 +2936,10 @@ class BaseVisitor(ast.NodeVisitor):
         return target, mys_type, cpp_type, make_name(target), code
 
     def visit_AnnAssign(self, node):
-        target, mys_type, cpp_type, cpp_target, code = self.visit_ann_assign(node)
+        target, mys_type, cpp_type, _, code = self.visit_ann_assign(node)
         self.context.define_local_variable(target, mys_type, node.target)
-        code = f'{cpp_type} {cpp_target} = {code};'
 
-        return code
+        return self.declare_variable(target, mys_type, cpp_type, code)
 
     def visit_While(self, node):
         if node.orelse:
@@ -2822,11 +3090,22 @@ class BaseVisitor(ast.NodeVisitor):
                            node)
 
     def visit_JoinedStr(self, node):
-        if node.values:
-            return '(' + ' + '.join([
-                self.visit(value)
+        """Strings with more than one part are built in place with a string
+        builder instead of creating a new string per part.
+
+        """
+
+        if len(node.values) == 1:
+            return '(' + self.visit(node.values[0]) + ')'
+        elif node.values:
+            parts = ''.join([
+                f'.append({self.visit(value)})'
                 for value in node.values
-            ]) + ')'
+            ])
+            self.context.mys_type = 'string'
+
+            return (f'mys::StringBuilder(mys::make_shared<mys::String>(""))'
+                    f'{parts}.to_string()')
         else:
             self.context.mys_type = 'string'
 
@@ -102,6 +102,7 @@ class Context:
         self.mys_type = None
         self.unique_count = 0
         self.constants = {}
+        self.constant_variables = set()
         self._name_to_full_name = {}
         self.specialized_functions = specialized_functions
         self.specialized_classes = specialized_classes
@@ -117,6 +118,9 @@ class Context:
         self.package = module_levels[0]
         self.is_macro = False
         self.macros = []
+        # Local variables of the current function that are allocated
+        # on the stack.
+        self.stack_variables = set()
 
     def unique_number(self):
         self.unique_count += 1
@@ -324,7 +328,7 @@ class Context:
             return True
         elif is_primitive_type(mys_type):
             return True
-        elif mys_type in ('string', 'bytes', 'regex', 'regexmatch'):
+        elif mys_type in ('string', 'bytes', 'regex', 'regexmatch', 'stringbuilder'):
             return True
         elif mys_type is None:
             return True
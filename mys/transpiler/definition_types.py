@@ -170,7 +170,8 @@ class Class:
                  implements,
                  node,
                  module_name=None,
-                 docstring=None):
+                 docstring=None,
+                 specialized_types=None):
         self.name = name
         self.generic_types = generic_types
         self.members = members
@@ -180,6 +181,13 @@ class Class:
         self.module_name = module_name
         self.docstring = docstring
 
+        if specialized_types is None:
+            specialized_types = []
+
+        # List of generic type and chosen type pairs for specialized
+        # classes.
+        self.specialized_types = specialized_types
+
     def is_generic(self):
         return bool(self.generic_types)
 
@@ -0,0 +1,161 @@
+from ..parser import ast
+from .utils import Dict
+from .utils import Set
+from .utils import Tuple
+from .utils import is_c_string
+
+# Builtin functions that only read their arguments.
+READING_FUNCS = set(['print', 'str'])
+
+# Builtin functions that iterate over their argument in for-loops.
+ITERATING_FUNCS = set(['enumerate', 'reversed'])
+
+
+def make_parents(node):
+    parents = {}
+
+    for parent in ast.walk(node):
+        for child in ast.iter_child_nodes(parent):
+            parents[child] = parent
+
+    return parents
+
+
+def has_c_string(node):
+    for child in ast.walk(node):
+        if isinstance(child, ast.Constant) and is_c_string(child.value):
+            return True
+
+    return False
+
+
+def is_store(node):
+    # Names created by the transpiler have no context.
+    return isinstance(getattr(node, 'ctx', None), ast.Store)
+
+
+def is_non_escaping_use(node, parents):
+    """Returns true if given loaded variable is used in a way that does not
+    keep a reference to its object. That is, its attributes and items
+    are used, it is iterated over, printed or compared by identity.
+
+    """
+
+    parent = parents[node]
+
+    if isinstance(parent, (ast.Attribute, ast.Subscript)):
+        return parent.value is node
+    elif isinstance(parent, ast.For):
+        return parent.iter is node
+    elif isinstance(parent, ast.Compare):
+        if all(isinstance(op, (ast.Is, ast.IsNot)) for op in parent.ops):
+            return True
+
+        return (parent.left is not node
+                and all(isinstance(op, (ast.In, ast.NotIn)) for op in parent.ops))
+    elif isinstance(parent, ast.FormattedValue):
+        return True
+    elif isinstance(parent, ast.Call):
+        if parent.func is node or not isinstance(parent.func, ast.Name):
+            return False
+
+        if parent.func.id in READING_FUNCS:
+            return True
+
+        if parent.func.id in ITERATING_FUNCS:
+            grandparent = parents[parent]
+
+            return isinstance(grandparent, ast.For) and grandparent.iter is parent
+
+    return False
+
+
+def is_new_object(node):
+    return isinstance(node, (ast.Call, ast.List, ast.Dict, ast.Set, ast.Tuple))
+
+
+def find_non_escaping_variables(node):
+    """Returns names of local variables in given function that are
+    assigned a new object once, and are never stored, returned, passed
+    to a function or otherwise used in a way that the object may outlive
+    the function. Functions with embedded C++ are not analyzed, as they
+    may use any variable.
+
+    """
+
+    if has_c_string(node):
+        return set()
+
+    parents = make_parents(node)
+    assignments = {}
+    candidates = set()
+    escaping = set()
+
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Assign, ast.AnnAssign)):
+            if isinstance(child, ast.Assign):
+                targets = child.targets
+            else:
+                targets = [child.target]
+
+            if (len(targets) == 1
+                and isinstance(targets[0], ast.Name)
+                and is_new_object(child.value)):
+                candidates.add(targets[0].id)
+        elif isinstance(child, ast.ExceptHandler):
+            if child.name is not None:
+                assignments[child.name] = assignments.get(child.name, 0) + 1
+        elif isinstance(child, ast.Name):
+            if is_store(child):
+                assignments[child.id] = assignments.get(child.id, 0) + 1
+            elif not is_non_escaping_use(child, parents):
+                escaping.add(child.id)
+
+    return set(name
+               for name in candidates - escaping
+               if assignments.get(name) == 1)
+
+
+def is_class_non_escaping(definitions):
+    """Returns true if no method of given class may keep a reference to
+    self, including methods implemented by traits.
+
+    """
+
+    if any(implement.name() == 'Error' for implement in definitions.implements):
+        return False
+
+    if has_c_string(definitions.node):
+        return False
+
+    for methods in definitions.methods.values():
+        for method in methods:
+            if has_c_string(method.node):
+                return False
+
+            parents = make_parents(method.node)
+
+            for child in ast.walk(method.node):
+                if (isinstance(child, ast.Name)
+                    and child.id == 'self'
+                    and not is_store(child)):
+                    parent = parents[child]
+
+                    if not isinstance(parent, ast.Attribute):
+                        return False
+
+    return True
+
+
+def is_stack_allocatable(mys_type, context):
+    """Returns true if objects of given type may be allocated on the
+    stack when they do not escape.
+
+    """
+
+    if isinstance(mys_type, (list, Dict, Set, Tuple)):
+        return True
+    elif context.is_class_defined(mys_type):
+        return is_class_non_escaping(context.get_class_definitions(mys_type))
+    else:
+        return False
@@ -9,10 +9,12 @@ from .utils import GenericType
 from .utils import Optional
 from .utils import Set
 from .utils import Tuple
+from .utils import Weak
 from .utils import format_mys_type
 from .utils import make_name
 from .utils import make_types_string_parts
 from .utils import mys_to_cpp_type_param
+from .utils import split_full_name
 
 
 def replace_generic_types(generic_types, mys_type, chosen_types):
@@ -155,9 +157,11 @@ def specialize_class(definitions, specialized_name, chosen_types, node):
                         generic_type,
                         chosen_type).replace(param.type)
 
-                method.node = SpecializeTypeTransformer(
-                    definitions.generic_types,
-                    chosen_types).visit(method.node)
+    for class_methods in methods.values():
+        for method in class_methods:
+            method.node = SpecializeTypeTransformer(
+                definitions.generic_types,
+                chosen_types).visit(method.node)
 
     return Class(specialized_name,
                  [],
@@ -165,7 +169,9 @@ def specialize_class(definitions, specialized_name, chosen_types, node):
                  methods,
                  definitions.implements,
                  definitions.node,
-                 definitions.module_name)
+                 definitions.module_name,
+                 specialized_types=list(zip(definitions.generic_types,
+                                            chosen_types)))
 
 
 def add_generic_class(node, context):
@@ -197,6 +203,65 @@ def add_generic_class(node, context):
     return specialized_class, specialized_full_name
 
 
+def find_chosen_type_names(mys_type, names):
+    if isinstance(mys_type, Tuple):
+        for item_mys_type in mys_type:
+            find_chosen_type_names(item_mys_type, names)
+    elif isinstance(mys_type, list):
+        find_chosen_type_names(mys_type[0], names)
+    elif isinstance(mys_type, Set):
+        find_chosen_type_names(mys_type.value_type, names)
+    elif isinstance(mys_type, Dict):
+        find_chosen_type_names(mys_type.key_type, names)
+        find_chosen_type_names(mys_type.value_type, names)
+    elif isinstance(mys_type, (Optional, Weak)):
+        find_chosen_type_names(mys_type.mys_type, names)
+    elif isinstance(mys_type, str) and '.' in mys_type:
+        names.append(mys_type)
+
+
+def define_chosen_types(specialized_class, definitions, context):
+    """Defines classes, traits and enums from other modules that are
+    chosen types of given specialized class in given context, as the
+    class is defined in the module of its generic class. Returns the
+    modules of the defined types.
+
+    """
+
+    modules = set()
+    names = []
+
+    for _, chosen_type in specialized_class.specialized_types:
+        find_chosen_type_names(chosen_type, names)
+
+    for full_name in names:
+        module, name = split_full_name(full_name)
+
+        if module == context.name:
+            continue
+
+        module_definitions = definitions[module]
+
+        if name in module_definitions.classes:
+            context.define_class(full_name,
+                                 full_name,
+                                 module_definitions.classes[name])
+        elif name in module_definitions.traits:
+            context.define_trait(full_name,
+                                 full_name,
+                                 module_definitions.traits[name])
+        elif name in module_definitions.enums:
+            context.define_enum(full_name,
+                                full_name,
+                                module_definitions.enums[name])
+        else:
+            continue
+
+        modules.add(module)
+
+    return modules
+
+
 def make_generic_name(name, full_name, chosen_types):
     joined_chosen_types = '_'.join(make_types_string_parts(chosen_types))
     specialized_name = f'{name}_{joined_chosen_types}'
@@ -6,6 +6,7 @@ from .base import BaseVisitor
 from .context import Context
 from .generics import TypeVisitor
 from .generics import add_generic_class
+from .generics import define_chosen_types
 from .generics import format_parameters
 from .utils import GenericType
 from .utils import dot2ns
@@ -124,7 +125,13 @@ class HeaderVisitor(BaseVisitor):
             cpp_type = self.mys_to_cpp_type(member_type)
             members.append(f'{cpp_type} {make_name(member.name)};')
 
-        members += self.members.get(class_name, [])
+        # Embedded C++ members and methods of generic classes are part of
+        # all specializations, and may use the generic type names.
+        for generic_type, chosen_type in definitions.specialized_types:
+            cpp_type = self.mys_to_cpp_type(chosen_type)
+            members.append(f'using {generic_type} = {cpp_type};')
+
+        members += self.members.get(definitions.node.name, [])
 
         return members
 
@@ -288,6 +295,12 @@ class HeaderVisitor(BaseVisitor):
         self.functions += self.visit_function_declaration(function)
 
     def visit_specialized_class(self, name, definitions):
+        for module in define_chosen_types(definitions,
+                                          self.definitions,
+                                          self.context):
+            self.early_includes.add(
+                f'#include "{module.replace(".", "/")}.mys.early.hpp"')
+
         self.forward.append(f'class {name};')
         self.visit_class_declaration(name, definitions)
 
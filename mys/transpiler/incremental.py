@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+
+from ..parser import ast
+from ..version import __version__
+
+FULL_BODY_DECORATORS = ['generic', 'macro', 'trait']
+
+
+def _decorator_names(node):
+    names = []
+
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+
+        if isinstance(decorator, ast.Name):
+            names.append(decorator.id)
+
+    return names
+
+
+def _has_full_body(node):
+    return any(name in FULL_BODY_DECORATORS for name in _decorator_names(node))
+
+
+def _dump_function_signature(node):
+    if _has_full_body(node):
+        return ast.dump(node)
+
+    return ast.dump(ast.FunctionDef(name=node.name,
+                                    args=node.args,
+                                    body=[],
+                                    decorator_list=node.decorator_list,
+                                    returns=node.returns,
+                                    type_comment=None))
+
+
+def _dump_class(node):
+    if _has_full_body(node):
+        return ast.dump(node)
+
+    items = [ast.dump(base) for base in node.bases]
+    items += [ast.dump(decorator) for decorator in node.decorator_list]
+
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef):
+            items.append(_dump_function_signature(item))
+        else:
+            items.append(ast.dump(item))
+
+    return f'ClassDef({node.name}, ' + ', '.join(items) + ')'
+
+
+def interface_hash(tree):
+    """Returns a hash of everything in given module tree that other
+    modules may depend on. Bodies of functions and methods are not part
+    of the interface, except for generics, macros and traits, as they
+    are specialized or expanded in the importing module.
+
+    """
+
+    items = []
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            items.append(_dump_function_signature(node))
+        elif isinstance(node, ast.ClassDef):
+            items.append(_dump_class(node))
+        else:
+            items.append(ast.dump(node))
+
+    return hashlib.sha256('\n'.join(items).encode('utf-8')).hexdigest()
+
+
+def source_hash(source, coverage):
+    """Returns a hash of given source and all its options that affects
+    the generated code.
+
+    """
+
+    data = '\n'.join([
+        __version__,
+        str(coverage),
+        source.version,
+        source.mys_path,
+        source.module_hpp,
+        str(source.skip_tests),
+        str(source.has_main),
+        source.contents
+    ])
+
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def _transitive(modules, neighbours):
+    found = set()
+    stack = list(modules)
+
+    while stack:
+        module = stack.pop()
+
+        for neighbour in neighbours[module]:
+            if neighbour not in found:
+                found.add(neighbour)
+                stack.append(neighbour)
+
+    return found
+
+
+class Cache:
+    """Source and interface hashes of all modules from the previous
+    transpilation, stored as JSON in the output directory. Used to
+    only transpile modules that may generate different code than last
+    time.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.modules = {}
+        self.ordered_modules = []
+
+        try:
+            with open(path, 'r') as fin:
+                data = json.load(fin)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == __version__:
+            self.modules = data['modules']
+            self.ordered_modules = data['ordered-modules']
+
+    def save(self):
+        with open(self.path, 'w') as fout:
+            json.dump({
+                'version': __version__,
+                'modules': self.modules,
+                'ordered-modules': self.ordered_modules
+            }, fout, indent=4)
+
+    def update(self, modules, ordered_modules):
+        """Save given source and interface hashes, a dictionary of module
+        name to a tuple of the two, for next transpilation.
+
+        """
+
+        self.modules = {
+            module: {'source': source, 'interface': interface}
+            for module, (source, interface) in modules.items()
+        }
+        self.ordered_modules = ordered_modules
+
+    def find_modules_to_transpile(self,
+                                  modules,
+                                  module_imports,
+                                  generic_modules,
+                                  ordered_modules):
+        """Returns the set of modules that must be transpiled. Other
+        modules' previously generated code can be used as is.
+
+        A module is transpiled if its source changed, if the
+        interface of a module it imports (directly or indirectly)
+        changed, if it imports a generic module that is transpiled (it
+        may request specializations), or if it is a generic module
+        imported by a transpiled module (it may have to generate new
+        specializations).
+
+        """
+
+        importers = {module: set() for module in modules}
+
+        for module, imports in module_imports.items():
+            for imported_module in imports:
+                importers[imported_module].add(module)
+
+        dirty = set()
+        interface_changed = set()
+
+        for module, (source, interface) in modules.items():
+            cached = self.modules.get(module)
+
+            if cached is None:
+                dirty.add(module)
+                interface_changed.add(module)
+            else:
+                if cached['source'] != source:
+                    dirty.add(module)
+
+                if cached['interface'] != interface:
+                    interface_changed.add(module)
+
+        dirty |= _transitive(interface_changed, importers)
+
+        if ordered_modules != self.ordered_modules:
+            dirty.add(ordered_modules[-1])
+
+        while True:
+            size = len(dirty)
+
+            for module in list(dirty):
+                for imported_module in module_imports[module]:
+                    if imported_module in generic_modules:
+                        dirty.add(imported_module)
+
+            dirty |= _transitive(dirty & generic_modules, importers)
+
+            if len(dirty) == size:
+                break
+
+        return dirty
+
+
+def outputs_exist(source):
+    return all(os.path.exists(path)
+               for path in [source.hpp_path[:-3] + 'early.hpp',
+                            source.hpp_path,
+                            source.cpp_path])
@@ -4,8 +4,10 @@ from ..parser import ast
 from .base import BaseVisitor
 from .body_check_visitor import BodyCheckVisitor
 from .context import Context
+from .escape_analysis import find_non_escaping_variables
 from .generics import TypeVisitor
 from .generics import add_generic_class
+from .generics import define_chosen_types
 from .generics import format_parameters
 from .return_checker_visitor import check_returns
 from .utils import BUILTIN_ERRORS
@@ -272,6 +274,12 @@ class SourceVisitor(ast.NodeVisitor):
         self.body += self.visit_function_definition(function)
 
     def visit_specialized_class(self, name, definitions):
+        for module in define_chosen_types(definitions,
+                                          self.definitions,
+                                          self.context):
+            self.before_namespace.append(
+                f'#include "{module.replace(".", "/")}.mys.hpp"')
+
         self.context.define_class(name,
                                   self.context.make_full_name_this_module(name),
                                   definitions)
@@ -475,6 +483,7 @@ class SourceVisitor(ast.NodeVisitor):
 
     def visit_class_method_definition(self, class_name, method, body):
         self.context.is_macro = False
+        self.context.stack_variables = find_non_escaping_variables(method.node)
         body += self.visit_method_defaults(method, class_name)
         self.context.push()
         self.context.define_local_variable(
@@ -524,6 +533,7 @@ class SourceVisitor(ast.NodeVisitor):
     def visit_class_macro_definition(self, class_name, method):
         self.context.push()
         self.context.is_macro = True
+        self.context.stack_variables = set()
         self.context.define_local_variable(
             'self',
             self.context.make_full_name_this_module(class_name),
@@ -633,6 +643,7 @@ class SourceVisitor(ast.NodeVisitor):
     def visit_function_definition(self, function):
         self.context.push()
         self.context.is_macro = False
+        self.context.stack_variables = find_non_escaping_variables(function.node)
         self.define_parameters(function.args)
         self.raise_if_type_not_defined(function.returns, function.node.returns)
         check_returns(function)
@@ -674,6 +685,7 @@ class SourceVisitor(ast.NodeVisitor):
     def visit_macro_definition(self, function):
         self.context.push()
         self.context.is_macro = True
+        self.context.stack_variables = set()
         self.define_parameters(function.args)
         self.raise_if_type_not_defined(function.returns, function.node.returns)
         check_returns(function)
@@ -711,7 +723,7 @@ class SourceVisitor(ast.NodeVisitor):
 
     def visit_test_definition(self, function):
         self.context.push()
-
+        self.context.stack_variables = find_non_escaping_variables(function.node)
         self.context.return_mys_type = None
         body = [self.context.traceback.enter(function.name)]
         body_iter = iter(function.node.body)
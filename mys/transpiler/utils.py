@@ -207,6 +207,7 @@ BUILTIN_CALLS = set(
         'set',
         'regex',
         'str',
+        'stringbuilder',
         'min',
         'max',
         'abs',
@@ -285,13 +286,13 @@ SET_METHODS = {
     'is_superset': Function(['set'], 'bool'),
     'is_proper_superset': Function(['set'], 'bool'),
     'union': Function(['set'], 'set'),
-    'update': Function(['set'], 'set'),
+    'update': Function(['set']),
     'intersection': Function(['set'], 'set'),
-    'intersection_update': Function(['set'], 'set'),
+    'intersection_update': Function(['set']),
     'difference': Function(['set'], 'set'),
-    'difference_update': Function(['set'], 'set'),
+    'difference_update': Function(['set']),
     'symmetric_difference': Function(['set'], 'set'),
-    'symmetric_difference_update': Function(['set'], 'set'),
+    'symmetric_difference_update': Function(['set']),
     'add': Function(['elem']),
     'clear': Function([]),
     'discard': Function(['elem']),
@@ -354,6 +355,7 @@ LIST_METHODS = {
 
 REGEX_METHODS = {
     'split': Function(['string'], ['string']),
+    'find_all': Function(['string'], ['regexmatch']),
     'match': Function(['string'], Optional('regexmatch', None)),
     'replace': Function(['string', 'string'], 'string')
 }
@@ -367,6 +369,14 @@ REGEXMATCH_METHODS = {
     'group_dict': Function([], Dict('string', 'string'))
 }
 
+STRINGBUILDER_METHODS = {
+    'append': Function(['string']),
+    'append_char': Function(['char']),
+    'reserve': Function(['i64']),
+    'length': Function([], 'i64'),
+    'to_string': Function([], 'string')
+}
+
 CHAR_METHODS = {
     'is_alpha': Function([], 'bool'),
     'is_digit': Function([], 'bool'),
@@ -390,6 +400,7 @@ BUILTIN_CLASSES = {
     'list': LIST_METHODS,
     'regex': REGEX_METHODS,
     'regexmatch': REGEXMATCH_METHODS,
+    'stringbuilder': STRINGBUILDER_METHODS,
     'char': CHAR_METHODS
 }
 
@@ -505,6 +516,51 @@ def make_shared(cpp_type, values):
     return f'mys::make_shared<{cpp_type}>({values})'
 
 
+def split_make_shared(value):
+    """Returns the type and the arguments of given new object, or None if
+    not a new object.
+
+    """
+
+    if not value.startswith('mys::make_shared<'):
+        return None
+
+    depth = 1
+
+    for i, char in enumerate(value[17:], 17):
+        if char == '<':
+            depth += 1
+        elif char == '>':
+            depth -= 1
+
+            if depth == 0:
+                break
+    else:
+        return None
+
+    cpp_type = value[17:i]
+    args = value[i + 1:]
+
+    if not args.startswith('('):
+        return None
+
+    depth = 0
+
+    for j, char in enumerate(args):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+
+            if depth == 0:
+                if j == len(args) - 1:
+                    return cpp_type, args[1:-1]
+                else:
+                    return None
+
+    return None
+
+
 def shared_list_type(cpp_type, is_weak=False):
     if is_weak:
         return f'mys::weak_ptr<mys::List<{cpp_type}>>'
@@ -588,6 +644,8 @@ def mys_to_cpp_type(mys_type, context):
             return 'mys::Regex'
         elif mys_type == 'regexmatch':
             return 'mys::RegexMatch'
+        elif mys_type == 'stringbuilder':
+            return 'mys::StringBuilder'
         elif context.is_class_or_trait_defined(mys_type):
             if is_weak:
                 return f'mys::weak_ptr<{dot2ns(mys_type)}>'
@@ -614,11 +672,58 @@ def mys_to_cpp_type_param(mys_type, context):
     return cpp_type
 
 
+def value_tuple_type(mys_type, context):
+    items = ', '.join([mys_to_cpp_type(item, context) for item in mys_type])
+
+    return f'std::tuple<{items}>'
+
+
+def is_value_tuple(mys_type):
+    """Non-optional tuples are returned by value from functions and
+    methods.
+
+    """
+
+    return isinstance(mys_type, Tuple)
+
+
+def make_shared_tuple(value):
+    return f'mys::make_shared_tuple({value})'
+
+
+def strip_make_shared_tuple(value):
+    """Returns given returned tuple by value, or None if not a returned
+    tuple.
+
+    """
+
+    if not value.startswith('mys::make_shared_tuple('):
+        return None
+
+    depth = 0
+
+    for i, char in enumerate(value[22:], 22):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+
+            if depth == 0:
+                if i == len(value) - 1:
+                    return value[23:-1]
+                else:
+                    return None
+
+    return None
+
+
 def format_return_type(returns, context):
-    if returns is not None:
-        return mys_to_cpp_type(returns, context)
-    else:
+    if returns is None:
         return 'void'
+    elif is_value_tuple(returns):
+        return value_tuple_type(returns, context)
+    else:
+        return mys_to_cpp_type(returns, context)
 
 
 def format_method_name(method, class_name):
@@ -903,6 +1008,10 @@ def make_types_string_parts(mys_types):
             parts.append('cn')
             parts += make_types_string_parts([mys_type.value_type])
             parts.append('de')
+        elif isinstance(mys_type, Set):
+            parts.append('sb')
+            parts += make_types_string_parts([mys_type.value_type])
+            parts.append('se')
         else:
             raise Exception(str(mys_type))
 
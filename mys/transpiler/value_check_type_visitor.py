@@ -49,6 +49,16 @@ class ValueCheckTypeVisitor:
         return mys_to_cpp_type(mys_type, self.context)
 
     def visit_tuple(self, node, mys_type):
+        values = self.visit_tuple_values(node, mys_type)
+        cpp_type = self.mys_to_cpp_type(mys_type)
+
+        return make_shared(cpp_type[16:-1], values)
+
+    def visit_tuple_values(self, node, mys_type):
+        """Returns the tuple items as comma separated values.
+
+        """
+
         if not isinstance(mys_type, Tuple):
             mys_type = format_mys_type(mys_type)
 
@@ -66,10 +76,8 @@ class ValueCheckTypeVisitor:
             raise_if_wrong_types(Tuple(types), mys_type, node)
 
         self.context.mys_type = mys_type
-        cpp_type = self.mys_to_cpp_type(mys_type)
-        values = ", ".join(values)
 
-        return make_shared(cpp_type[16:-1], values)
+        return ", ".join(values)
 
     def visit_list(self, node, mys_type):
         mys_type = strip_optional(mys_type)
@@ -587,6 +587,8 @@ class ValueTypeVisitor(ast.NodeVisitor):
             return 'char'
         elif name == 'regex':
             return 'regex'
+        elif name == 'stringbuilder':
+            return 'stringbuilder'
         elif name == 'set':
             value_type = self.visit(node.args[0])
 
@@ -692,6 +694,9 @@ class ValueTypeVisitor(ast.NodeVisitor):
     def visit_call_method_regex(self, name, node):
         return get_builtin_method('regex', name, node).returns
 
+    def visit_call_method_stringbuilder(self, name, node):
+        return get_builtin_method('stringbuilder', name, node).returns
+
     def visit_call_method_class(self, name, value_type, node):
         method = self.find_called_method(value_type, name, node)
 
@@ -726,6 +731,8 @@ class ValueTypeVisitor(ast.NodeVisitor):
             return self.visit_call_method_regexmatch(name, node.func)
         elif value_type == 'regex':
             return self.visit_call_method_regex(name, node.func)
+        elif value_type == 'stringbuilder':
+            return self.visit_call_method_stringbuilder(name, node.func)
         elif value_type == 'bytes':
             return self.visit_call_method_bytes(name, node.func)
         elif self.context.is_class_defined(value_type):
@@ -0,0 +1,80 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/lib.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::mypkg1::lib {
+extern void __module_init();
+}
+namespace mys::mypkg::lib {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::mypkg1::lib::__module_init();
+    mys::mypkg::lib::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg1::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg::lib {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::mypkg1::lib::__module_exit();
+    mys::mypkg::lib::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::mypkg::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "assets", 4, "assert __assets__.ends_with(\"test-assets/mypkg\")" },
+    { "assets", 5, "assert foo().ends_with(\"test-assets/mypkg1/foo.txt\")" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("test-assets/mypkg");
+static const mys::String __constant_2 = mys::String("test-assets/mypkg1/foo.txt");
+#if defined(MYS_TEST)
+static void mys_test_assets(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    if (!(mys::string_not_none(mys::assets("mypkg")).ends_with(__constant_1))) {
+        std::cout << "./src/lib.mys:4: assert " << PrintString(mys::String("condition")) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String("condition") + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(1);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    if (!(mys::string_not_none(mys::mypkg1::lib::foo()).ends_with(__constant_2))) {
+        std::cout << "./src/lib.mys:5: assert " << PrintString(mys::String("condition")) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String("condition") + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_assets("lib::assets", mys_test_assets);
+#endif
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,19 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_lib_EARLY_HPP
+#define mys_mypkg_lib_EARLY_HPP
+namespace mys::mypkg::lib
+{
+}
+/* c-string-header-before-namespace start */
+#include <sqlite3.h>
+/* c-string-header-before-namespace stop */
+namespace mys::mypkg::lib
+{
+enum class Result : i64 {
+    Ok = SQLITE_OK,
+    Row = SQLITE_ROW,
+    Done = SQLITE_DONE,
+};
+i64 Result_from_value(i64 value);
+}
+#endif
\ No newline at end of file
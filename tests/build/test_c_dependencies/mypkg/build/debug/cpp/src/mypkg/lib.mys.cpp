@@ -0,0 +1,36 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/lib.mys.hpp"
+namespace mys::mypkg::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+i64 Result_from_value(i64 value)
+{
+    switch (value) {
+    case SQLITE_OK:
+        return (i64)Result::Ok;
+    case SQLITE_ROW:
+        return (i64)Result::Row;
+    case SQLITE_DONE:
+        return (i64)Result::Done;
+    default:
+        mys::make_shared<ValueError>(mys::String("enum Result does not contain ") + mys::String(value))->__throw();
+    }
+}
+void __module_init()
+{
+;
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,69 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg1/lib.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::mypkg::lib {
+extern void __module_init();
+}
+namespace mys::mypkg1::lib {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::mypkg::lib::__module_init();
+    mys::mypkg1::lib::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg1::lib {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::mypkg::lib::__module_exit();
+    mys::mypkg1::lib::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::mypkg1::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "../mypkg1/src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+i64 Result_from_value(i64 value)
+{
+    switch (value) {
+    case SQLITE_OK:
+        return (i64)Result::Ok;
+    case SQLITE_ROW:
+        return (i64)Result::Row;
+    case SQLITE_DONE:
+        return (i64)Result::Done;
+    default:
+        mys::make_shared<ValueError>(mys::String("enum Result does not contain ") + mys::String(value))->__throw();
+    }
+}
+void __module_init()
+{
+;
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ../mypkg1/src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,19 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_circular_imports_mod1_EARLY_HPP
+#define mys_circular_imports_mod1_EARLY_HPP
+namespace mys::circular_imports::mod1
+{
+class Base1;
+class Foo1;
+}
+#include "circular_imports/mod2.mys.early.hpp"
+namespace mys::circular_imports::mod1
+{
+class Base1 : public mys::Object {
+public:
+    virtual ~Base1() {}
+};
+extern mys::shared_ptr<mys::circular_imports::mod1::Foo1> VAR1;
+void func1(void);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,19 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_circular_imports_mod2_EARLY_HPP
+#define mys_circular_imports_mod2_EARLY_HPP
+namespace mys::circular_imports::mod2
+{
+class Base2;
+class Foo2;
+}
+#include "circular_imports/mod1.mys.early.hpp"
+namespace mys::circular_imports::mod2
+{
+class Base2 : public mys::Object {
+public:
+    virtual ~Base2() {}
+};
+extern mys::shared_ptr<mys::circular_imports::mod2::Foo2> VAR2;
+void func2(void);
+}
+#endif
\ No newline at end of file
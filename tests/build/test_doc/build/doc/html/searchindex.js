@@ -0,0 +1 @@
+Search.setIndex({"alltitles":{"About":[[0,null]],"Examples":[[0,"examples"]],"Functions and types":[[0,"functions-and-types"]]},"docnames":["index"],"envversion":{"sphinx":66,"sphinx.domains.c":3,"sphinx.domains.changeset":1,"sphinx.domains.citation":1,"sphinx.domains.cpp":9,"sphinx.domains.index":1,"sphinx.domains.javascript":3,"sphinx.domains.math":2,"sphinx.domains.python":4,"sphinx.domains.rst":2,"sphinx.domains.std":2},"filenames":["index.rst"],"indexentries":{},"objects":{},"objnames":{},"objtypes":{},"terms":{"A":0,"Some":0,"The":0,"This":0,"With":0,"__init__":0,"a_global_var":0,"a_memb":0,"add":0,"anoth":0,"another_global_var":0,"b":0,"bar":0,"base":0,"basewithdoc":0,"bool":0,"break":0,"c":0,"char":0,"class":0,"d":0,"default":0,"diff":0,"div":0,"djpoew":0,"djpopjeowd":0,"doc":0,"dpepd":0,"dpjoew":0,"e":0,"ejpewdj":0,"enum":0,"error":0,"ewdpojpojewd":0,"ewjpojpd":0,"f":0,"first":0,"foo":0,"func":0,"generic":0,"genericclass":0,"given":0,"global_variable_as_default":0,"gt":0,"hello":0,"hi":0,"i32":0,"i64":0,"implementsgener":0,"jpedw":0,"jpoewdpj":0,"jpow":0,"languag":0,"line":0,"m":0,"macro":0,"main":0,"many_param":0,"manyparam":0,"membertyp":0,"method":0,"myerror":0,"mys":0,"n":0,"negative_default":0,"no_docstr":0,"none":0,"number":0,"ojpedw":0,"ojpewd":0,"onlyprivatememb":0,"op":0,"opt":0,"packag":0,"pass":0,"pjpewd":0,"pjpjew":0,"poj":0,"pojw":0,"pojwepojd":0,"program":0,"quot":0,"rais":0,"return":0,"second":0,"self":0,"special":0,"string":0,"sub":0,"sum":0,"t":0,"t1":0,"t2":0,"text":0,"trait":0,"u8":0,"v":0,"var":0,"variabl":0,"well":0,"work":0,"x":0},"titles":["About"],"titleterms":{"About":0,"exampl":0,"function":0,"type":0}})
\ No newline at end of file
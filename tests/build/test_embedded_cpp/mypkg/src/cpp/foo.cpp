@@ -0,0 +1,13 @@
+#include "foo.hpp"
+#include "bar.hpp"
+
+// It's good practice to use the package namespace is possible.
+namespace mys::mypkg::foo
+{
+
+int foobar(int v)
+{
+    return 3 * v;
+}
+
+};
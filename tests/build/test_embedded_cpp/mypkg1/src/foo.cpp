@@ -0,0 +1,12 @@
+#include "foo.hpp"
+
+// It's good practice to use the package namespace is possible.
+namespace mys::mypkg1::foo
+{
+
+int foobar(int v)
+{
+    return 2 * v;
+}
+
+};
@@ -0,0 +1,14 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_lib_EARLY_HPP
+#define mys_mypkg_lib_EARLY_HPP
+namespace mys::mypkg::lib
+{
+}
+#include "mypkg/mod1.mys.early.hpp"
+#include "mypkg/mod2.mys.early.hpp"
+namespace mys::mypkg::lib
+{
+extern i64 F;
+i64 f(void);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,14 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod2_EARLY_HPP
+#define mys_mypkg_mod2_EARLY_HPP
+namespace mys::mypkg::mod2
+{
+}
+#include "mypkg/mod1.mys.early.hpp"
+namespace mys::mypkg::mod2
+{
+extern mys::String X;
+extern i64 Y;
+mys::String x(void);
+}
+#endif
\ No newline at end of file
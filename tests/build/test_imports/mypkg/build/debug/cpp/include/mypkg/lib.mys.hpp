@@ -0,0 +1,91 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_lib_HPP
+#define mys_mypkg_lib_HPP
+#include "mypkg/lib.mys.early.hpp"
+#include "mypkg/mod1.mys.hpp"
+#include "mypkg/mod2.mys.hpp"
+#include "mypkg/mod3.mys.hpp"
+#include "mypkg1/lib.mys.hpp"
+#include "mypkg1/subpkg1/mod1.mys.hpp"
+#include "mypkg2/lib.mys.hpp"
+namespace mys::mypkg::lib
+{
+class Class2 : public mys::mypkg::mod2::Ko {
+public:
+    mys::shared_ptr<mys::mypkg1::subpkg1::mod1::Class1> x;
+    mys::shared_ptr<mys::List<mys::shared_ptr<mys::mypkg2::lib::Class1>>> y;
+    Class2(mys::shared_ptr<mys::mypkg1::subpkg1::mod1::Class1> x, mys::shared_ptr<mys::List<mys::shared_ptr<mys::mypkg2::lib::Class1>>> y);
+    virtual ~Class2(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::lib::Class2> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::lib::Class2> other);
+    i64 __hash__(void);
+};
+class Foo : public mys::Object {
+public:
+    mys::String apa;
+    mys::shared_ptr<mys::mypkg::lib::Foo> kalle(mys::shared_ptr<mys::mypkg::lib::Foo> a);
+    void bobo(mys::Bool a);
+    Foo(mys::String apa);
+    virtual ~Foo(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::lib::Foo> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::lib::Foo> other);
+    i64 __hash__(void);
+};
+class ImplementsTrait1 : public mys::mypkg::mod1::Base {
+public:
+    mys::String foo(void);
+    ImplementsTrait1(void);
+    virtual ~ImplementsTrait1(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::lib::ImplementsTrait1> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::lib::ImplementsTrait1> other);
+    i64 __hash__(void);
+    mys::String bar(void);
+    mys::Char fie(void);
+};
+class ImplementsTrait2 : public mys::mypkg::mod1::Base {
+public:
+    mys::String foo(void);
+    mys::String bar(void);
+    ImplementsTrait2(void);
+    virtual ~ImplementsTrait2(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::lib::ImplementsTrait2> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::lib::ImplementsTrait2> other);
+    i64 __hash__(void);
+    mys::Char fie(void);
+};
+class EnumMember : public mys::Object {
+public:
+    i64 a;
+    void foo(i64 b);
+    EnumMember(i64 a);
+    virtual ~EnumMember(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::lib::EnumMember> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::lib::EnumMember> other);
+    i64 __hash__(void);
+};
+class MatchBar : public mys::mypkg::mod1::MatchBase {
+public:
+    i64 y;
+    MatchBar(i64 y);
+    virtual ~MatchBar(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::lib::MatchBar> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::lib::MatchBar> other);
+    i64 __hash__(void);
+};
+class Circ : public mys::Object {
+public:
+    Circ(void);
+    virtual ~Circ(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::lib::Circ> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::lib::Circ> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
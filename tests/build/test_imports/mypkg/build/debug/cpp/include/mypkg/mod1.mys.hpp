@@ -0,0 +1,207 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod1_HPP
+#define mys_mypkg_mod1_HPP
+#include "mypkg/mod1.mys.early.hpp"
+#include "mypkg/lib.mys.hpp"
+#include "mypkg/mod2.mys.hpp"
+#include "mypkg/mod3.mys.hpp"
+namespace mys::mypkg::mod1
+{
+class Foo : public mys::mypkg::mod2::Ko {
+public:
+    i32 a;
+    Foo(i32 a);
+    virtual ~Foo(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::Foo> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::Foo> other);
+    i64 __hash__(void);
+};
+mys::shared_ptr<mys::mypkg::mod1::Kam> Bar_fie_h_default();
+class Bar : public mys::Object {
+public:
+    mys::shared_ptr<mys::mypkg::mod3::Fie> fie(mys::shared_ptr<mys::mypkg::mod1::Foo> g, mys::shared_ptr<mys::mypkg::mod1::Kam> h);
+    Bar(void);
+    virtual ~Bar(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::Bar> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::Bar> other);
+    i64 __hash__(void);
+};
+class Kam : public mys::Object {
+public:
+    mys::shared_ptr<mys::mypkg::mod1::Foo> x;
+    mys::shared_ptr<mys::mypkg::mod3::Fie> y;
+    mys::shared_ptr<mys::mypkg::mod1::Foo> fff(mys::shared_ptr<mys::mypkg::mod1::Foo> g);
+    Kam(mys::shared_ptr<mys::mypkg::mod1::Foo> x, mys::shared_ptr<mys::mypkg::mod3::Fie> y);
+    virtual ~Kam(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::Kam> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::Kam> other);
+    i64 __hash__(void);
+};
+class Foo2 : public mys::mypkg::mod1::Base2 {
+public:
+    Foo2(void);
+    virtual ~Foo2(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::Foo2> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::Foo2> other);
+    i64 __hash__(void);
+};
+class MatchFoo : public mys::mypkg::mod1::MatchBase {
+public:
+    i64 x;
+    MatchFoo(i64 x);
+    virtual ~MatchFoo(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::MatchFoo> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::MatchFoo> other);
+    i64 __hash__(void);
+};
+class Match2Foo : public mys::mypkg::mod1::Match2Base {
+public:
+    i64 y;
+    Match2Foo(i64 y);
+    virtual ~Match2Foo(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::Match2Foo> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::Match2Foo> other);
+    i64 __hash__(void);
+};
+class MemberClass : public mys::Object {
+public:
+    mys::shared_ptr<mys::mypkg::mod1::MemberClass2> a;
+    mys::shared_ptr<mys::Tuple<i64, mys::shared_ptr<mys::mypkg::mod1::MemberClass3>>> b;
+    mys::shared_ptr<mys::List<mys::shared_ptr<mys::Dict<i64, mys::shared_ptr<mys::mypkg::mod1::MemberClass4>>>>> c;
+    mys::shared_ptr<mys::mypkg::mod1::MemberClass5> d;
+    MemberClass(void);
+    virtual ~MemberClass(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass> other);
+    i64 __hash__(void);
+};
+class MemberClass2 : public mys::Object {
+public:
+    mys::String b;
+    MemberClass2(mys::String b);
+    virtual ~MemberClass2(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass2> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass2> other);
+    i64 __hash__(void);
+};
+class MemberClass3 : public mys::Object {
+public:
+    mys::String x;
+    MemberClass3(mys::String x);
+    virtual ~MemberClass3(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass3> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass3> other);
+    i64 __hash__(void);
+};
+class MemberClass4 : public mys::Object {
+public:
+    mys::String y;
+    MemberClass4(mys::String y);
+    virtual ~MemberClass4(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass4> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass4> other);
+    i64 __hash__(void);
+};
+class MemberClass5 : public mys::Object {
+public:
+    mys::shared_ptr<mys::mypkg::mod1::MemberClass6> a;
+    MemberClass5(mys::shared_ptr<mys::mypkg::mod1::MemberClass6> a);
+    virtual ~MemberClass5(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass5> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass5> other);
+    i64 __hash__(void);
+};
+class MemberClass6 : public mys::Object {
+public:
+    mys::String b;
+    MemberClass6(mys::String b);
+    virtual ~MemberClass6(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass6> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass6> other);
+    i64 __hash__(void);
+};
+class MyError : public Error {
+public:
+    MyError(void);
+    virtual ~MyError(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::MyError> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::MyError> other);
+    i64 __hash__(void);
+    [[ noreturn ]] void __throw();
+};
+class __MyError final : public __Error {
+public:
+    __MyError(const mys::shared_ptr<MyError>& error) : __Error(error)
+    {
+    }
+};
+class WeakIn : public mys::Object {
+public:
+    void z(void);
+    WeakIn(void);
+    virtual ~WeakIn(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::WeakIn> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::WeakIn> other);
+    i64 __hash__(void);
+};
+class Weak : public mys::Object {
+public:
+    mys::weak_ptr<mys::mypkg::mod1::WeakIn> x;
+    Weak(void);
+    virtual ~Weak(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::Weak> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::Weak> other);
+    i64 __hash__(void);
+};
+class Imp1 : public mys::Object {
+public:
+    Imp1(void);
+    virtual ~Imp1(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::Imp1> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::Imp1> other);
+    i64 __hash__(void);
+};
+class GenClass_i64 : public mys::Object {
+public:
+    i64 a;
+    GenClass_i64(i64 a);
+    virtual ~GenClass_i64(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::GenClass> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::GenClass> other);
+    i64 __hash__(void);
+};
+class GenClass2_i64 : public mys::Object {
+public:
+    i64 b;
+    GenClass2_i64(i64 b);
+    virtual ~GenClass2_i64(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod1::GenClass2> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod1::GenClass2> other);
+    i64 __hash__(void);
+};
+}
+#define mys__mypkg__mod1__MACRO() \
+{ \
+    i64 __res_107 = mys::mypkg::mod1::_MACRO_VALUE; \
+    __MYS_TRACEBACK_EXIT(); \
+    return __res_107; \
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod2_HPP
+#define mys_mypkg_mod2_HPP
+#include "mypkg/mod2.mys.early.hpp"
+namespace mys::mypkg::mod2
+{
+}
+#endif
\ No newline at end of file
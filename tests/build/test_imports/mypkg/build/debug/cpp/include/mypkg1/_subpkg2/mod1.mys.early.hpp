@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg1__subpkg2_mod1_EARLY_HPP
+#define mys_mypkg1__subpkg2_mod1_EARLY_HPP
+namespace mys::mypkg1::_subpkg2::mod1
+{
+class Foo;
+}
+namespace mys::mypkg1::_subpkg2::mod1
+{
+}
+#endif
\ No newline at end of file
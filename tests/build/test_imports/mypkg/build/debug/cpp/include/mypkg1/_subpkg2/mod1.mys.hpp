@@ -0,0 +1,17 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg1__subpkg2_mod1_HPP
+#define mys_mypkg1__subpkg2_mod1_HPP
+#include "mypkg1/_subpkg2/mod1.mys.early.hpp"
+namespace mys::mypkg1::_subpkg2::mod1
+{
+class Foo : public mys::Object {
+public:
+    Foo(void);
+    virtual ~Foo(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg1::_subpkg2::mod1::Foo> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg1::_subpkg2::mod1::Foo> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,20 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg1_lib_EARLY_HPP
+#define mys_mypkg1_lib_EARLY_HPP
+namespace mys::mypkg1::lib
+{
+class Class1;
+}
+#include "mypkg1/_mod1.mys.early.hpp"
+#include "mypkg1/_subpkg2/mod1.mys.early.hpp"
+#include "mypkg2/lib.mys.early.hpp"
+#include "mypkg2/mod1.mys.early.hpp"
+namespace mys::mypkg1::lib
+{
+extern i32 VAR2;
+extern i32 VAR3;
+void foo(mys::shared_ptr<mys::mypkg1::lib::Class1> a, mys::shared_ptr<mys::mypkg2::lib::Class1> b);
+void bar(void);
+void tam(void);
+}
+#endif
\ No newline at end of file
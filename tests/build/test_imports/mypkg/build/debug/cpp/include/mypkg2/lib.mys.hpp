@@ -0,0 +1,28 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg2_lib_HPP
+#define mys_mypkg2_lib_HPP
+#include "mypkg2/lib.mys.early.hpp"
+#include "mypkg2/mod1.mys.hpp"
+namespace mys::mypkg2::lib
+{
+class Class1 : public mys::Object {
+public:
+    i32 value;
+    Class1(i32 value);
+    virtual ~Class1(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg2::lib::Class1> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg2::lib::Class1> other);
+    i64 __hash__(void);
+};
+class Class2 : public mys::Object {
+public:
+    Class2(void);
+    virtual ~Class2(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg2::lib::Class2> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg2::lib::Class2> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,1227 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/mod1.mys.hpp"
+namespace mys::mypkg::mod1
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 8, "class Foo(Ko):" },
+    { "__str__", 8, "class Foo(Ko):" },
+    { "__eq__", 8, "class Foo(Ko):" },
+    { "__eq__", 8, "class Foo(Ko):" },
+    { "__eq__", 8, "class Foo(Ko):" },
+    { "__lt__", 8, "class Foo(Ko):" },
+    { "__lt__", 8, "class Foo(Ko):" },
+    { "__lt__", 8, "class Foo(Ko):" },
+    { "__hash__", 8, "class Foo(Ko):" },
+    { "__hash__", 8, "class Foo(Ko):" },
+    { "__hash__", 8, "class Foo(Ko):" },
+    { "fie", 14, "return Fie()" },
+    { "__init__", 11, "class Bar:" },
+    { "__str__", 11, "class Bar:" },
+    { "__eq__", 11, "class Bar:" },
+    { "__lt__", 11, "class Bar:" },
+    { "__hash__", 11, "class Bar:" },
+    { "__hash__", 11, "class Bar:" },
+    { "fff", 21, "return g" },
+    { "__init__", 16, "class Kam:" },
+    { "__init__", 16, "class Kam:" },
+    { "__str__", 16, "class Kam:" },
+    { "__eq__", 16, "class Kam:" },
+    { "__lt__", 16, "class Kam:" },
+    { "__hash__", 16, "class Kam:" },
+    { "__hash__", 16, "class Kam:" },
+    { "__init__", 55, "class Foo2(Base2):" },
+    { "__str__", 55, "class Foo2(Base2):" },
+    { "__eq__", 55, "class Foo2(Base2):" },
+    { "__lt__", 55, "class Foo2(Base2):" },
+    { "__hash__", 55, "class Foo2(Base2):" },
+    { "__hash__", 55, "class Foo2(Base2):" },
+    { "__init__", 76, "class MatchFoo(MatchBase):" },
+    { "__str__", 76, "class MatchFoo(MatchBase):" },
+    { "__eq__", 76, "class MatchFoo(MatchBase):" },
+    { "__eq__", 76, "class MatchFoo(MatchBase):" },
+    { "__eq__", 76, "class MatchFoo(MatchBase):" },
+    { "__lt__", 76, "class MatchFoo(MatchBase):" },
+    { "__lt__", 76, "class MatchFoo(MatchBase):" },
+    { "__lt__", 76, "class MatchFoo(MatchBase):" },
+    { "__hash__", 76, "class MatchFoo(MatchBase):" },
+    { "__hash__", 76, "class MatchFoo(MatchBase):" },
+    { "__hash__", 76, "class MatchFoo(MatchBase):" },
+    { "__init__", 82, "class Match2Foo(Match2Base):" },
+    { "__str__", 82, "class Match2Foo(Match2Base):" },
+    { "__eq__", 82, "class Match2Foo(Match2Base):" },
+    { "__eq__", 82, "class Match2Foo(Match2Base):" },
+    { "__eq__", 82, "class Match2Foo(Match2Base):" },
+    { "__lt__", 82, "class Match2Foo(Match2Base):" },
+    { "__lt__", 82, "class Match2Foo(Match2Base):" },
+    { "__lt__", 82, "class Match2Foo(Match2Base):" },
+    { "__hash__", 82, "class Match2Foo(Match2Base):" },
+    { "__hash__", 82, "class Match2Foo(Match2Base):" },
+    { "__hash__", 82, "class Match2Foo(Match2Base):" },
+    { "__init__", 95, "self.a = MemberClass2(\"hi\")" },
+    { "__init__", 96, "self.b = (-1, MemberClass3(\"ho\"))" },
+    { "__init__", 97, "self.c = [{5: MemberClass4(\"ha\")}]" },
+    { "__init__", 98, "self.d = MemberClass5(MemberClass6(\"hu\"))" },
+    { "__str__", 88, "class MemberClass:" },
+    { "__eq__", 88, "class MemberClass:" },
+    { "__lt__", 88, "class MemberClass:" },
+    { "__hash__", 88, "class MemberClass:" },
+    { "__hash__", 88, "class MemberClass:" },
+    { "__init__", 100, "class MemberClass2:" },
+    { "__str__", 100, "class MemberClass2:" },
+    { "__str__", 100, "class MemberClass2:" },
+    { "__eq__", 100, "class MemberClass2:" },
+    { "__lt__", 100, "class MemberClass2:" },
+    { "__hash__", 100, "class MemberClass2:" },
+    { "__hash__", 100, "class MemberClass2:" },
+    { "__init__", 103, "class MemberClass3:" },
+    { "__str__", 103, "class MemberClass3:" },
+    { "__str__", 103, "class MemberClass3:" },
+    { "__eq__", 103, "class MemberClass3:" },
+    { "__lt__", 103, "class MemberClass3:" },
+    { "__hash__", 103, "class MemberClass3:" },
+    { "__hash__", 103, "class MemberClass3:" },
+    { "__init__", 106, "class MemberClass4:" },
+    { "__str__", 106, "class MemberClass4:" },
+    { "__str__", 106, "class MemberClass4:" },
+    { "__eq__", 106, "class MemberClass4:" },
+    { "__lt__", 106, "class MemberClass4:" },
+    { "__hash__", 106, "class MemberClass4:" },
+    { "__hash__", 106, "class MemberClass4:" },
+    { "__init__", 109, "class MemberClass5:" },
+    { "__str__", 109, "class MemberClass5:" },
+    { "__eq__", 109, "class MemberClass5:" },
+    { "__lt__", 109, "class MemberClass5:" },
+    { "__hash__", 109, "class MemberClass5:" },
+    { "__hash__", 109, "class MemberClass5:" },
+    { "__init__", 112, "class MemberClass6:" },
+    { "__str__", 112, "class MemberClass6:" },
+    { "__str__", 112, "class MemberClass6:" },
+    { "__eq__", 112, "class MemberClass6:" },
+    { "__lt__", 112, "class MemberClass6:" },
+    { "__hash__", 112, "class MemberClass6:" },
+    { "__hash__", 112, "class MemberClass6:" },
+    { "__init__", 115, "class MyError(Error):" },
+    { "__str__", 115, "class MyError(Error):" },
+    { "__eq__", 115, "class MyError(Error):" },
+    { "__lt__", 115, "class MyError(Error):" },
+    { "__hash__", 115, "class MyError(Error):" },
+    { "__hash__", 115, "class MyError(Error):" },
+    { "z", 124, "pass" },
+    { "__init__", 121, "class WeakIn:" },
+    { "__str__", 121, "class WeakIn:" },
+    { "__eq__", 121, "class WeakIn:" },
+    { "__lt__", 121, "class WeakIn:" },
+    { "__hash__", 121, "class WeakIn:" },
+    { "__hash__", 121, "class WeakIn:" },
+    { "__init__", 132, "self.x = _WEAK_IN" },
+    { "__str__", 128, "class Weak:" },
+    { "__eq__", 128, "class Weak:" },
+    { "__lt__", 128, "class Weak:" },
+    { "__hash__", 128, "class Weak:" },
+    { "__hash__", 128, "class Weak:" },
+    { "__init__", 134, "class Imp1:" },
+    { "__str__", 134, "class Imp1:" },
+    { "__eq__", 134, "class Imp1:" },
+    { "__lt__", 134, "class Imp1:" },
+    { "__hash__", 134, "class Imp1:" },
+    { "__hash__", 134, "class Imp1:" },
+    { "func4", 50, "return Foo(a)" },
+    { "foo2", 59, "pass" },
+    { "match_2", 86, "return Match2Foo(2 * v)" },
+    { "circ", 119, "return Circ()" },
+    { "implicit_set_import", 138, "return {}" },
+    { "genfunc_i64", 63, "return 5" },
+    { "__init__", 66, "class GenClass:" },
+    { "__str__", 66, "class GenClass:" },
+    { "__eq__", 66, "class GenClass:" },
+    { "__lt__", 66, "class GenClass:" },
+    { "__hash__", 66, "class GenClass:" },
+    { "__hash__", 66, "class GenClass:" },
+    { "__init__", 70, "class GenClass2:" },
+    { "__str__", 70, "class GenClass2:" },
+    { "__eq__", 70, "class GenClass2:" },
+    { "__lt__", 70, "class GenClass2:" },
+    { "__hash__", 70, "class GenClass2:" },
+    { "__hash__", 70, "class GenClass2:" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/mod1.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+i64 Enum1_from_value(i64 value)
+{
+    switch (value) {
+    case 0:
+        return (i64)Enum1::A;
+    default:
+        mys::make_shared<ValueError>(mys::String("enum Enum1 does not contain ") + mys::String(value))->__throw();
+    }
+}
+static const mys::String __constant_1 = mys::String("Foo(");
+static const mys::String __constant_2 = mys::String("a=");
+static const mys::String __constant_3 = mys::String(")");
+static const mys::String __constant_11 = mys::String("Bar(");
+static const mys::String __constant_17 = mys::String("Kam(");
+static const mys::String __constant_18 = mys::String("x=");
+static const mys::String __constant_19 = mys::String(", y=");
+static const mys::String __constant_24 = mys::String("Foo2(");
+static const mys::String __constant_29 = mys::String("MatchFoo(");
+static const mys::String __constant_36 = mys::String("Match2Foo(");
+static const mys::String __constant_37 = mys::String("y=");
+static const mys::String __constant_44 = mys::String("hi");
+static const mys::String __constant_45 = mys::String("ho");
+static const mys::String __constant_46 = mys::String("ha");
+static const mys::String __constant_47 = mys::String("hu");
+static const mys::String __constant_48 = mys::String("MemberClass(");
+static const mys::String __constant_49 = mys::String(", b=");
+static const mys::String __constant_50 = mys::String(", c=");
+static const mys::String __constant_51 = mys::String(", d=");
+static const mys::String __constant_56 = mys::String("\"");
+static const mys::String __constant_57 = mys::String("MemberClass2(");
+static const mys::String __constant_58 = mys::String("b=");
+static const mys::String __constant_63 = mys::String("MemberClass3(");
+static const mys::String __constant_68 = mys::String("MemberClass4(");
+static const mys::String __constant_73 = mys::String("MemberClass5(");
+static const mys::String __constant_78 = mys::String("MemberClass6(");
+static const mys::String __constant_83 = mys::String("MyError(");
+static const mys::String __constant_88 = mys::String("WeakIn(");
+static const mys::String __constant_93 = mys::String("Weak(");
+static const mys::String __constant_98 = mys::String("Imp1(");
+static const mys::String __constant_109 = mys::String("GenClass(");
+static const mys::String __constant_114 = mys::String("GenClass2(");
+i64 GLOB_IN_TRAIT_METHOD;
+mys::shared_ptr<mys::mypkg::mod3::Fam> VAR4;
+mys::shared_ptr<mys::mypkg::mod1::WeakIn> _WEAK_IN;
+i64 _MACRO_VALUE;
+Foo::Foo(i32 a)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    this->a = a;
+    __MYS_TRACEBACK_EXIT();
+}
+Foo::~Foo(void)
+{
+}
+mys::String Foo::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_4 = (__constant_1 + __constant_2 + mys::String(this->a, 'd') + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__eq__(mys::shared_ptr<mys::mypkg::mod1::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    if (!(mys::Bool(this->a == other->a))) {
+        __MYS_TRACEBACK_SET(3);
+        mys::Bool __res_5 = mys::Bool(false);
+        __MYS_TRACEBACK_EXIT();
+        return __res_5;
+    }
+    __MYS_TRACEBACK_SET(4);
+    mys::Bool __res_6 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__lt__(mys::shared_ptr<mys::mypkg::mod1::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(5);
+    if (mys::Bool(this->a != other->a)) {
+        __MYS_TRACEBACK_SET(6);
+        mys::Bool __res_7 = mys::Bool(this->a < other->a);
+        __MYS_TRACEBACK_EXIT();
+        return __res_7;
+    }
+    __MYS_TRACEBACK_SET(7);
+    mys::Bool __res_8 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Foo::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(8);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(9);
+    hash += std::hash<i32>{}(this->a);
+    __MYS_TRACEBACK_SET(10);
+    i64 __res_9 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_9;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::mypkg::mod1::Kam> Bar_fie_h_default()
+{
+    return mys::make_shared<mys::mypkg::mod1::Kam>(mys::make_shared<mys::mypkg::mod1::Foo>(1), nullptr);
+}
+mys::shared_ptr<mys::mypkg::mod3::Fie> Bar::fie(mys::shared_ptr<mys::mypkg::mod1::Foo> g, mys::shared_ptr<mys::mypkg::mod1::Kam> h)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(11);
+    mys::shared_ptr<mys::mypkg::mod3::Fie> __res_10 = mys::make_shared<mys::mypkg::mod3::Fie>();
+    __MYS_TRACEBACK_EXIT();
+    return __res_10;
+    __MYS_TRACEBACK_EXIT();
+}
+Bar::Bar(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(12);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Bar::~Bar(void)
+{
+}
+mys::String Bar::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(13);
+    mys::String __res_12 = (__constant_11 + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_12;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Bar::__eq__(mys::shared_ptr<mys::mypkg::mod1::Bar> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(14);
+    mys::Bool __res_13 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_13;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Bar::__lt__(mys::shared_ptr<mys::mypkg::mod1::Bar> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(15);
+    mys::Bool __res_14 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_14;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Bar::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(16);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(17);
+    i64 __res_15 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_15;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::mypkg::mod1::Foo> Kam::fff(mys::shared_ptr<mys::mypkg::mod1::Foo> g)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(18);
+    mys::shared_ptr<mys::mypkg::mod1::Foo> __res_16 = g;
+    __MYS_TRACEBACK_EXIT();
+    return __res_16;
+    __MYS_TRACEBACK_EXIT();
+}
+Kam::Kam(mys::shared_ptr<mys::mypkg::mod1::Foo> x, mys::shared_ptr<mys::mypkg::mod3::Fie> y)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(19);
+    this->x = x;
+    __MYS_TRACEBACK_SET(20);
+    this->y = y;
+    __MYS_TRACEBACK_EXIT();
+}
+Kam::~Kam(void)
+{
+}
+mys::String Kam::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(21);
+    mys::String __res_20 = (__constant_17 + __constant_18 + object_str(this->x) + __constant_19 + object_str(this->y) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_20;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Kam::__eq__(mys::shared_ptr<mys::mypkg::mod1::Kam> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(22);
+    mys::Bool __res_21 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_21;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Kam::__lt__(mys::shared_ptr<mys::mypkg::mod1::Kam> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(23);
+    mys::Bool __res_22 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_22;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Kam::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(24);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(25);
+    i64 __res_23 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_23;
+    __MYS_TRACEBACK_EXIT();
+}
+Foo2::Foo2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(26);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Foo2::~Foo2(void)
+{
+}
+mys::String Foo2::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(27);
+    mys::String __res_25 = (__constant_24 + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_25;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo2::__eq__(mys::shared_ptr<mys::mypkg::mod1::Foo2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(28);
+    mys::Bool __res_26 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_26;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo2::__lt__(mys::shared_ptr<mys::mypkg::mod1::Foo2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(29);
+    mys::Bool __res_27 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_27;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Foo2::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(30);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(31);
+    i64 __res_28 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_28;
+    __MYS_TRACEBACK_EXIT();
+}
+MatchFoo::MatchFoo(i64 x)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(32);
+    this->x = x;
+    __MYS_TRACEBACK_EXIT();
+}
+MatchFoo::~MatchFoo(void)
+{
+}
+mys::String MatchFoo::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(33);
+    mys::String __res_30 = (__constant_29 + __constant_18 + mys::String(this->x, 'd') + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_30;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MatchFoo::__eq__(mys::shared_ptr<mys::mypkg::mod1::MatchFoo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(34);
+    if (!(mys::Bool(this->x == other->x))) {
+        __MYS_TRACEBACK_SET(35);
+        mys::Bool __res_31 = mys::Bool(false);
+        __MYS_TRACEBACK_EXIT();
+        return __res_31;
+    }
+    __MYS_TRACEBACK_SET(36);
+    mys::Bool __res_32 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_32;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MatchFoo::__lt__(mys::shared_ptr<mys::mypkg::mod1::MatchFoo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(37);
+    if (mys::Bool(this->x != other->x)) {
+        __MYS_TRACEBACK_SET(38);
+        mys::Bool __res_33 = mys::Bool(this->x < other->x);
+        __MYS_TRACEBACK_EXIT();
+        return __res_33;
+    }
+    __MYS_TRACEBACK_SET(39);
+    mys::Bool __res_34 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_34;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MatchFoo::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(40);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(41);
+    hash += std::hash<i64>{}(this->x);
+    __MYS_TRACEBACK_SET(42);
+    i64 __res_35 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_35;
+    __MYS_TRACEBACK_EXIT();
+}
+Match2Foo::Match2Foo(i64 y)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(43);
+    this->y = y;
+    __MYS_TRACEBACK_EXIT();
+}
+Match2Foo::~Match2Foo(void)
+{
+}
+mys::String Match2Foo::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(44);
+    mys::String __res_38 = (__constant_36 + __constant_37 + mys::String(this->y, 'd') + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_38;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Match2Foo::__eq__(mys::shared_ptr<mys::mypkg::mod1::Match2Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(45);
+    if (!(mys::Bool(this->y == other->y))) {
+        __MYS_TRACEBACK_SET(46);
+        mys::Bool __res_39 = mys::Bool(false);
+        __MYS_TRACEBACK_EXIT();
+        return __res_39;
+    }
+    __MYS_TRACEBACK_SET(47);
+    mys::Bool __res_40 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_40;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Match2Foo::__lt__(mys::shared_ptr<mys::mypkg::mod1::Match2Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(48);
+    if (mys::Bool(this->y != other->y)) {
+        __MYS_TRACEBACK_SET(49);
+        mys::Bool __res_41 = mys::Bool(this->y < other->y);
+        __MYS_TRACEBACK_EXIT();
+        return __res_41;
+    }
+    __MYS_TRACEBACK_SET(50);
+    mys::Bool __res_42 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_42;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Match2Foo::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(51);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(52);
+    hash += std::hash<i64>{}(this->y);
+    __MYS_TRACEBACK_SET(53);
+    i64 __res_43 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_43;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass::MemberClass(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(54);
+    this->a = mys::make_shared<mys::mypkg::mod1::MemberClass2>(__constant_44);
+    __MYS_TRACEBACK_SET(55);
+    this->b = mys::make_shared<mys::Tuple<i64, mys::shared_ptr<mys::mypkg::mod1::MemberClass3>>>(-1, mys::make_shared<mys::mypkg::mod1::MemberClass3>(__constant_45));
+    __MYS_TRACEBACK_SET(56);
+    this->c = mys::make_shared<mys::List<mys::shared_ptr<mys::Dict<i64, mys::shared_ptr<mys::mypkg::mod1::MemberClass4>>>>>(std::initializer_list<mys::shared_ptr<mys::Dict<i64, mys::shared_ptr<mys::mypkg::mod1::MemberClass4>>>>{mys::make_shared<Dict<i64, mys::shared_ptr<mys::mypkg::mod1::MemberClass4>>>(std::initializer_list<std::pair<i64, mys::shared_ptr<mys::mypkg::mod1::MemberClass4>>>{{5, mys::make_shared<mys::mypkg::mod1::MemberClass4>(__constant_46)}})});
+    __MYS_TRACEBACK_SET(57);
+    this->d = mys::make_shared<mys::mypkg::mod1::MemberClass5>(mys::make_shared<mys::mypkg::mod1::MemberClass6>(__constant_47));
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass::~MemberClass(void)
+{
+}
+mys::String MemberClass::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(58);
+    mys::String __res_52 = (__constant_48 + __constant_2 + object_str(this->a) + __constant_49 + object_str(this->b) + __constant_50 + object_str(this->c) + __constant_51 + object_str(this->d) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_52;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass::__eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(59);
+    mys::Bool __res_53 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_53;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass::__lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(60);
+    mys::Bool __res_54 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_54;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MemberClass::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(61);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(62);
+    i64 __res_55 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_55;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass2::MemberClass2(mys::String b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(63);
+    this->b = b;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass2::~MemberClass2(void)
+{
+}
+mys::String MemberClass2::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(64);
+    mys::String b = (__constant_56 + string_str(this->b) + __constant_56);
+    __MYS_TRACEBACK_SET(65);
+    mys::String __res_59 = (__constant_57 + __constant_58 + string_str(b) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_59;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass2::__eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(66);
+    mys::Bool __res_60 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_60;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass2::__lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(67);
+    mys::Bool __res_61 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_61;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MemberClass2::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(68);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(69);
+    i64 __res_62 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_62;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass3::MemberClass3(mys::String x)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(70);
+    this->x = x;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass3::~MemberClass3(void)
+{
+}
+mys::String MemberClass3::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(71);
+    mys::String x = (__constant_56 + string_str(this->x) + __constant_56);
+    __MYS_TRACEBACK_SET(72);
+    mys::String __res_64 = (__constant_63 + __constant_18 + string_str(x) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_64;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass3::__eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass3> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(73);
+    mys::Bool __res_65 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_65;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass3::__lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass3> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(74);
+    mys::Bool __res_66 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_66;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MemberClass3::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(75);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(76);
+    i64 __res_67 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_67;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass4::MemberClass4(mys::String y)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(77);
+    this->y = y;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass4::~MemberClass4(void)
+{
+}
+mys::String MemberClass4::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(78);
+    mys::String y = (__constant_56 + string_str(this->y) + __constant_56);
+    __MYS_TRACEBACK_SET(79);
+    mys::String __res_69 = (__constant_68 + __constant_37 + string_str(y) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_69;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass4::__eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass4> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(80);
+    mys::Bool __res_70 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_70;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass4::__lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass4> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(81);
+    mys::Bool __res_71 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_71;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MemberClass4::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(82);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(83);
+    i64 __res_72 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_72;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass5::MemberClass5(mys::shared_ptr<mys::mypkg::mod1::MemberClass6> a)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(84);
+    this->a = a;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass5::~MemberClass5(void)
+{
+}
+mys::String MemberClass5::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(85);
+    mys::String __res_74 = (__constant_73 + __constant_2 + object_str(this->a) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_74;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass5::__eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass5> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(86);
+    mys::Bool __res_75 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_75;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass5::__lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass5> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(87);
+    mys::Bool __res_76 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_76;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MemberClass5::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(88);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(89);
+    i64 __res_77 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_77;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass6::MemberClass6(mys::String b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(90);
+    this->b = b;
+    __MYS_TRACEBACK_EXIT();
+}
+MemberClass6::~MemberClass6(void)
+{
+}
+mys::String MemberClass6::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(91);
+    mys::String b = (__constant_56 + string_str(this->b) + __constant_56);
+    __MYS_TRACEBACK_SET(92);
+    mys::String __res_79 = (__constant_78 + __constant_58 + string_str(b) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_79;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass6::__eq__(mys::shared_ptr<mys::mypkg::mod1::MemberClass6> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(93);
+    mys::Bool __res_80 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_80;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MemberClass6::__lt__(mys::shared_ptr<mys::mypkg::mod1::MemberClass6> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(94);
+    mys::Bool __res_81 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_81;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MemberClass6::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(95);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(96);
+    i64 __res_82 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_82;
+    __MYS_TRACEBACK_EXIT();
+}
+MyError::MyError(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(97);
+
+    __MYS_TRACEBACK_EXIT();
+}
+MyError::~MyError(void)
+{
+}
+mys::String MyError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(98);
+    mys::String __res_84 = (__constant_83 + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_84;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MyError::__eq__(mys::shared_ptr<mys::mypkg::mod1::MyError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(99);
+    mys::Bool __res_85 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_85;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MyError::__lt__(mys::shared_ptr<mys::mypkg::mod1::MyError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(100);
+    mys::Bool __res_86 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_86;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MyError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(101);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(102);
+    i64 __res_87 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_87;
+    __MYS_TRACEBACK_EXIT();
+}
+void MyError::__throw()
+{
+    throw __MyError(mys::shared_ptr<MyError>(this));
+}
+void WeakIn::z(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(103);
+
+    __MYS_TRACEBACK_EXIT();
+}
+WeakIn::WeakIn(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(104);
+
+    __MYS_TRACEBACK_EXIT();
+}
+WeakIn::~WeakIn(void)
+{
+}
+mys::String WeakIn::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(105);
+    mys::String __res_89 = (__constant_88 + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_89;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool WeakIn::__eq__(mys::shared_ptr<mys::mypkg::mod1::WeakIn> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(106);
+    mys::Bool __res_90 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_90;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool WeakIn::__lt__(mys::shared_ptr<mys::mypkg::mod1::WeakIn> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(107);
+    mys::Bool __res_91 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_91;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 WeakIn::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(108);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(109);
+    i64 __res_92 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_92;
+    __MYS_TRACEBACK_EXIT();
+}
+Weak::Weak(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(110);
+    this->x = mys::mypkg::mod1::_WEAK_IN;
+    __MYS_TRACEBACK_EXIT();
+}
+Weak::~Weak(void)
+{
+}
+mys::String Weak::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(111);
+    mys::String __res_94 = (__constant_93 + __constant_18 + object_str(this->x.lock()) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_94;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Weak::__eq__(mys::shared_ptr<mys::mypkg::mod1::Weak> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(112);
+    mys::Bool __res_95 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_95;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Weak::__lt__(mys::shared_ptr<mys::mypkg::mod1::Weak> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(113);
+    mys::Bool __res_96 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_96;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Weak::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(114);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(115);
+    i64 __res_97 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_97;
+    __MYS_TRACEBACK_EXIT();
+}
+Imp1::Imp1(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(116);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Imp1::~Imp1(void)
+{
+}
+mys::String Imp1::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(117);
+    mys::String __res_99 = (__constant_98 + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_99;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Imp1::__eq__(mys::shared_ptr<mys::mypkg::mod1::Imp1> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(118);
+    mys::Bool __res_100 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_100;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Imp1::__lt__(mys::shared_ptr<mys::mypkg::mod1::Imp1> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(119);
+    mys::Bool __res_101 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_101;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Imp1::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(120);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(121);
+    i64 __res_102 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_102;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::mypkg::mod1::Kam> func4_kam_default()
+{
+    return mys::make_shared<mys::mypkg::mod1::Kam>(nullptr, nullptr);
+}
+mys::shared_ptr<mys::mypkg::mod1::Foo> func4(i32 a, mys::shared_ptr<mys::mypkg::mod3::Fam> fam, mys::shared_ptr<mys::mypkg::mod1::Kam> kam)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(122);
+    mys::shared_ptr<mys::mypkg::mod1::Foo> __res_103 = mys::make_shared<mys::mypkg::mod1::Foo>(a);
+    __MYS_TRACEBACK_EXIT();
+    return __res_103;
+    __MYS_TRACEBACK_EXIT();
+}
+void foo2(mys::shared_ptr<mys::mypkg::mod1::Base2> a)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(123);
+
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::mypkg::mod1::Match2Base> match_2(i64 v)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(124);
+    mys::shared_ptr<mys::mypkg::mod1::Match2Base> __res_104 = mys::make_shared<mys::mypkg::mod1::Match2Foo>((2 * v));
+    __MYS_TRACEBACK_EXIT();
+    return __res_104;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::mypkg::lib::Circ> circ(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(125);
+    mys::shared_ptr<mys::mypkg::lib::Circ> __res_105 = mys::make_shared<mys::mypkg::lib::Circ>();
+    __MYS_TRACEBACK_EXIT();
+    return __res_105;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::Set<mys::shared_ptr<mys::mypkg::mod1::Imp1>>> implicit_set_import(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(126);
+    mys::shared_ptr<mys::Set<mys::shared_ptr<mys::mypkg::mod1::Imp1>>> __res_106 = mys::make_shared<Set<mys::shared_ptr<mys::mypkg::mod1::Imp1>>>(std::initializer_list<mys::shared_ptr<mys::mypkg::mod1::Imp1>>{});
+    __MYS_TRACEBACK_EXIT();
+    return __res_106;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 genfunc_i64(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(127);
+    i64 __res_108 = 5;
+    __MYS_TRACEBACK_EXIT();
+    return __res_108;
+    __MYS_TRACEBACK_EXIT();
+}
+GenClass_i64::GenClass_i64(i64 a)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(128);
+    this->a = a;
+    __MYS_TRACEBACK_EXIT();
+}
+GenClass_i64::~GenClass_i64(void)
+{
+}
+mys::String GenClass_i64::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(129);
+    mys::String __res_110 = (__constant_109 + __constant_2 + mys::String(this->a, 'd') + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_110;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool GenClass_i64::__eq__(mys::shared_ptr<mys::mypkg::mod1::GenClass> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(130);
+    mys::Bool __res_111 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_111;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool GenClass_i64::__lt__(mys::shared_ptr<mys::mypkg::mod1::GenClass> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(131);
+    mys::Bool __res_112 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_112;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 GenClass_i64::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(132);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(133);
+    i64 __res_113 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_113;
+    __MYS_TRACEBACK_EXIT();
+}
+GenClass2_i64::GenClass2_i64(i64 b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(134);
+    this->b = b;
+    __MYS_TRACEBACK_EXIT();
+}
+GenClass2_i64::~GenClass2_i64(void)
+{
+}
+mys::String GenClass2_i64::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(135);
+    mys::String __res_115 = (__constant_114 + __constant_58 + mys::String(this->b, 'd') + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_115;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool GenClass2_i64::__eq__(mys::shared_ptr<mys::mypkg::mod1::GenClass2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(136);
+    mys::Bool __res_116 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_116;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool GenClass2_i64::__lt__(mys::shared_ptr<mys::mypkg::mod1::GenClass2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(137);
+    mys::Bool __res_117 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_117;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 GenClass2_i64::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(138);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(139);
+    i64 __res_118 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_118;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+    GLOB_IN_TRAIT_METHOD = 5;
+    VAR4 = nullptr;
+    _WEAK_IN = mys::make_shared<mys::mypkg::mod1::WeakIn>();
+    _MACRO_VALUE = 5;
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/mod1.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
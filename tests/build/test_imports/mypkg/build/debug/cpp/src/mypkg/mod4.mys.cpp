@@ -0,0 +1,256 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/mod4.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::mypkg::mod3 {
+extern void __module_init();
+}
+namespace mys::mypkg::mod2 {
+extern void __module_init();
+}
+namespace mys::mypkg2::mod1 {
+extern void __module_init();
+}
+namespace mys::mypkg2::lib {
+extern void __module_init();
+}
+namespace mys::mypkg1::_mod1 {
+extern void __module_init();
+}
+namespace mys::mypkg1::_subpkg2::mod1 {
+extern void __module_init();
+}
+namespace mys::mypkg1::lib {
+extern void __module_init();
+}
+namespace mys::mypkg1::subpkg1::mod1 {
+extern void __module_init();
+}
+namespace mys::mypkg::lib {
+extern void __module_init();
+}
+namespace mys::mypkg::mod1 {
+extern void __module_init();
+}
+namespace mys::mypkg::mod4 {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::mypkg::mod3::__module_init();
+    mys::mypkg::mod2::__module_init();
+    mys::mypkg2::mod1::__module_init();
+    mys::mypkg2::lib::__module_init();
+    mys::mypkg1::_mod1::__module_init();
+    mys::mypkg1::_subpkg2::mod1::__module_init();
+    mys::mypkg1::lib::__module_init();
+    mys::mypkg1::subpkg1::mod1::__module_init();
+    mys::mypkg::lib::__module_init();
+    mys::mypkg::mod1::__module_init();
+    mys::mypkg::mod4::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg::mod3 {
+extern void __module_exit();
+}
+namespace mys::mypkg::mod2 {
+extern void __module_exit();
+}
+namespace mys::mypkg2::mod1 {
+extern void __module_exit();
+}
+namespace mys::mypkg2::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg1::_mod1 {
+extern void __module_exit();
+}
+namespace mys::mypkg1::_subpkg2::mod1 {
+extern void __module_exit();
+}
+namespace mys::mypkg1::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg1::subpkg1::mod1 {
+extern void __module_exit();
+}
+namespace mys::mypkg::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg::mod1 {
+extern void __module_exit();
+}
+namespace mys::mypkg::mod4 {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::mypkg::mod3::__module_exit();
+    mys::mypkg::mod2::__module_exit();
+    mys::mypkg2::mod1::__module_exit();
+    mys::mypkg2::lib::__module_exit();
+    mys::mypkg1::_mod1::__module_exit();
+    mys::mypkg1::_subpkg2::mod1::__module_exit();
+    mys::mypkg1::lib::__module_exit();
+    mys::mypkg1::subpkg1::mod1::__module_exit();
+    mys::mypkg::lib::__module_exit();
+    mys::mypkg::mod1::__module_exit();
+    mys::mypkg::mod4::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::mypkg::mod4
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "foo", 9, "return \"k\"" },
+    { "__init__", 3, "class ImplementsTrait(Base):" },
+    { "__str__", 3, "class ImplementsTrait(Base):" },
+    { "__eq__", 3, "class ImplementsTrait(Base):" },
+    { "__lt__", 3, "class ImplementsTrait(Base):" },
+    { "__hash__", 3, "class ImplementsTrait(Base):" },
+    { "__hash__", 3, "class ImplementsTrait(Base):" },
+    { "bar", 36, "known bug" },
+    { "fie", 39, "known bug" },
+    { "strings", 12, "v = ImplementsTrait()" },
+    { "strings", 14, "assert v.foo() == \"k\"" },
+    { "strings", 15, "assert v.bar() == \"base\"" },
+    { "strings", 16, "assert v.fie() == 'a'" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/mod4.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("k");
+static const mys::String __constant_3 = mys::String("ImplementsTrait(");
+static const mys::String __constant_4 = mys::String(")");
+static const mys::String __constant_9 = mys::String("base");
+static const mys::Char __constant_16 = Char(97);
+mys::String ImplementsTrait::foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    mys::String __res_2 = __constant_1;
+    __MYS_TRACEBACK_EXIT();
+    return __res_2;
+    __MYS_TRACEBACK_EXIT();
+}
+ImplementsTrait::ImplementsTrait(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+
+    __MYS_TRACEBACK_EXIT();
+}
+ImplementsTrait::~ImplementsTrait(void)
+{
+}
+mys::String ImplementsTrait::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::String __res_5 = (__constant_3 + __constant_4);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool ImplementsTrait::__eq__(mys::shared_ptr<mys::mypkg::mod4::ImplementsTrait> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_6 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool ImplementsTrait::__lt__(mys::shared_ptr<mys::mypkg::mod4::ImplementsTrait> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    mys::Bool __res_7 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_7;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 ImplementsTrait::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(5);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(6);
+    i64 __res_8 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String ImplementsTrait::bar(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    mys::String __res_10 = __constant_9;
+    __MYS_TRACEBACK_EXIT();
+    return __res_10;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Char ImplementsTrait::fie(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(8);
+    mys::Char __res_11 = Char(97);
+    __MYS_TRACEBACK_EXIT();
+    return __res_11;
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_strings(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(9);
+    mys::shared_ptr<mys::mypkg::mod4::ImplementsTrait> v = mys::make_shared<mys::mypkg::mod4::ImplementsTrait>();
+    __MYS_TRACEBACK_SET(10);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_12 = v->foo();
+    const mys::String __var_13 = __constant_1;
+    if (!((__var_12 == __var_13))) {
+        std::cout << "./src/mod4.mys:14: assert " << PrintString(string_with_quotes(__var_12) + " == " + string_with_quotes(__var_13)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_12) + " == " + string_with_quotes(__var_13) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(11);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_14 = v->bar();
+    const mys::String __var_15 = __constant_9;
+    if (!((__var_14 == __var_15))) {
+        std::cout << "./src/mod4.mys:15: assert " << PrintString(string_with_quotes(__var_14) + " == " + string_with_quotes(__var_15)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_14) + " == " + string_with_quotes(__var_15) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(12);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::Char __var_17 = v->fie();
+    const mys::Char __var_18 = __constant_16;
+    if (!((__var_17 == __var_18))) {
+        std::cout << "./src/mod4.mys:16: assert " << PrintString(mys::String(__var_17) + " == " + mys::String(__var_18)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_17) + " == " + mys::String(__var_18) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_strings("mod4::strings", mys_test_strings);
+#endif
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/mod4.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
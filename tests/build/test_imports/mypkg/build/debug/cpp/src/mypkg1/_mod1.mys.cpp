@@ -0,0 +1,77 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg1/_mod1.mys.hpp"
+namespace mys::mypkg1::_mod1
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 1, "class Foo:" },
+    { "__str__", 1, "class Foo:" },
+    { "__eq__", 1, "class Foo:" },
+    { "__lt__", 1, "class Foo:" },
+    { "__hash__", 1, "class Foo:" },
+    { "__hash__", 1, "class Foo:" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "../mypkg1/src/_mod1.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("Foo(");
+static const mys::String __constant_2 = mys::String(")");
+Foo::Foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Foo::~Foo(void)
+{
+}
+mys::String Foo::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_3 = (__constant_1 + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_3;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__eq__(mys::shared_ptr<mys::mypkg1::_mod1::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::Bool __res_4 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__lt__(mys::shared_ptr<mys::mypkg1::_mod1::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_5 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Foo::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(5);
+    i64 __res_6 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ../mypkg1/src/_mod1.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
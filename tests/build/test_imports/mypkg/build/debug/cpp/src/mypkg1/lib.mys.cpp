@@ -0,0 +1,106 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg1/lib.mys.hpp"
+namespace mys::mypkg1::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 18, "class Class1:" },
+    { "__str__", 18, "class Class1:" },
+    { "__eq__", 18, "class Class1:" },
+    { "__lt__", 18, "class Class1:" },
+    { "__hash__", 18, "class Class1:" },
+    { "__hash__", 18, "class Class1:" },
+    { "foo", 24, "pass" },
+    { "bar", 27, "fum(Foo())" },
+    { "tam", 30, "print(PackagePrivateFoo1())" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "../mypkg1/src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("Class1(");
+static const mys::String __constant_2 = mys::String("_x=");
+static const mys::String __constant_3 = mys::String(")");
+i32 VAR2;
+i32 VAR3;
+Class1::Class1(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    this->_x = nullptr;
+    __MYS_TRACEBACK_EXIT();
+}
+Class1::~Class1(void)
+{
+}
+mys::String Class1::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_4 = (__constant_1 + __constant_2 + object_str(this->_x) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Class1::__eq__(mys::shared_ptr<mys::mypkg1::lib::Class1> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::Bool __res_5 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Class1::__lt__(mys::shared_ptr<mys::mypkg1::lib::Class1> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_6 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Class1::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(5);
+    i64 __res_7 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_7;
+    __MYS_TRACEBACK_EXIT();
+}
+void foo(mys::shared_ptr<mys::mypkg1::lib::Class1> a, mys::shared_ptr<mys::mypkg2::lib::Class1> b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(6);
+
+    __MYS_TRACEBACK_EXIT();
+}
+void bar(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    mys::mypkg2::lib::fum(mys::make_shared<mys::mypkg2::mod1::Foo>());
+    __MYS_TRACEBACK_EXIT();
+}
+void tam(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(8);
+    std::cout << mys::make_shared<mys::mypkg1::_mod1::Foo>() << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+    VAR2 = 7;
+    VAR3 = 1;
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ../mypkg1/src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,174 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg1/subpkg1/mod1.mys.hpp"
+namespace mys::mypkg1::subpkg1::mod1
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 9, "class Class1:" },
+    { "__str__", 9, "class Class1:" },
+    { "__eq__", 9, "class Class1:" },
+    { "__eq__", 9, "class Class1:" },
+    { "__eq__", 9, "class Class1:" },
+    { "__lt__", 9, "class Class1:" },
+    { "__lt__", 9, "class Class1:" },
+    { "__lt__", 9, "class Class1:" },
+    { "__hash__", 9, "class Class1:" },
+    { "__hash__", 9, "class Class1:" },
+    { "__hash__", 9, "class Class1:" },
+    { "__init__", 13, "class Class2:" },
+    { "__str__", 13, "class Class2:" },
+    { "__eq__", 13, "class Class2:" },
+    { "__lt__", 13, "class Class2:" },
+    { "__hash__", 13, "class Class2:" },
+    { "__hash__", 13, "class Class2:" },
+    { "func1", 4, "return first + second" },
+    { "func2", 7, "return first * second" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "../mypkg1/src/subpkg1/mod1.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("Class1(");
+static const mys::String __constant_2 = mys::String("value=");
+static const mys::String __constant_3 = mys::String(")");
+static const mys::String __constant_10 = mys::String("Class2(");
+Class1::Class1(i32 value)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    this->value = value;
+    __MYS_TRACEBACK_EXIT();
+}
+Class1::~Class1(void)
+{
+}
+mys::String Class1::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_4 = (__constant_1 + __constant_2 + mys::String(this->value, 'd') + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Class1::__eq__(mys::shared_ptr<mys::mypkg1::subpkg1::mod1::Class1> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    if (!(mys::Bool(this->value == other->value))) {
+        __MYS_TRACEBACK_SET(3);
+        mys::Bool __res_5 = mys::Bool(false);
+        __MYS_TRACEBACK_EXIT();
+        return __res_5;
+    }
+    __MYS_TRACEBACK_SET(4);
+    mys::Bool __res_6 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Class1::__lt__(mys::shared_ptr<mys::mypkg1::subpkg1::mod1::Class1> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(5);
+    if (mys::Bool(this->value != other->value)) {
+        __MYS_TRACEBACK_SET(6);
+        mys::Bool __res_7 = mys::Bool(this->value < other->value);
+        __MYS_TRACEBACK_EXIT();
+        return __res_7;
+    }
+    __MYS_TRACEBACK_SET(7);
+    mys::Bool __res_8 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Class1::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(8);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(9);
+    hash += std::hash<i32>{}(this->value);
+    __MYS_TRACEBACK_SET(10);
+    i64 __res_9 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_9;
+    __MYS_TRACEBACK_EXIT();
+}
+Class2::Class2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(11);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Class2::~Class2(void)
+{
+}
+mys::String Class2::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(12);
+    mys::String __res_11 = (__constant_10 + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_11;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Class2::__eq__(mys::shared_ptr<mys::mypkg1::subpkg1::mod1::Class2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(13);
+    mys::Bool __res_12 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_12;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Class2::__lt__(mys::shared_ptr<mys::mypkg1::subpkg1::mod1::Class2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(14);
+    mys::Bool __res_13 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_13;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Class2::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(15);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(16);
+    i64 __res_14 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_14;
+    __MYS_TRACEBACK_EXIT();
+}
+i32 func1(i32 first, i32 second)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(17);
+    i32 __res_15 = (first + second);
+    __MYS_TRACEBACK_EXIT();
+    return __res_15;
+    __MYS_TRACEBACK_EXIT();
+}
+i32 func2(i32 first, i32 second)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(18);
+    i32 __res_16 = (first * second);
+    __MYS_TRACEBACK_EXIT();
+    return __res_16;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ../mypkg1/src/subpkg1/mod1.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
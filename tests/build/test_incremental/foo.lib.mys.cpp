@@ -0,0 +1,41 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "foo.lib.mys.hpp"
+namespace mys::foo::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "add", 2, "return b + a" },
+    { "sub", 4, "return a - b" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+i64 add(i64 a, i64 b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    i64 __res_1 = (b + a);
+    __MYS_TRACEBACK_EXIT();
+    return __res_1;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 sub(i64 a, i64 b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    i64 __res_2 = (a - b);
+    __MYS_TRACEBACK_EXIT();
+    return __res_2;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: " << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,12 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_foo_lib_EARLY_HPP
+#define mys_foo_lib_EARLY_HPP
+namespace mys::foo::lib
+{
+}
+namespace mys::foo::lib
+{
+i64 add(i64 a, i64 b);
+i64 sub(i64 a, i64 b);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_foo_lib_EARLY_HPP
+#define mys_foo_lib_EARLY_HPP
+namespace mys::foo::lib
+{
+}
+namespace mys::foo::lib
+{
+f64 add_f64(f64 a, f64 b);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_foo_lib_HPP
+#define mys_foo_lib_HPP
+#include "foo.lib.mys.early.hpp"
+namespace mys::foo::lib
+{
+}
+#endif
\ No newline at end of file
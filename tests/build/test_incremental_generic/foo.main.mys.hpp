@@ -0,0 +1,9 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_foo_main_HPP
+#define mys_foo_main_HPP
+#include "foo.main.mys.early.hpp"
+#include "foo/lib.mys.hpp"
+namespace mys::foo::main
+{
+}
+#endif
\ No newline at end of file
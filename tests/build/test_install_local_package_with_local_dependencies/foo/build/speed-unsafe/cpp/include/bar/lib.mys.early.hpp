@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_bar_lib_EARLY_HPP
+#define mys_bar_lib_EARLY_HPP
+namespace mys::bar::lib
+{
+}
+namespace mys::bar::lib
+{
+void hello(void);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_foo_main_EARLY_HPP
+#define mys_foo_main_EARLY_HPP
+namespace mys::foo::main
+{
+}
+#include "bar/lib.mys.early.hpp"
+namespace mys::foo::main
+{
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,68 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "foo/main.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::bar::lib {
+extern void __module_init();
+}
+namespace mys::foo::main {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::bar::lib::__module_init();
+    mys::foo::main::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::bar::lib {
+extern void __module_exit();
+}
+namespace mys::foo::main {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::bar::lib::__module_exit();
+    mys::foo::main::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::foo::main
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "main", 4, "hello()" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/main.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+void main(int __argc, char * const __argv[])
+{
+    (void)__argc;
+    (void)__argv;
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    mys::bar::lib::hello();
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/main.mys" << "\n";
+#endif
+}
+}
+void package_main(int argc, char * const argv[])
+{
+    mys::foo::main::main(argc, argv);
+}
\ No newline at end of file
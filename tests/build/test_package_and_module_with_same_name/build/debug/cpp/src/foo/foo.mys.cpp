@@ -0,0 +1,163 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "foo/foo.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::foo::foo {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::foo::foo::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::foo::foo {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::foo::foo::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::foo::foo
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 6, "class Foo():" },
+    { "__str__", 6, "class Foo():" },
+    { "__eq__", 6, "class Foo():" },
+    { "__lt__", 6, "class Foo():" },
+    { "__hash__", 6, "class Foo():" },
+    { "__hash__", 6, "class Foo():" },
+    { "foo", 4, "pass" },
+    { "foo", 13, "assert V == 1" },
+    { "foo", 14, "foo()" },
+    { "foo", 15, "assert str(Foo()) == \"Foo()\"" },
+    { "foo", 16, "assert A.B == A.B" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/foo.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+i64 A_from_value(i64 value)
+{
+    switch (value) {
+    case 1:
+        return (i64)A::B;
+    default:
+        mys::make_shared<ValueError>(mys::String("enum A does not contain ") + mys::String(value))->__throw();
+    }
+}
+static const mys::String __constant_1 = mys::String("Foo(");
+static const mys::String __constant_2 = mys::String(")");
+static const mys::String __constant_9 = mys::String("Foo()");
+i64 V;
+Foo::Foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Foo::~Foo(void)
+{
+}
+mys::String Foo::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_3 = (__constant_1 + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_3;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__eq__(mys::shared_ptr<mys::foo::foo::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::Bool __res_4 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__lt__(mys::shared_ptr<mys::foo::foo::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_5 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Foo::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(5);
+    i64 __res_6 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+void foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(6);
+
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_7 = mys::foo::foo::V;
+    const i64 __var_8 = 1;
+    if (!((__var_7 == __var_8))) {
+        std::cout << "./src/foo.mys:13: assert " << PrintString(mys::String(__var_7) + " == " + mys::String(__var_8)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_7) + " == " + mys::String(__var_8) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(8);
+    mys::foo::foo::foo();
+    __MYS_TRACEBACK_SET(9);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_10 = object_str(mys::make_shared<mys::foo::foo::Foo>());
+    const mys::String __var_11 = __constant_9;
+    if (!((__var_10 == __var_11))) {
+        std::cout << "./src/foo.mys:15: assert " << PrintString(string_with_quotes(__var_10) + " == " + string_with_quotes(__var_11)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_10) + " == " + string_with_quotes(__var_11) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(10);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_12 = (i64)mys::foo::foo::A::B;
+    const i64 __var_13 = (i64)mys::foo::foo::A::B;
+    if (!((__var_12 == __var_13))) {
+        std::cout << "./src/foo.mys:16: assert " << PrintString(mys::String(__var_12) + " == " + mys::String(__var_13)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_12) + " == " + mys::String(__var_13) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_foo("foo::foo", mys_test_foo);
+#endif
+void __module_init()
+{
+    V = 1;
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/foo.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
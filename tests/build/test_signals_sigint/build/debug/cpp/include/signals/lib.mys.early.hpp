@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_signals_lib_EARLY_HPP
+#define mys_signals_lib_EARLY_HPP
+namespace mys::signals::lib
+{
+}
+#include "fiber/lib.mys.early.hpp"
+namespace mys::signals::lib
+{
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,9 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_signals_lib_HPP
+#define mys_signals_lib_HPP
+#include "signals/lib.mys.early.hpp"
+#include "fiber/lib.mys.hpp"
+namespace mys::signals::lib
+{
+}
+#endif
\ No newline at end of file
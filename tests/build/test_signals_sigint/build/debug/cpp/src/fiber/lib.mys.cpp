@@ -0,0 +1,1195 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "fiber/lib.mys.hpp"
+/* c-string-source-before-namespace start */
+static void timer_sleep_complete(uv_timer_t *handle_p)
+{
+    mys::fiber::lib::Timer *timer_p = (mys::fiber::lib::Timer *)handle_p->data;
+    timer_p->_handler->on_timeout();
+}
+/* c-string-source-before-namespace stop */
+namespace mys::fiber::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 9, "class CancelledError(Error):" },
+    { "__str__", 9, "class CancelledError(Error):" },
+    { "__eq__", 9, "class CancelledError(Error):" },
+    { "__lt__", 9, "class CancelledError(Error):" },
+    { "__hash__", 9, "class CancelledError(Error):" },
+    { "__hash__", 9, "class CancelledError(Error):" },
+    { "__init__", 92, "class QueueError(Error):" },
+    { "__str__", 92, "class QueueError(Error):" },
+    { "__str__", 92, "class QueueError(Error):" },
+    { "__eq__", 92, "class QueueError(Error):" },
+    { "__lt__", 92, "class QueueError(Error):" },
+    { "__hash__", 92, "class QueueError(Error):" },
+    { "__hash__", 92, "class QueueError(Error):" },
+    { "__init__", 184, "class ChannelError(Error):" },
+    { "__str__", 184, "class ChannelError(Error):" },
+    { "__str__", 184, "class ChannelError(Error):" },
+    { "__eq__", 184, "class ChannelError(Error):" },
+    { "__lt__", 184, "class ChannelError(Error):" },
+    { "__hash__", 184, "class ChannelError(Error):" },
+    { "__hash__", 184, "class ChannelError(Error):" },
+    { "__init__", 319, "self._is_acquired = False" },
+    { "__init__", 320, "self._waiters = []" },
+    { "acquire", 328, "if self._is_acquired:" },
+    { "acquire", 329, "self._waiters.append(current())" },
+    { "acquire", 331, "try:" },
+    { "acquire", 332, "suspend()" },
+    { "acquire", 334, "self._waiters.remove(current())" },
+    { "acquire", 335, "raise" },
+    { "acquire", 337, "self._is_acquired = True" },
+    { "release", 345, "if self._waiters.length() > 0:" },
+    { "release", 346, "resume(self._waiters.pop())" },
+    { "release", 348, "self._is_acquired = False" },
+    { "__str__", 314, "class Lock:" },
+    { "__eq__", 314, "class Lock:" },
+    { "__lt__", 314, "class Lock:" },
+    { "__hash__", 314, "class Lock:" },
+    { "__hash__", 314, "class Lock:" },
+    { "__hash__", 314, "class Lock:" },
+    { "__init__", 350, "class EventError(Error):" },
+    { "__str__", 350, "class EventError(Error):" },
+    { "__str__", 350, "class EventError(Error):" },
+    { "__eq__", 350, "class EventError(Error):" },
+    { "__lt__", 350, "class EventError(Error):" },
+    { "__hash__", 350, "class EventError(Error):" },
+    { "__hash__", 350, "class EventError(Error):" },
+    { "set", 362, "self._is_set = True" },
+    { "set", 364, "if self._waiter is not None:" },
+    { "set", 365, "resume(self._waiter)" },
+    { "set", 366, "self._waiter = None" },
+    { "clear", 373, "self._is_set = False" },
+    { "wait", 380, "if self._is_set:" },
+    { "wait", 381, "return" },
+    { "wait", 383, "if self._waiter is not None:" },
+    { "wait", 384, "raise EventError(\"only one fiber can wait for an event\")" },
+    { "wait", 386, "self._waiter = current()" },
+    { "wait", 388, "try:" },
+    { "wait", 389, "suspend()" },
+    { "wait", 391, "self._waiter = None" },
+    { "wait", 392, "raise" },
+    { "__init__", 353, "class Event:" },
+    { "__init__", 353, "class Event:" },
+    { "__str__", 353, "class Event:" },
+    { "__eq__", 353, "class Event:" },
+    { "__lt__", 353, "class Event:" },
+    { "__hash__", 353, "class Event:" },
+    { "__hash__", 353, "class Event:" },
+    { "__hash__", 353, "class Event:" },
+    { "__init__", 418, "self._handler = handler" },
+    { "__init__", 419, "self._initial = u64(1000.0 * initial)" },
+    { "__init__", 421, "if interval is None:" },
+    { "__init__", 422, "interval = 0.0" },
+    { "__init__", 424, "self._interval = u64(1000.0 * interval)" },
+    { "__init__", 426, "c\"\"\"" },
+    { "start", 439, "c\"\"\"" },
+    { "stop", 448, "c\"\"\"" },
+    { "__str__", 401, "class Timer:" },
+    { "__eq__", 401, "class Timer:" },
+    { "__lt__", 401, "class Timer:" },
+    { "__hash__", 401, "class Timer:" },
+    { "__hash__", 401, "class Timer:" },
+    { "__hash__", 401, "class Timer:" },
+    { "__hash__", 401, "class Timer:" },
+    { "on_timeout", 462, "self.queue.put(self.message)" },
+    { "__init__", 457, "class _TimerHandler(TimerHandler):" },
+    { "__init__", 457, "class _TimerHandler(TimerHandler):" },
+    { "__str__", 457, "class _TimerHandler(TimerHandler):" },
+    { "__eq__", 457, "class _TimerHandler(TimerHandler):" },
+    { "__lt__", 457, "class _TimerHandler(TimerHandler):" },
+    { "__hash__", 457, "class _TimerHandler(TimerHandler):" },
+    { "__hash__", 457, "class _TimerHandler(TimerHandler):" },
+    { "__init__", 472, "self._timer = Timer(_TimerHandler(queue, message), initial, interval)" },
+    { "start", 475, "self._timer.start()" },
+    { "stop", 478, "self._timer.stop()" },
+    { "__str__", 464, "class MessageTimer:" },
+    { "__eq__", 464, "class MessageTimer:" },
+    { "__lt__", 464, "class MessageTimer:" },
+    { "__hash__", 464, "class MessageTimer:" },
+    { "__hash__", 464, "class MessageTimer:" },
+    { "__init__", 494, "self._reader = None" },
+    { "__init__", 495, "self._is_closed = False" },
+    { "open", 502, "self._is_closed = False" },
+    { "close", 510, "self._is_closed = True" },
+    { "close", 512, "if self._reader is not None:" },
+    { "close", 513, "resume(self._reader)" },
+    { "close", 514, "self._reader = None" },
+    { "length", 521, "length = 0" },
+    { "length", 522, "c\"length = m_values.length();\"" },
+    { "length", 524, "return length" },
+    { "put", 531, "if self._is_closed:" },
+    { "put", 532, "raise QueueError(\"Cannot put message on closed queue.\")" },
+    { "put", 534, "c\"m_values.push_back(value);\"" },
+    { "put", 536, "if self._reader is not None:" },
+    { "put", 537, "resume(self._reader)" },
+    { "put", 538, "self._reader = None" },
+    { "get", 546, "if self.length() == 0:" },
+    { "get", 547, "if self._reader is not None:" },
+    { "get", 548, "raise QueueError(\"only one fiber can get for a queue\")" },
+    { "get", 550, "if self._is_closed:" },
+    { "get", 551, "raise QueueError(\"Cannot get message from closed queue.\")" },
+    { "get", 553, "self._reader = current()" },
+    { "get", 555, "try:" },
+    { "get", 556, "suspend()" },
+    { "get", 558, "self._reader = None" },
+    { "get", 559, "raise" },
+    { "get", 561, "if self.length() == 0:" },
+    { "get", 562, "raise QueueError(\"Cannot get message from closed queue.\")" },
+    { "get", 564, "value: Message? = None" },
+    { "get", 565, "c\"value = m_values.pop_front();\"" },
+    { "get", 567, "return value" },
+    { "__str__", 481, "class MessageQueue:" },
+    { "__eq__", 481, "class MessageQueue:" },
+    { "__lt__", 481, "class MessageQueue:" },
+    { "__hash__", 481, "class MessageQueue:" },
+    { "__hash__", 481, "class MessageQueue:" },
+    { "__hash__", 481, "class MessageQueue:" },
+    { "__init__", 578, "self._subscribers = {}" },
+    { "__init__", 579, "self._lock = Lock()" },
+    { "broadcast", 582, "self._lock.acquire()" },
+    { "broadcast", 584, "try:" },
+    { "broadcast", 585, "queues = self._subscribers.get(message_id, None)" },
+    { "broadcast", 587, "if queues is not None:" },
+    { "broadcast", 588, "for queue in queues:" },
+    { "broadcast", 591, "self._lock.release()" },
+    { "subscribe", 594, "self._lock.acquire()" },
+    { "subscribe", 596, "try:" },
+    { "subscribe", 597, "if message_id not in self._subscribers:" },
+    { "subscribe", 598, "self._subscribers[message_id] = []" },
+    { "subscribe", 600, "self._subscribers[message_id].append(queue)" },
+    { "subscribe", 602, "self._lock.release()" },
+    { "unsubscribe", 605, "raise NotImplementedError(\"Unsubscribe not implemented.\")" },
+    { "__str__", 569, "class Bus:" },
+    { "__eq__", 569, "class Bus:" },
+    { "__lt__", 569, "class Bus:" },
+    { "__hash__", 569, "class Bus:" },
+    { "__hash__", 569, "class Bus:" },
+    { "suspend", 52, "cancelled: bool = False" },
+    { "suspend", 54, "c\"cancelled = mys::suspend();\"" },
+    { "suspend", 56, "if cancelled:" },
+    { "suspend", 57, "raise CancelledError()" },
+    { "resume", 67, "c\"mys::resume(fiber);\"" },
+    { "sleep", 74, "cancelled: bool = False" },
+    { "sleep", 76, "c\"cancelled = mys::sleep(seconds);\"" },
+    { "sleep", 78, "if cancelled:" },
+    { "sleep", 79, "raise CancelledError()" },
+    { "current", 86, "fiber: Fiber? = None" },
+    { "current", 88, "c\"fiber = mys::current();\"" },
+    { "current", 90, "return fiber" },
+    { "broadcast", 614, "_BUS.broadcast(message_id, message)" },
+    { "subscribe", 621, "_BUS.subscribe(message_id, queue)" },
+    { "unsubscribe", 628, "_BUS.unsubscribe(message_id, queue)" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "/root/package/mys/lib/packages/fiber/src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("CancelledError(");
+static const mys::String __constant_2 = mys::String(")");
+static const mys::String __constant_7 = mys::String("\"");
+static const mys::String __constant_8 = mys::String("QueueError(");
+static const mys::String __constant_9 = mys::String("message=");
+static const mys::String __constant_14 = mys::String("ChannelError(");
+static const mys::String __constant_21 = mys::String("Lock(");
+static const mys::String __constant_22 = mys::String("_is_acquired=");
+static const mys::String __constant_23 = mys::String(", _waiters=");
+static const mys::String __constant_28 = mys::String("EventError(");
+static const mys::String __constant_33 = mys::String("only one fiber can wait for an event");
+static const mys::String __constant_36 = mys::String("Event(");
+static const mys::String __constant_37 = mys::String("_is_set=");
+static const mys::String __constant_38 = mys::String(", _waiter=");
+static const mys::String __constant_43 = mys::String("Timer(");
+static const mys::String __constant_44 = mys::String("_handler=");
+static const mys::String __constant_45 = mys::String(", _initial=");
+static const mys::String __constant_46 = mys::String(", _interval=");
+static const mys::String __constant_51 = mys::String("_TimerHandler(");
+static const mys::String __constant_52 = mys::String("queue=");
+static const mys::String __constant_53 = mys::String(", message=");
+static const mys::String __constant_58 = mys::String("MessageTimer(");
+static const mys::String __constant_59 = mys::String("_timer=");
+static const mys::String __constant_65 = mys::String("Cannot put message on closed queue.");
+static const mys::String __constant_66 = mys::String("only one fiber can get for a queue");
+static const mys::String __constant_67 = mys::String("Cannot get message from closed queue.");
+static const mys::String __constant_71 = mys::String("MessageQueue(");
+static const mys::String __constant_72 = mys::String("_reader=");
+static const mys::String __constant_73 = mys::String(", _is_closed=");
+static const mys::String __constant_83 = mys::String("Unsubscribe not implemented.");
+static const mys::String __constant_84 = mys::String("Bus(");
+static const mys::String __constant_85 = mys::String("_subscribers=");
+static const mys::String __constant_86 = mys::String(", _lock=");
+mys::shared_ptr<mys::fiber::lib::Bus> _BUS;
+CancelledError::CancelledError(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+
+    __MYS_TRACEBACK_EXIT();
+}
+CancelledError::~CancelledError(void)
+{
+}
+mys::String CancelledError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_3 = (__constant_1 + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_3;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool CancelledError::__eq__(mys::shared_ptr<mys::fiber::lib::CancelledError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::Bool __res_4 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool CancelledError::__lt__(mys::shared_ptr<mys::fiber::lib::CancelledError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_5 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 CancelledError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(5);
+    i64 __res_6 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+void CancelledError::__throw()
+{
+    throw __CancelledError(mys::shared_ptr<CancelledError>(this));
+}
+QueueError::QueueError(mys::String message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(6);
+    this->message = message;
+    __MYS_TRACEBACK_EXIT();
+}
+QueueError::~QueueError(void)
+{
+}
+mys::String QueueError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    mys::String message = (__constant_7 + string_str(this->message) + __constant_7);
+    __MYS_TRACEBACK_SET(8);
+    mys::String __res_10 = (__constant_8 + __constant_9 + string_str(message) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_10;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool QueueError::__eq__(mys::shared_ptr<mys::fiber::lib::QueueError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(9);
+    mys::Bool __res_11 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_11;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool QueueError::__lt__(mys::shared_ptr<mys::fiber::lib::QueueError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(10);
+    mys::Bool __res_12 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_12;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 QueueError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(11);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(12);
+    i64 __res_13 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_13;
+    __MYS_TRACEBACK_EXIT();
+}
+void QueueError::__throw()
+{
+    throw __QueueError(mys::shared_ptr<QueueError>(this));
+}
+ChannelError::ChannelError(mys::String message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(13);
+    this->message = message;
+    __MYS_TRACEBACK_EXIT();
+}
+ChannelError::~ChannelError(void)
+{
+}
+mys::String ChannelError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(14);
+    mys::String message = (__constant_7 + string_str(this->message) + __constant_7);
+    __MYS_TRACEBACK_SET(15);
+    mys::String __res_15 = (__constant_14 + __constant_9 + string_str(message) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_15;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool ChannelError::__eq__(mys::shared_ptr<mys::fiber::lib::ChannelError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(16);
+    mys::Bool __res_16 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_16;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool ChannelError::__lt__(mys::shared_ptr<mys::fiber::lib::ChannelError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(17);
+    mys::Bool __res_17 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_17;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 ChannelError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(18);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(19);
+    i64 __res_18 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_18;
+    __MYS_TRACEBACK_EXIT();
+}
+void ChannelError::__throw()
+{
+    throw __ChannelError(mys::shared_ptr<ChannelError>(this));
+}
+Lock::Lock(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(20);
+    this->_is_acquired = mys::Bool(false);
+    __MYS_TRACEBACK_SET(21);
+    this->_waiters = mys::make_shared<mys::List<mys::shared_ptr<Fiber>>>(std::initializer_list<mys::shared_ptr<Fiber>>{});
+    __MYS_TRACEBACK_EXIT();
+}
+void Lock::acquire(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(22);
+    if (this->_is_acquired) {
+        __MYS_TRACEBACK_SET(23);
+        this->_waiters->append(mys::fiber::lib::current());
+        __MYS_TRACEBACK_SET(24);
+        try {
+            __MYS_TRACEBACK_SET(25);
+            mys::fiber::lib::suspend();
+        } catch (fiber::lib::__CancelledError __e_20) {
+            __MYS_TRACEBACK_RESTORE();
+            __MYS_TRACEBACK_SET(26);
+            this->_waiters->remove(mys::fiber::lib::current());
+            __MYS_TRACEBACK_SET(27);
+            throw;
+        }
+    } else {
+        __MYS_TRACEBACK_SET(28);
+        this->_is_acquired = mys::Bool(true);
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+void Lock::release(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(29);
+    if (mys::Bool(this->_waiters->length() > 0)) {
+        __MYS_TRACEBACK_SET(30);
+        mys::fiber::lib::resume(this->_waiters->pop(std::nullopt));
+    } else {
+        __MYS_TRACEBACK_SET(31);
+        this->_is_acquired = mys::Bool(false);
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+Lock::~Lock(void)
+{
+}
+mys::String Lock::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(32);
+    mys::String __res_24 = (__constant_21 + __constant_22 + mys::String(this->_is_acquired) + __constant_23 + object_str(this->_waiters) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_24;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Lock::__eq__(mys::shared_ptr<mys::fiber::lib::Lock> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(33);
+    mys::Bool __res_25 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_25;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Lock::__lt__(mys::shared_ptr<mys::fiber::lib::Lock> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(34);
+    mys::Bool __res_26 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_26;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Lock::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(35);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(36);
+    hash += std::hash<mys::Bool>{}(this->_is_acquired);
+    __MYS_TRACEBACK_SET(37);
+    i64 __res_27 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_27;
+    __MYS_TRACEBACK_EXIT();
+}
+EventError::EventError(mys::String message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(38);
+    this->message = message;
+    __MYS_TRACEBACK_EXIT();
+}
+EventError::~EventError(void)
+{
+}
+mys::String EventError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(39);
+    mys::String message = (__constant_7 + string_str(this->message) + __constant_7);
+    __MYS_TRACEBACK_SET(40);
+    mys::String __res_29 = (__constant_28 + __constant_9 + string_str(message) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_29;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool EventError::__eq__(mys::shared_ptr<mys::fiber::lib::EventError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(41);
+    mys::Bool __res_30 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_30;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool EventError::__lt__(mys::shared_ptr<mys::fiber::lib::EventError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(42);
+    mys::Bool __res_31 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_31;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 EventError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(43);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(44);
+    i64 __res_32 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_32;
+    __MYS_TRACEBACK_EXIT();
+}
+void EventError::__throw()
+{
+    throw __EventError(mys::shared_ptr<EventError>(this));
+}
+void Event::set(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(45);
+    this->_is_set = mys::Bool(true);
+    __MYS_TRACEBACK_SET(46);
+    if (mys::Bool(!is(this->_waiter, nullptr))) {
+        __MYS_TRACEBACK_SET(47);
+        mys::fiber::lib::resume(this->_waiter);
+        __MYS_TRACEBACK_SET(48);
+        this->_waiter = nullptr;
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+void Event::clear(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(49);
+    this->_is_set = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+}
+void Event::wait(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(50);
+    if (this->_is_set) {
+        __MYS_TRACEBACK_SET(51);
+        __MYS_TRACEBACK_EXIT();
+        return;
+    }
+    __MYS_TRACEBACK_SET(52);
+    if (mys::Bool(!is(this->_waiter, nullptr))) {
+        __MYS_TRACEBACK_SET(53);
+        mys::make_shared<mys::fiber::lib::EventError>(__constant_33)->__throw();
+    }
+    __MYS_TRACEBACK_SET(54);
+    this->_waiter = mys::fiber::lib::current();
+    __MYS_TRACEBACK_SET(55);
+    try {
+        __MYS_TRACEBACK_SET(56);
+        mys::fiber::lib::suspend();
+    } catch (fiber::lib::__CancelledError __e_35) {
+        __MYS_TRACEBACK_RESTORE();
+        __MYS_TRACEBACK_SET(57);
+        this->_waiter = nullptr;
+        __MYS_TRACEBACK_SET(58);
+        throw;
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+Event::Event(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(59);
+    this->_is_set = mys::Bool(false);
+    __MYS_TRACEBACK_SET(60);
+    this->_waiter = nullptr;
+    __MYS_TRACEBACK_EXIT();
+}
+Event::~Event(void)
+{
+}
+mys::String Event::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(61);
+    mys::String __res_39 = (__constant_36 + __constant_37 + mys::String(this->_is_set) + __constant_38 + object_str(this->_waiter) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_39;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Event::__eq__(mys::shared_ptr<mys::fiber::lib::Event> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(62);
+    mys::Bool __res_40 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_40;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Event::__lt__(mys::shared_ptr<mys::fiber::lib::Event> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(63);
+    mys::Bool __res_41 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_41;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Event::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(64);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(65);
+    hash += std::hash<mys::Bool>{}(this->_is_set);
+    __MYS_TRACEBACK_SET(66);
+    i64 __res_42 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_42;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::optional<f64> Timer_Timer_interval_default()
+{
+    return nullptr;
+}
+Timer::Timer(mys::shared_ptr<mys::fiber::lib::TimerHandler> handler, f64 initial, mys::optional<f64> interval)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(67);
+    this->_handler = handler;
+    __MYS_TRACEBACK_SET(68);
+    this->_initial = u64((1000.0 * initial));
+    __MYS_TRACEBACK_SET(69);
+    if (mys::Bool(is(interval, nullptr))) {
+        __MYS_TRACEBACK_SET(70);
+        interval = static_cast<f64>(0.0);
+    }
+    __MYS_TRACEBACK_SET(71);
+    this->_interval = u64((1000.0 * interval));
+    __MYS_TRACEBACK_SET(72);
+    /* c-string start */
+    uv_timer_init(uv_default_loop(), &m_handle);
+    m_handle.data = this;
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+Timer::~Timer(void)
+{
+    this->stop();
+}
+void Timer::start(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(73);
+    /* c-string start */
+    uv_timer_start(&m_handle, timer_sleep_complete, _initial, _interval);
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+void Timer::stop(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(74);
+    /* c-string start */
+    uv_timer_stop(&m_handle);
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String Timer::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(75);
+    mys::String __res_47 = (__constant_43 + __constant_44 + object_str(this->_handler) + __constant_45 + mys::String(this->_initial, 'd') + __constant_46 + mys::String(this->_interval, 'd') + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_47;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Timer::__eq__(mys::shared_ptr<mys::fiber::lib::Timer> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(76);
+    mys::Bool __res_48 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_48;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Timer::__lt__(mys::shared_ptr<mys::fiber::lib::Timer> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(77);
+    mys::Bool __res_49 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_49;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Timer::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(78);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(79);
+    hash += std::hash<u64>{}(this->_initial);
+    __MYS_TRACEBACK_SET(80);
+    hash += std::hash<u64>{}(this->_interval);
+    __MYS_TRACEBACK_SET(81);
+    i64 __res_50 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_50;
+    __MYS_TRACEBACK_EXIT();
+}
+void _TimerHandler::on_timeout(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(82);
+    this->queue->put(this->message);
+    __MYS_TRACEBACK_EXIT();
+}
+_TimerHandler::_TimerHandler(mys::shared_ptr<mys::fiber::lib::MessageQueue> queue, mys::shared_ptr<mys::fiber::lib::Message> message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(83);
+    this->queue = queue;
+    __MYS_TRACEBACK_SET(84);
+    this->message = message;
+    __MYS_TRACEBACK_EXIT();
+}
+_TimerHandler::~_TimerHandler(void)
+{
+}
+mys::String _TimerHandler::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(85);
+    mys::String __res_54 = (__constant_51 + __constant_52 + object_str(this->queue) + __constant_53 + object_str(this->message) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_54;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool _TimerHandler::__eq__(mys::shared_ptr<mys::fiber::lib::_TimerHandler> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(86);
+    mys::Bool __res_55 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_55;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool _TimerHandler::__lt__(mys::shared_ptr<mys::fiber::lib::_TimerHandler> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(87);
+    mys::Bool __res_56 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_56;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 _TimerHandler::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(88);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(89);
+    i64 __res_57 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_57;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::optional<f64> MessageTimer_MessageTimer_interval_default()
+{
+    return nullptr;
+}
+MessageTimer::MessageTimer(mys::shared_ptr<mys::fiber::lib::MessageQueue> queue, mys::shared_ptr<mys::fiber::lib::Message> message, f64 initial, mys::optional<f64> interval)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(90);
+    this->_timer = mys::make_shared<mys::fiber::lib::Timer>(mys::make_shared<mys::fiber::lib::_TimerHandler>(queue, message), initial, interval);
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageTimer::start(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(91);
+    this->_timer->start();
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageTimer::stop(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(92);
+    this->_timer->stop();
+    __MYS_TRACEBACK_EXIT();
+}
+MessageTimer::~MessageTimer(void)
+{
+}
+mys::String MessageTimer::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(93);
+    mys::String __res_60 = (__constant_58 + __constant_59 + object_str(this->_timer) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_60;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MessageTimer::__eq__(mys::shared_ptr<mys::fiber::lib::MessageTimer> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(94);
+    mys::Bool __res_61 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_61;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MessageTimer::__lt__(mys::shared_ptr<mys::fiber::lib::MessageTimer> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(95);
+    mys::Bool __res_62 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_62;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MessageTimer::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(96);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(97);
+    i64 __res_63 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_63;
+    __MYS_TRACEBACK_EXIT();
+}
+MessageQueue::MessageQueue(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(98);
+    this->_reader = nullptr;
+    __MYS_TRACEBACK_SET(99);
+    this->_is_closed = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageQueue::open(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(100);
+    this->_is_closed = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageQueue::close(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(101);
+    this->_is_closed = mys::Bool(true);
+    __MYS_TRACEBACK_SET(102);
+    if (mys::Bool(!is(this->_reader, nullptr))) {
+        __MYS_TRACEBACK_SET(103);
+        mys::fiber::lib::resume(this->_reader);
+        __MYS_TRACEBACK_SET(104);
+        this->_reader = nullptr;
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MessageQueue::length(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(105);
+    i64 length = 0;
+    __MYS_TRACEBACK_SET(106);
+    /* c-string start */
+    length = m_values.length();
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(107);
+    i64 __res_64 = length;
+    __MYS_TRACEBACK_EXIT();
+    return __res_64;
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageQueue::put(mys::shared_ptr<mys::fiber::lib::Message> value)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(108);
+    if (this->_is_closed) {
+        __MYS_TRACEBACK_SET(109);
+        mys::make_shared<mys::fiber::lib::QueueError>(__constant_65)->__throw();
+    }
+    __MYS_TRACEBACK_SET(110);
+    /* c-string start */
+    m_values.push_back(value);
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(111);
+    if (mys::Bool(!is(this->_reader, nullptr))) {
+        __MYS_TRACEBACK_SET(112);
+        mys::fiber::lib::resume(this->_reader);
+        __MYS_TRACEBACK_SET(113);
+        this->_reader = nullptr;
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::fiber::lib::Message> MessageQueue::get(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(114);
+    if (mys::Bool(this->length() == 0)) {
+        __MYS_TRACEBACK_SET(115);
+        if (mys::Bool(!is(this->_reader, nullptr))) {
+            __MYS_TRACEBACK_SET(116);
+            mys::make_shared<mys::fiber::lib::QueueError>(__constant_66)->__throw();
+        }
+        __MYS_TRACEBACK_SET(117);
+        if (this->_is_closed) {
+            __MYS_TRACEBACK_SET(118);
+            mys::make_shared<mys::fiber::lib::QueueError>(__constant_67)->__throw();
+        }
+        __MYS_TRACEBACK_SET(119);
+        this->_reader = mys::fiber::lib::current();
+        __MYS_TRACEBACK_SET(120);
+        try {
+            __MYS_TRACEBACK_SET(121);
+            mys::fiber::lib::suspend();
+        } catch (fiber::lib::__CancelledError __e_69) {
+            __MYS_TRACEBACK_RESTORE();
+            __MYS_TRACEBACK_SET(122);
+            this->_reader = nullptr;
+            __MYS_TRACEBACK_SET(123);
+            throw;
+        }
+        __MYS_TRACEBACK_SET(124);
+        if (mys::Bool(this->length() == 0)) {
+            __MYS_TRACEBACK_SET(125);
+            mys::make_shared<mys::fiber::lib::QueueError>(__constant_67)->__throw();
+        }
+    }
+    __MYS_TRACEBACK_SET(126);
+    mys::shared_ptr<mys::fiber::lib::Message> value = nullptr;
+    __MYS_TRACEBACK_SET(127);
+    /* c-string start */
+    value = m_values.pop_front();
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(128);
+    mys::shared_ptr<mys::fiber::lib::Message> __res_70 = value;
+    __MYS_TRACEBACK_EXIT();
+    return __res_70;
+    __MYS_TRACEBACK_EXIT();
+}
+MessageQueue::~MessageQueue(void)
+{
+}
+mys::String MessageQueue::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(129);
+    mys::String __res_74 = (__constant_71 + __constant_72 + object_str(this->_reader) + __constant_73 + mys::String(this->_is_closed) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_74;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MessageQueue::__eq__(mys::shared_ptr<mys::fiber::lib::MessageQueue> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(130);
+    mys::Bool __res_75 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_75;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MessageQueue::__lt__(mys::shared_ptr<mys::fiber::lib::MessageQueue> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(131);
+    mys::Bool __res_76 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_76;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MessageQueue::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(132);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(133);
+    hash += std::hash<mys::Bool>{}(this->_is_closed);
+    __MYS_TRACEBACK_SET(134);
+    i64 __res_77 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_77;
+    __MYS_TRACEBACK_EXIT();
+}
+Bus::Bus(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(135);
+    this->_subscribers = mys::make_shared<Dict<i64, mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>>>>(std::initializer_list<std::pair<i64, mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>>>>{});
+    __MYS_TRACEBACK_SET(136);
+    this->_lock = mys::make_shared<mys::fiber::lib::Lock>();
+    __MYS_TRACEBACK_EXIT();
+}
+void Bus::broadcast(i64 message_id, mys::shared_ptr<mys::fiber::lib::Message> message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(137);
+    this->_lock->acquire();
+    __MYS_TRACEBACK_SET(138);
+    mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>> __queues_81;
+    try {
+        __MYS_TRACEBACK_SET(139);
+        mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>> queues = this->_subscribers->get(message_id, nullptr);
+        __MYS_TRACEBACK_SET(140);
+        if (mys::Bool(!is(queues, nullptr))) {
+            __MYS_TRACEBACK_SET(141);
+            auto __items_78 = queues;
+            for (auto __i_79 = 0; __i_79 < __items_78->length(); __i_79++) {
+                auto queue = __items_78->get(__i_79);
+                queue->put(message);
+            }
+        }
+            __queues_81 = queues;
+    } catch (...) {
+        __MYS_TRACEBACK_RESTORE();
+        __MYS_TRACEBACK_SET(142);
+        this->_lock->release();
+        throw;
+    }
+    __MYS_TRACEBACK_SET(142);
+    this->_lock->release();
+    auto queues = __queues_81;
+    __MYS_TRACEBACK_EXIT();
+}
+void Bus::subscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(143);
+    this->_lock->acquire();
+    __MYS_TRACEBACK_SET(144);
+    try {
+        __MYS_TRACEBACK_SET(145);
+        if (mys::Bool(!contains(message_id, this->_subscribers))) {
+            __MYS_TRACEBACK_SET(146);
+            this->_subscribers->__setitem__(message_id, mys::make_shared<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>>(std::initializer_list<mys::shared_ptr<mys::fiber::lib::MessageQueue>>{}));
+        }
+        __MYS_TRACEBACK_SET(147);
+        (this->_subscribers)->get(message_id)->append(queue);
+    } catch (...) {
+        __MYS_TRACEBACK_RESTORE();
+        __MYS_TRACEBACK_SET(148);
+        this->_lock->release();
+        throw;
+    }
+    __MYS_TRACEBACK_SET(148);
+    this->_lock->release();
+    __MYS_TRACEBACK_EXIT();
+}
+void Bus::unsubscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(149);
+    mys::make_shared<NotImplementedError>(__constant_83)->__throw();
+    __MYS_TRACEBACK_EXIT();
+}
+Bus::~Bus(void)
+{
+}
+mys::String Bus::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(150);
+    mys::String __res_87 = (__constant_84 + __constant_85 + object_str(this->_subscribers) + __constant_86 + object_str(this->_lock) + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_87;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Bus::__eq__(mys::shared_ptr<mys::fiber::lib::Bus> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(151);
+    mys::Bool __res_88 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_88;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Bus::__lt__(mys::shared_ptr<mys::fiber::lib::Bus> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(152);
+    mys::Bool __res_89 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_89;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Bus::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(153);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(154);
+    i64 __res_90 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_90;
+    __MYS_TRACEBACK_EXIT();
+}
+void suspend(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(155);
+    mys::Bool cancelled = mys::Bool(false);
+    __MYS_TRACEBACK_SET(156);
+    /* c-string start */
+    cancelled = mys::suspend();
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(157);
+    if (cancelled) {
+        __MYS_TRACEBACK_SET(158);
+        mys::make_shared<mys::fiber::lib::CancelledError>()->__throw();
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+void resume(mys::shared_ptr<Fiber> fiber)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(159);
+    /* c-string start */
+    mys::resume(fiber);
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+void sleep(f64 seconds)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(160);
+    mys::Bool cancelled = mys::Bool(false);
+    __MYS_TRACEBACK_SET(161);
+    /* c-string start */
+    cancelled = mys::sleep(seconds);
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(162);
+    if (cancelled) {
+        __MYS_TRACEBACK_SET(163);
+        mys::make_shared<mys::fiber::lib::CancelledError>()->__throw();
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<Fiber> current(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(164);
+    mys::shared_ptr<Fiber> fiber = nullptr;
+    __MYS_TRACEBACK_SET(165);
+    /* c-string start */
+    fiber = mys::current();
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(166);
+    mys::shared_ptr<Fiber> __res_91 = fiber;
+    __MYS_TRACEBACK_EXIT();
+    return __res_91;
+    __MYS_TRACEBACK_EXIT();
+}
+void broadcast(i64 message_id, mys::shared_ptr<mys::fiber::lib::Message> message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(167);
+    mys::fiber::lib::_BUS->broadcast(message_id, message);
+    __MYS_TRACEBACK_EXIT();
+}
+void subscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(168);
+    mys::fiber::lib::_BUS->subscribe(message_id, queue);
+    __MYS_TRACEBACK_EXIT();
+}
+void unsubscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(169);
+    mys::fiber::lib::_BUS->unsubscribe(message_id, queue);
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+;
+    _BUS = mys::make_shared<mys::fiber::lib::Bus>();
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: /root/package/mys/lib/packages/fiber/src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
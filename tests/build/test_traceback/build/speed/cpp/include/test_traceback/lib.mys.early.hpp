@@ -0,0 +1,19 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_traceback_lib_EARLY_HPP
+#define mys_test_traceback_lib_EARLY_HPP
+namespace mys::test_traceback::lib
+{
+class MyError;
+class MyFiber;
+class Desctuctor;
+}
+#include "fiber/lib.mys.early.hpp"
+namespace mys::test_traceback::lib
+{
+void panic_2(void);
+void panic_in_except(void);
+i64 modulo(i64 a, i64 b);
+i64 divide(i64 a, i64 b);
+mys::String function_that_raises(void);
+}
+#endif
\ No newline at end of file
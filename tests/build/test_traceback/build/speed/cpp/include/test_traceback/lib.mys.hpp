@@ -0,0 +1,49 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_traceback_lib_HPP
+#define mys_test_traceback_lib_HPP
+#include "test_traceback/lib.mys.early.hpp"
+#include "fiber/lib.mys.hpp"
+namespace mys::test_traceback::lib
+{
+class MyError : public Error {
+public:
+    i64 x;
+    i64 y;
+    MyError(i64 x, i64 y);
+    virtual ~MyError(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::test_traceback::lib::MyError> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::test_traceback::lib::MyError> other);
+    i64 __hash__(void);
+    [[ noreturn ]] void __throw();
+};
+class __MyError final : public __Error {
+public:
+    __MyError(const mys::shared_ptr<MyError>& error) : __Error(error)
+    {
+    }
+};
+class MyFiber : public Fiber {
+public:
+    void run(void);
+    MyFiber(void);
+    virtual ~MyFiber(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::test_traceback::lib::MyFiber> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::test_traceback::lib::MyFiber> other);
+    i64 __hash__(void);
+    void start(void);
+    void join(void);
+    void cancel(void);
+};
+class Desctuctor : public mys::Object {
+public:
+    Desctuctor(void);
+    virtual ~Desctuctor(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::test_traceback::lib::Desctuctor> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::test_traceback::lib::Desctuctor> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_traceback_main_EARLY_HPP
+#define mys_test_traceback_main_EARLY_HPP
+namespace mys::test_traceback::main
+{
+class AnError;
+}
+namespace mys::test_traceback::main
+{
+}
+#endif
\ No newline at end of file
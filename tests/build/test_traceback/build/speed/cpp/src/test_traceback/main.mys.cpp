@@ -0,0 +1,134 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "test_traceback/main.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::test_traceback::lib {
+extern void __module_init();
+}
+namespace mys::test_traceback::main {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::test_traceback::lib::__module_init();
+    mys::test_traceback::main::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::test_traceback::lib {
+extern void __module_exit();
+}
+namespace mys::test_traceback::main {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::test_traceback::lib::__module_exit();
+    mys::test_traceback::main::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::test_traceback::main
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 1, "class AnError(Error):" },
+    { "__str__", 1, "class AnError(Error):" },
+    { "__str__", 1, "class AnError(Error):" },
+    { "__eq__", 1, "class AnError(Error):" },
+    { "__lt__", 1, "class AnError(Error):" },
+    { "__hash__", 1, "class AnError(Error):" },
+    { "__hash__", 1, "class AnError(Error):" },
+    { "main", 5, "raise AnError(\"hi\")" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/main.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("\"");
+static const mys::String __constant_2 = mys::String("AnError(");
+static const mys::String __constant_3 = mys::String("message=");
+static const mys::String __constant_4 = mys::String(")");
+static const mys::String __constant_9 = mys::String("hi");
+AnError::AnError(mys::String message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    this->message = message;
+    __MYS_TRACEBACK_EXIT();
+}
+AnError::~AnError(void)
+{
+}
+mys::String AnError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    mys::String message = mys::StringBuilder(mys::make_shared<mys::String>("")).append(__constant_1).append(string_str(this->message)).append(__constant_1).to_string();
+    __MYS_TRACEBACK_SET(2);
+    mys::String __res_5 = mys::StringBuilder(mys::make_shared<mys::String>("")).append(__constant_2).append(__constant_3).append(string_str(message)).append(__constant_4).to_string();
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool AnError::__eq__(mys::shared_ptr<mys::test_traceback::main::AnError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_6 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool AnError::__lt__(mys::shared_ptr<mys::test_traceback::main::AnError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    mys::Bool __res_7 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_7;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 AnError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(5);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(6);
+    i64 __res_8 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+void AnError::__throw()
+{
+    throw __AnError(mys::shared_ptr<AnError>(this));
+}
+void main(int __argc, char * const __argv[])
+{
+    (void)__argc;
+    (void)__argv;
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    mys::make_shared<mys::test_traceback::main::AnError>(__constant_9)->__throw();
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/main.mys" << "\n";
+#endif
+}
+}
+void package_main(int argc, char * const argv[])
+{
+    mys::test_traceback::main::main(argc, argv);
+}
\ No newline at end of file